@@ -27,6 +27,19 @@
 2. Update email credentials in `main.py` (search for EMAIL_CONFIG)
 3. Test: `python main.py`
 4. Run daily search: `python main.py daily`
+5. Run daily search on a worker pool: `python mainV2.py daily --concurrent` (rate limits from `SAFETY_CONFIG` still apply)
+6. Only report jobs not seen in earlier runs: `python mainV2.py daily --incremental`
+7. Stream results to CSV while scraping (a killed run keeps a `*_partial.csv`): `python mainV2.py daily --streaming`
+8. Spend a request budget on the most productive searches: `python mainV2.py daily --scheduled` (set `request_budget` / `search_deadline_seconds` in `SCRAPER_CONFIG`)
+9. Benchmark parsing, dedup, filtering and output offline: `python benchmarks/run_benchmarks.py` (JSON results in `benchmarks/results/`, `--compare old.json` flags regressions; `remove_similar_jobs` stops at 20k jobs unless `--sizes` is given)
+10. Per-run metrics (requests, status codes, bytes, parse time, page failures, pagination stops, dedup hits, filter drops, stage timings) go to `output/metrics/` as JSON and a Prometheus textfile; add `--verbose` to see per-page and per-job log lines
+11. End-to-end runs against a local stand-in for LinkedIn: `python mock_linkedin_server.py` then `python mainV2.py daily --concurrent --base-url http://127.0.0.1:8765`, or `python benchmarks/e2e_daily_run.py --rate-429 0.1 --rate-5xx 0.05` for jobs/min and error recovery
+12. Several people, one fetch pass: add each person to `PROFILES` in `config.py` (their own `search` and `email` overrides) and run `python mainV2.py daily --profiles`; shared searches are fetched once, then each profile gets its own filters, reports, email and seen-jobs history
+13. Sharding a run across processes or hosts: `python mainV2.py daily --queued` queues every search page in `output/work_queue.sqlite3` and starts `queue_local_workers` workers; more can join with `python mainV2.py worker`. Pages are leased, so a crashed worker's pages go back to the pool; `--run-id ID` resumes a crashed run without refetching finished pages
+14. Parsing on every core: set `parse_processes` in `SCRAPER_CONFIG` (`None` for all cores) so concurrent and scheduled runs hand raw pages to a process pool and keep fetching while they are parsed; compare with `python benchmarks/e2e_daily_run.py --parse-processes 4`
+15. History across runs: set `job_history` to `True` and every run appends its reported jobs to `output/history/jobs-YYYY-MM-DD.jsonl.gz` (fixed schema, one gzip member per run, plus a per-day index by job key and posted date); `from job_history import load_history; jobs = load_history(days=30)` reads a month back in one pass
+16. Email digests: list several people under `recipients` in `EMAIL_CONFIG` (each with an optional `top_n` and title `keywords`); digests are sent in the background over one SMTP session with retries, and the run waits for them only at the very end (`email_wait_seconds`). Set `smtp_host`, `smtp_port` and `smtp_ssl: False` to try it against a local SMTP server
+17. Earlier digests: with `--streaming`, the email's top jobs are kept up to date as jobs pass the filters; set `early_digest_seconds` (a deadline) or `early_digest_min_score` (once the 30 best jobs all score at least this) in `SCRAPER_CONFIG` to send the digest before every search has finished
 
 ## 📁 Project Structure
 
@@ -0,0 +1,153 @@
+import numpy as np
+
+from job_dates import MICROSECONDS_PER_SECOND, UNKNOWN_AGE_HOURS, PostingWindow, get_posted_at
+from job_record import lowered
+
+# Sort key filter_jobs uses for jobs without a numeric hours_since_posted
+MISSING_HOURS = UNKNOWN_AGE_HOURS
+
+# date_state values
+DATE_OK = 0
+DATE_MISSING = 1   # "N/A" - no freshness fields are set
+DATE_INVALID = 2   # unparseable - freshness 1, hours "Unknown"
+
+
+class JobTable:
+    """Columnar, NumPy-backed view of a run's jobs
+
+    Text columns hold the records' pre-lowercased fields; posting times come
+    from posted_at and are stored as integer microseconds on the naive clock
+    filter_jobs uses, so age arithmetic is exact and vectorized.
+    """
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+        titles = [lowered(job, 'title') for job in jobs]
+        companies = [lowered(job, 'company') for job in jobs]
+
+        self.company = np.array(companies, dtype=str)
+        self.text = np.array([f"{t} {c}" for t, c in zip(titles, companies)], dtype=str)
+        self.location = np.array([lowered(job, 'location') for job in jobs], dtype=str)
+
+        posted = np.zeros(len(jobs), dtype=np.int64)
+        date_state = np.full(len(jobs), DATE_OK, dtype=np.int8)
+        for i, job in enumerate(jobs):
+            posted_at = get_posted_at(job)
+            if posted_at is not None:
+                posted[i] = posted_at * MICROSECONDS_PER_SECOND
+            elif job['date_posted'] == "N/A":
+                date_state[i] = DATE_MISSING
+            else:
+                date_state[i] = DATE_INVALID
+
+        self.posted_us = posted
+        self.date_state = date_state
+
+    def __len__(self):
+        return len(self.jobs)
+
+    @staticmethod
+    def contains_any(column, keywords):
+        """Boolean mask: row contains at least one keyword"""
+        mask = np.zeros(len(column), dtype=bool)
+        for keyword in keywords:
+            mask |= np.char.find(column, keyword.lower()) >= 0
+        return mask
+
+    @staticmethod
+    def count_hits(column, keywords):
+        """Per-row number of keywords found (each list entry counted once)"""
+        counts = np.zeros(len(column), dtype=np.int64)
+        for keyword in keywords:
+            counts += np.char.find(column, keyword.lower()) >= 0
+        return counts
+
+
+def filter_jobs_batch(jobs, config, current_time=None):
+    """
+    Vectorized equivalent of filter_jobs for large job sets.
+
+    Produces the same kept jobs, field values and ranking as filter_jobs
+    (including its stable tie order), without the per-job log lines.
+    """
+    if not jobs:
+        print("Filtered to 0 senior-level product management jobs")
+        return []
+
+    table = JobTable(jobs)
+    n = len(table)
+
+    keep = ~table.contains_any(table.company, config.get('companies_to_exclude', []))
+
+    if config.get('exclude_junior_keywords'):
+        keep &= ~table.contains_any(table.text, config['exclude_junior_keywords'])
+
+    seniority = table.count_hits(table.text, config.get('seniority_keywords') or [])
+    keep &= seniority >= 1
+
+    # Location preference scoring (India first), same order as filter_jobs
+    location = table.location
+    location_score = np.select(
+        [
+            np.char.find(location, 'india') >= 0,
+            (np.char.find(location, 'mumbai') >= 0) |
+            (np.char.find(location, 'bangalore') >= 0) |
+            (np.char.find(location, 'delhi') >= 0),
+            np.char.find(location, 'remote') >= 0
+        ],
+        [10, 15, 5],
+        default=0
+    )
+
+    freshness = np.ones(n, dtype=np.int64)
+    hours_old = np.full(n, np.nan)
+    has_freshness = np.zeros(n, dtype=bool)
+
+    time_config = config.get('time_filters')
+    if time_config:
+        window = PostingWindow.from_config(time_config, current_time)
+        dated = table.date_state == DATE_OK
+        # Same two divisions as PostingWindow.hours_old
+        hours_old = ((window.now_us - table.posted_us) / MICROSECONDS_PER_SECOND) / 3600
+
+        keep &= ~(dated & (table.posted_us < window.oldest_us))
+
+        freshness = np.where(table.posted_us >= window.preferred_us, 10,
+                             np.where(table.posted_us >= window.day_us, 5, 1))
+        freshness = np.where(dated, freshness, 1)
+        has_freshness = table.date_state != DATE_MISSING
+
+    # filter_jobs records freshness before the required-keyword check
+    freshness_written = keep & has_freshness
+
+    if config.get('required_keywords'):
+        keep &= table.contains_any(table.text, config['required_keywords'])
+
+    total_score = seniority * 3 + location_score + freshness
+
+    for i in np.flatnonzero(freshness_written):
+        job = jobs[i]
+        job['freshness_score'] = int(freshness[i])
+        if table.date_state[i] == DATE_OK:
+            job['hours_since_posted'] = round(float(hours_old[i]), 1)
+        else:
+            job['hours_since_posted'] = "Unknown"
+
+    kept = np.flatnonzero(keep)
+    sort_hours = np.full(len(kept), float(MISSING_HOURS))
+    for position, i in enumerate(kept):
+        job = jobs[i]
+        job['seniority_score'] = int(seniority[i])
+        job['location_score'] = int(location_score[i])
+        job['relevance_score'] = int(seniority[i])  # For backward compatibility
+        job['total_score'] = int(total_score[i])
+        hours = job.get('hours_since_posted', MISSING_HOURS)
+        if isinstance(hours, (int, float)):
+            sort_hours[position] = hours
+
+    # Highest score first, then newest; lexsort is stable like list.sort
+    order = np.lexsort((sort_hours, -total_score[kept]))
+    filtered_jobs = [jobs[i] for i in kept[order]]
+
+    print(f"Filtered to {len(filtered_jobs)} senior-level product management jobs")
+    return filtered_jobs
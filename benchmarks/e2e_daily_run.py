@@ -0,0 +1,113 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCHMARK_DIR)
+sys.path.insert(0, REPO_DIR)
+
+import mainV2
+from config import OUTPUT_CONFIG, SAFETY_CONFIG, SCRAPER_CONFIG
+from metrics import METRICS
+from mock_linkedin_server import MockLinkedInServer
+from run_benchmarks import git_revision, quiet
+
+def isolate_outputs(directory):
+    """Point every file the daily run writes into directory, with no cache warm from earlier runs"""
+    OUTPUT_CONFIG.update(csv_folder=os.path.join(directory, "csv", ""), html_folder=os.path.join(directory, "html", ""))
+    SCRAPER_CONFIG.update(
+        response_cache=False,
+        seen_jobs_db=os.path.join(directory, "seen_jobs.sqlite3"),
+        jd_cache_path=os.path.join(directory, "job_descriptions.sqlite3"),
+        query_stats_path=os.path.join(directory, "query_stats.json"),
+        query_yield_path=os.path.join(directory, "query_yield.json"),
+        metrics_json_path=os.path.join(directory, "metrics.json"),
+        metrics_textfile_path=None
+    )
+
+def counter_values(summary, name):
+    return {"|".join(entry["labels"].values()) or "total": entry["value"]
+            for entry in summary["counters"].get(name, [])}
+
+def main():
+    parser = argparse.ArgumentParser(description="Daily pipeline end to end against mock_linkedin_server.py")
+    parser.add_argument("--mode", choices=["concurrent", "streaming", "scheduled"], default="concurrent",
+                        help="search path to run (the serial path sleeps 12-20s per search by design)")
+    parser.add_argument("--workers", type=int, default=SCRAPER_CONFIG.get("max_workers", 4))
+    parser.add_argument("--parse-processes", type=int, default=SCRAPER_CONFIG.get("parse_processes", 0),
+                        help="parse pages in this many processes while fetching (0: in the fetch thread)")
+    parser.add_argument("--rpm", type=float, default=0, help="rate limit in requests per minute (0: none)")
+    parser.add_argument("--backoff", type=float, default=0.1, help="base retry backoff in seconds")
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--latency-jitter-ms", type=float, default=50)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-5xx", type=float, default=0.0)
+    parser.add_argument("--malformed-hrefs", type=float, default=0.0)
+    parser.add_argument("--results-per-search", type=int, default=75)
+    parser.add_argument("--output", default=os.path.join(BENCHMARK_DIR, "results", "e2e_latest.json"))
+    args = parser.parse_args()
+
+    SAFETY_CONFIG.update(max_requests_per_minute=args.rpm, min_delay_between_searches=0,
+                         retry_backoff_seconds=args.backoff, max_retry_wait=max(args.backoff * 10, 1))
+    SCRAPER_CONFIG.update(max_workers=args.workers, parse_processes=args.parse_processes)
+
+    server = MockLinkedInServer(
+        results_per_search=args.results_per_search, latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms, rate_429=args.rate_429, rate_5xx=args.rate_5xx,
+        malformed_href_rate=args.malformed_hrefs, retry_after=0
+    )
+
+    with tempfile.TemporaryDirectory(prefix="jobs_e2e_") as directory, server:
+        isolate_outputs(directory)
+        print(f"Running the daily pipeline ({args.mode}) against {server.base_url}...")
+
+        start = time.perf_counter()
+        with quiet():
+            mainV2.automated_daily_run(
+                concurrent=True,
+                streaming=args.mode == "streaming",
+                scheduled=args.mode == "scheduled",
+                base_url=server.base_url
+            )
+        elapsed = time.perf_counter() - start
+        summary = METRICS.summary()
+
+    jobs = counter_values(summary, "jobs_total")
+    statuses = counter_values(summary, "http_requests_total")
+    requests_made = sum(statuses.values())
+    failed = requests_made - statuses.get("200", 0)
+
+    result = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "options": vars(args)
+        },
+        "seconds": round(elapsed, 3),
+        "jobs": jobs,
+        "jobs_per_minute": round(jobs.get("scraped", 0) / elapsed * 60, 1) if elapsed else None,
+        "requests": requests_made,
+        "requests_by_status": statuses,
+        "retries": sum(counter_values(summary, "http_retries_total").values()),
+        "failed_responses": failed,
+        "server": server.stats
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+
+    print(f"{jobs.get('scraped', 0)} jobs scraped, {jobs.get('kept', 0)} kept in {elapsed:.1f}s "
+          f"({result['jobs_per_minute']} jobs/min); {requests_made} requests, {failed} failed, "
+          f"{result['retries']} retries")
+    print(f"Results saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
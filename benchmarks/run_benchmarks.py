@@ -0,0 +1,205 @@
+import argparse
+import contextlib
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCHMARK_DIR)
+sys.path.insert(0, REPO_DIR)
+
+import card_parser
+import mainV2
+from card_parser import PARSER_BACKENDS
+from config import SCRAPER_CONFIG, SEARCH_CONFIG
+from job_dates import parse_posted_at
+from synthetic_jobs import make_jobs
+
+FIXTURE_DIR = os.path.join(BENCHMARK_DIR, "fixtures")
+DEFAULT_SIZES = [1000, 10000, 100000]
+# Largest default size per benchmark, for those too slow to repeat at every size (--sizes overrides)
+DEFAULT_MAX_SIZE = {"remove_similar_jobs": 20000}
+
+# Filled in by main(): synthetic jobs per size, and where output files go
+SYNTHETIC = {}
+OUTPUT_DIR = None
+
+def load_fixture_pages():
+    """Checked-in seeMoreJobPostings responses, as the raw bytes the parsers get"""
+    pages = []
+    for name in sorted(os.listdir(FIXTURE_DIR)):
+        if name.endswith(".html"):
+            with open(os.path.join(FIXTURE_DIR, name), "rb") as f:
+                pages.append(f.read())
+    return pages
+
+def pages_for(count, pages, cards_per_cycle):
+    """Enough fixture pages (cycled) to hold about count job cards"""
+    cycles = -(-count // cards_per_cycle)
+    return pages * cycles
+
+def parse_benchmark(backend, pages):
+    parse = PARSER_BACKENDS[backend]
+    cards_per_cycle = sum(len(parse(content, "", "India")) for content in pages)
+
+    def setup(count):
+        # Date parsing is memoized, start each repeat cold like a new run
+        parse_posted_at.cache_clear()
+        return (pages_for(count, pages, cards_per_cycle),)
+
+    def run(page_list):
+        for content in page_list:
+            parse(content, "Product Manager", "India")
+
+    return setup, run
+
+def jobs_benchmark(run):
+    """A benchmark over synthetic jobs; each repeat gets fresh copies"""
+    def setup(count):
+        mainV2._job_categories.clear()
+        return ([job.copy() for job in SYNTHETIC[count]],)
+    return setup, run
+
+def filtered_jobs_benchmark(run):
+    """A benchmark over the jobs filter_jobs keeps (what the reports get in a run)"""
+    def setup(count):
+        mainV2._job_categories.clear()
+        with quiet():
+            return (mainV2.filter_jobs([job.copy() for job in SYNTHETIC[count]], SEARCH_CONFIG),)
+    return setup, run
+
+def write_csv(jobs):
+    mainV2.save_to_csv(jobs, os.path.join(OUTPUT_DIR, "jobs.csv"))
+
+def write_html_report(jobs):
+    mainV2.create_html_report(jobs, os.path.join(OUTPUT_DIR, "jobs.html"))
+
+def build_benchmarks(pages):
+    benchmarks = {
+        # Both card parsers over the fixture pages, repeated up to the job count
+        "parse_cards_lxml": parse_benchmark("lxml", pages),
+        "parse_cards_bs4": parse_benchmark("bs4", pages),
+        "remove_duplicates": jobs_benchmark(mainV2.remove_duplicates),
+        "remove_similar_jobs": jobs_benchmark(
+            lambda jobs: mainV2.remove_similar_jobs(jobs, SCRAPER_CONFIG.get("similarity_threshold", 0.90))
+        ),
+        "filter_jobs": jobs_benchmark(lambda jobs: mainV2.filter_jobs(jobs, SEARCH_CONFIG)),
+        "categorize_jobs": filtered_jobs_benchmark(mainV2.categorize_jobs),
+        "save_to_csv": filtered_jobs_benchmark(write_csv),
+        "create_html_report": filtered_jobs_benchmark(write_html_report)
+    }
+    if card_parser.lxml is None:
+        del benchmarks["parse_cards_lxml"]
+    return benchmarks
+
+@contextlib.contextmanager
+def quiet():
+    """Drop the pipeline's progress prints, which would otherwise dominate small timings"""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+def time_benchmark(setup, run, count, repeat):
+    """Best and mean wall time of run over repeat fresh setups"""
+    timings = []
+    for _ in range(repeat):
+        args = setup(count)
+        gc.collect()
+        with quiet():
+            start = time.perf_counter()
+            run(*args)
+            timings.append(time.perf_counter() - start)
+    return min(timings), sum(timings) / len(timings)
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare_results(results, baseline_path, tolerance):
+    """Print benchmarks slower than in baseline_path by more than tolerance, returns how many"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["benchmark"], r["jobs"]): r for r in json.load(f)["results"]}
+
+    regressions = 0
+    for result in results:
+        previous = baseline.get((result["benchmark"], result["jobs"]))
+        if not previous or not previous["best_seconds"]:
+            continue
+        ratio = result["best_seconds"] / previous["best_seconds"]
+        if ratio > 1 + tolerance:
+            regressions += 1
+            print(f"⚠️ {result['benchmark']} @ {result['jobs']}: {previous['best_seconds']:.4f}s -> "
+                  f"{result['best_seconds']:.4f}s ({ratio:.2f}x)")
+
+    print(f"{regressions} regressions against {baseline_path} (tolerance {tolerance:.0%})")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmarks for parsing, dedup, filtering and output")
+    parser.add_argument("--sizes", type=int, nargs="+", help=f"job counts to time (default: {DEFAULT_SIZES})")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark, the best one is reported")
+    parser.add_argument("--only", nargs="+", help="benchmark names to run (default: all)")
+    parser.add_argument("--output", default=os.path.join(BENCHMARK_DIR, "results", "latest.json"))
+    parser.add_argument("--compare", help="earlier results file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="slowdown allowed by --compare")
+    args = parser.parse_args()
+
+    benchmarks = build_benchmarks(load_fixture_pages())
+    names = args.only or list(benchmarks)
+    max_size = {} if args.sizes else DEFAULT_MAX_SIZE
+    args.sizes = args.sizes or DEFAULT_SIZES
+
+    print(f"Generating synthetic jobs for sizes {args.sizes}...")
+    for count in args.sizes:
+        SYNTHETIC[count] = make_jobs(count, seed=count)
+
+    global OUTPUT_DIR
+    results = []
+    with tempfile.TemporaryDirectory(prefix="jobs_benchmark_") as OUTPUT_DIR:
+        for count in args.sizes:
+            for name in names:
+                if count > max_size.get(name, count):
+                    continue
+                setup, run = benchmarks[name]
+                best, mean = time_benchmark(setup, run, count, args.repeat)
+                results.append({
+                    "benchmark": name,
+                    "jobs": count,
+                    "best_seconds": round(best, 6),
+                    "mean_seconds": round(mean, 6),
+                    "jobs_per_second": round(count / best) if best else None,
+                    "repeat": args.repeat
+                })
+                print(f"{name:<22} {count:>7} jobs  best {best:8.4f}s  mean {mean:8.4f}s  "
+                      f"{count / best if best else 0:>10,.0f} jobs/s")
+
+    report = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "parser_backends": sorted(PARSER_BACKENDS)
+        },
+        "results": results
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results saved to {args.output}")
+
+    if args.compare:
+        return 1 if compare_results(results, args.compare, args.tolerance) else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+import random
+from datetime import datetime, timedelta
+
+from job_dates import parse_posted_at
+from job_record import Job
+
+TITLES = [
+    "Principal Product Manager", "Director of Product", "VP Product", "Head of Product",
+    "Chief Product Officer", "Lead Product Manager", "Staff Product Manager", "Group Product Manager",
+    "Senior Director Product", "Senior Product Manager", "Product Manager", "Associate Product Manager",
+    "Junior Product Analyst", "Product Owner"
+]
+
+TITLE_QUALIFIERS = ["", "- Payments", "- Growth", "(Platform)", "- AI", "- B2B SaaS", "- Fintech", "- Consumer"]
+
+COMPANIES = [
+    "Google", "Microsoft", "Flipkart", "Swiggy", "Zomato", "Razorpay", "PhonePe", "Paytm", "Amazon",
+    "Meesho", "CRED", "Atlassian", "Uber", "Freshworks", "Zoho Corporation", "Infosys Limited"
+]
+
+LOCATIONS = [
+    "Bengaluru, Karnataka, India", "Mumbai, Maharashtra, India", "India", "Remote",
+    "Hyderabad, Telangana, India", "New Delhi, Delhi, India", "Gurugram, Haryana, India"
+]
+
+NAME_PARTS = ["nova", "quant", "astra", "pixel", "kite", "lumen", "orbit", "terra", "vista", "apex", "nimbus", "tidal"]
+NAME_SUFFIXES = ["Technologies", "Labs", "Solutions", "Systems", "Analytics", "Software", "Pvt Ltd"]
+
+def make_jobs(count, seed=0, now=None, duplicate_share=0.1, similar_share=0.05):
+    """
+    Job records shaped like the card parsers' output, reproducible by seed.
+
+    Posting dates spread over the last two days (plus some missing and
+    unparseable ones) so the time filters keep a realistic share. About
+    duplicate_share of the jobs repeat an earlier job ID and similar_share
+    repost an earlier job with a reworded title, so both dedup passes
+    have work to do.
+    """
+    rng = random.Random(seed)
+    now = now or datetime.now()
+    scraped_at = now.strftime('%Y-%m-%d %H:%M:%S')
+
+    companies = COMPANIES + [
+        f"{rng.choice(NAME_PARTS).title()}{rng.choice(NAME_PARTS)} {rng.choice(NAME_SUFFIXES)}"
+        for _ in range(max(count // 20, 1))
+    ]
+
+    jobs = []
+    for i in range(count):
+        roll = rng.random()
+        if jobs and roll < duplicate_share:
+            # Same posting found again by another search
+            job = rng.choice(jobs).copy()
+            job['search_keywords'] = rng.choice(TITLES)
+            jobs.append(job)
+            continue
+
+        if jobs and roll < duplicate_share + similar_share:
+            # Reposted under a new ID with a slightly different title
+            original = rng.choice(jobs)
+            title = f"Sr. {original['title']}" if rng.random() < 0.5 else f"{original['title']} II"
+            company, location = original['company'], original['location']
+        else:
+            title = f"{rng.choice(['', 'Senior '])}{rng.choice(TITLES)} {rng.choice(TITLE_QUALIFIERS)}".strip()
+            company, location = rng.choice(companies), rng.choice(LOCATIONS)
+
+        date_roll = rng.random()
+        if date_roll < 0.05:
+            date_posted = "N/A"
+        elif date_roll < 0.07:
+            date_posted = "recently"
+        else:
+            posted = now - timedelta(minutes=rng.randint(0, 48 * 60))
+            date_posted = posted.strftime('%Y-%m-%dT%H:%M:%S')
+
+        slug = title.lower().replace(" ", "-")
+        jobs.append(Job({
+            "title": title,
+            "company": company,
+            "location": location,
+            "link": f"https://www.linkedin.com/jobs/view/{slug}-{3900000000 + i}",
+            "date_posted": date_posted,
+            "posted_at": parse_posted_at(date_posted),
+            "search_keywords": rng.choice(TITLES),
+            "easy_apply": rng.random() < 0.3,
+            "scraped_at": scraped_at
+        }))
+
+    return jobs
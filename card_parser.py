@@ -0,0 +1,265 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from bs4 import BeautifulSoup, UnicodeDammit
+
+from job_dates import parse_posted_at
+from job_record import Job
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:  # lxml is optional, BeautifulSoup's html.parser still works
+    lxml = None
+
+# Tracking attribute LinkedIn puts on the main link of every search card
+CARD_LINK_TRACKING = "public_jobs_jserp-result_search-card"
+
+DEFAULT_BACKEND = "lxml"
+
+def clean_job_link(raw_href):
+    """Turn a card href (absolute, relative or malformed) into a job URL"""
+    # Fix malformed URLs
+    if raw_href.startswith("https://"):
+        # URL is already complete
+        clean_link = raw_href
+    elif raw_href.startswith("/jobs/view/"):
+        # Relative URL - add LinkedIn domain
+        clean_link = "https://www.linkedin.com" + raw_href
+    else:
+        # Malformed or unusual format - extract job ID
+        job_id = raw_href.split("/")[-1].split("?")[0]
+        clean_link = f"https://www.linkedin.com/jobs/view/{job_id}"
+
+    # Remove duplicate domains if present
+    clean_link = clean_link.replace("https://www.linkedin.comhttps://", "https://")
+    clean_link = clean_link.replace("https://www.linkedin.com//", "https://www.linkedin.com/")
+
+    return clean_link
+
+def decode_page(content):
+    """
+    Text of a results page as BeautifulSoup would read it: UTF-8 (what
+    LinkedIn serves) when the bytes are valid UTF-8, otherwise whatever
+    UnicodeDammit finds (BOM, declared charset, windows-1252 fallback)
+    """
+    try:
+        return content.decode("utf-8")
+    except UnicodeDecodeError:
+        return UnicodeDammit(content, is_html=True).unicode_markup or ""
+
+def parse_cards_bs4(content, keywords, location, max_jobs=None):
+    """Extract job dicts from a results page with BeautifulSoup's html.parser"""
+    jobs = []
+    soup = BeautifulSoup(content, "html.parser")
+
+    # Find all job cards
+    job_cards = soup.find_all("li")
+
+    for card in job_cards:
+        if max_jobs is not None and len(jobs) >= max_jobs:
+            break
+
+        try:
+            # Extract job link - FIXED VERSION
+            link_elem = card.find("a", {"data-tracking-control-name": CARD_LINK_TRACKING})
+            if not link_elem:
+                continue
+
+            # Get href and clean it properly
+            raw_href = link_elem.get("href", "")
+            if not raw_href:
+                continue
+
+            clean_link = clean_job_link(raw_href)
+
+            # Extract job title
+            title_elem = card.find("h3", class_="base-search-card__title")
+            if not title_elem:
+                continue
+
+            # Extract company name
+            company_elem = card.find("h4", class_="base-search-card__subtitle")
+
+            # Extract location
+            location_elem = card.find("span", class_="job-search-card__location")
+
+            # Extract posting date, parsed once into naive epoch seconds
+            date_elem = card.find("time")
+            date_posted = date_elem.get("datetime", "N/A") if date_elem else "N/A"
+
+            # Check for Easy Apply
+            easy_apply_elem = card.find("span", string=lambda text: text and "Easy Apply" in text if text else False)
+            has_easy_apply = easy_apply_elem is not None
+
+            # Clean and format the data
+            job_data = Job({
+                "title": title_elem.get_text().strip(),
+                "company": company_elem.get_text().strip() if company_elem else "N/A",
+                "location": location_elem.get_text().strip() if location_elem else location,
+                "link": clean_link,
+                "date_posted": date_posted,
+                "posted_at": parse_posted_at(date_posted),
+                "search_keywords": keywords,
+                "easy_apply": has_easy_apply,
+                "scraped_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            })
+
+            jobs.append(job_data)
+
+        except Exception as e:
+            print(f"Error parsing job card: {e}")
+            continue
+
+    return jobs
+
+if lxml is not None:
+    def _has_class(name):
+        # XPath equivalent of BeautifulSoup's class_= token match
+        return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+    # Compiled once at import, reused for every card of every page
+    _UTF8_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+    _XP_LINK = etree.XPath(f'.//a[@data-tracking-control-name="{CARD_LINK_TRACKING}"]')
+    _XP_TITLE = etree.XPath(f'.//h3[{_has_class("base-search-card__title")}]')
+    _XP_COMPANY = etree.XPath(f'.//h4[{_has_class("base-search-card__subtitle")}]')
+    _XP_LOCATION = etree.XPath(f'.//span[{_has_class("job-search-card__location")}]')
+    _XP_TIME = etree.XPath('.//time')
+    # Mirrors span.string: a single child node whose text mentions Easy Apply
+    _XP_EASY_APPLY = etree.XPath('boolean(.//span[count(node()) = 1][contains(string(.), "Easy Apply")])')
+
+def parse_html(content):
+    """
+    lxml document of an HTML page (bytes or str), None if the page is empty.
+    Bytes are decoded with decode_page first.
+    """
+    if isinstance(content, bytes):
+        content = decode_page(content)
+    if not content.strip():
+        return None
+
+    try:
+        if content.lstrip().startswith("<?xml"):
+            # lxml refuses str with an XML encoding declaration, the text is UTF-8 once encoded
+            return lxml.html.document_fromstring(content.encode("utf-8"), parser=_UTF8_PARSER)
+        return lxml.html.document_fromstring(content)
+    except etree.ParserError:
+        # Nothing but comments: no document
+        return None
+
+def parse_cards_lxml(content, keywords, location, max_jobs=None):
+    """Extract job dicts from a results page with compiled lxml XPath queries"""
+    jobs = []
+
+    root = parse_html(content)
+    if root is None:
+        return jobs
+
+    scraped_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    for card in root.iter("li"):
+        if max_jobs is not None and len(jobs) >= max_jobs:
+            break
+
+        try:
+            link_elems = _XP_LINK(card)
+            if not link_elems:
+                continue
+
+            raw_href = link_elems[0].get("href", "")
+            if not raw_href:
+                continue
+
+            title_elems = _XP_TITLE(card)
+            if not title_elems:
+                continue
+
+            company_elems = _XP_COMPANY(card)
+            location_elems = _XP_LOCATION(card)
+            date_elems = _XP_TIME(card)
+            date_posted = date_elems[0].get("datetime", "N/A") if date_elems else "N/A"
+
+            jobs.append(Job({
+                "title": title_elems[0].text_content().strip(),
+                "company": company_elems[0].text_content().strip() if company_elems else "N/A",
+                "location": location_elems[0].text_content().strip() if location_elems else location,
+                "link": clean_job_link(raw_href),
+                "date_posted": date_posted,
+                "posted_at": parse_posted_at(date_posted),
+                "search_keywords": keywords,
+                "easy_apply": _XP_EASY_APPLY(card),
+                "scraped_at": scraped_at
+            }))
+
+        except Exception as e:
+            print(f"Error parsing job card: {e}")
+            continue
+
+    return jobs
+
+PARSER_BACKENDS = {
+    "bs4": parse_cards_bs4,
+    "lxml": parse_cards_lxml
+}
+
+def get_card_parser(name=None):
+    """Look up a parser backend by name (defaults to lxml when installed)"""
+    name = name or DEFAULT_BACKEND
+
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend '{name}', expected one of {sorted(PARSER_BACKENDS)}")
+
+    if name == "lxml" and lxml is None:
+        return parse_cards_bs4
+
+    return PARSER_BACKENDS[name]
+
+# Field order of the rows parse_cards_compact returns (search_keywords is the caller's)
+COMPACT_FIELDS = ("title", "company", "location", "link", "date_posted", "posted_at", "easy_apply", "scraped_at")
+
+def parse_cards_compact(content, keywords, location, max_jobs=None, backend=None):
+    """
+    Parse a results page into plain tuples, for running in a worker process.
+
+    Returns (seconds spent parsing, [row, ...]) with rows in COMPACT_FIELDS
+    order: cheap to pickle back, unlike parse trees or Job records.
+    """
+    start = time.perf_counter()
+    jobs = get_card_parser(backend)(content, keywords, location, max_jobs)
+    rows = [tuple(job[field] for field in COMPACT_FIELDS) for job in jobs]
+    return time.perf_counter() - start, rows
+
+
+class CardParsePool:
+    """Card extraction on a process pool, off the fetching thread
+
+    Raw page bytes go out, compact rows come back (see parse_cards_compact),
+    so parsing uses every core while the fetch loop keeps collecting
+    responses.
+    """
+
+    def __init__(self, processes=None, backend=None):
+        self.backend = backend
+        self.executor = ProcessPoolExecutor(max_workers=processes or os.cpu_count())
+
+    @classmethod
+    def from_config(cls, scraper_config):
+        """A pool per SCRAPER_CONFIG's parse_processes, or None when parsing stays in-thread"""
+        processes = scraper_config.get("parse_processes", 0)
+        if processes == 0:
+            return None
+        return cls(processes, scraper_config.get("parser_backend"))
+
+    def submit(self, content, keywords, location, max_jobs=None):
+        """Future of parse_cards_compact's (seconds, rows) for one page"""
+        return self.executor.submit(parse_cards_compact, content, keywords, location, max_jobs, self.backend)
+
+    @staticmethod
+    def to_jobs(rows, keywords):
+        """Job records from a page's compact rows"""
+        return [Job(zip(COMPACT_FIELDS, row), search_keywords=keywords) for row in rows]
+
+    def close(self):
+        self.executor.shutdown()
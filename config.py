@@ -115,5 +115,69 @@ SAFETY_CONFIG = {
     "min_delay_between_searches": 12,  # Slightly increased for safety
     "max_requests_per_minute": 5,
     "request_timeout": 15,
-    "max_retries": 2
+    "max_retries": 2,
+    "retry_backoff_seconds": 2,  # Base delay for exponential backoff between retries
+    "max_retry_wait": 120        # Upper bound on any single retry wait (incl. Retry-After)
+}
+
+# Scraper execution settings
+SCRAPER_CONFIG = {
+    "concurrent_mode": False,  # Run the search grid on a worker pool (or pass --concurrent)
+    "max_workers": 4,          # Parallel fetches, still bound by SAFETY_CONFIG rate limits
+    "parser_backend": "lxml",  # Card extraction: "lxml" (fast) or "bs4" (html.parser)
+    "parse_processes": 0,      # Parse pages in this many processes while fetching (None: all cores, 0: off)
+    "response_cache": True,    # Reuse fresh result pages across runs
+    "cache_path": "output/cache/responses.sqlite3",
+    "cache_ttl_seconds": 3600, # Pages older than this are fetched again
+    "cache_max_mb": 50,        # Least recently used pages are evicted above this size
+    "seen_jobs_db": "output/seen_jobs.sqlite3",  # Jobs seen across runs
+    "job_history": False,      # Append each run's reported jobs to the compressed history
+    "history_dir": "output/history",  # Daily gzip JSONL partitions plus an index per day
+    "incremental_mode": False, # Only report jobs not seen before (or pass --incremental)
+    "streaming_mode": False,   # Dedupe/filter/write CSV while scraping (or pass --streaming)
+    "remove_similar_jobs": False,  # Fuzzy title/company/location dedup after exact dedup
+    "similarity_threshold": 0.90,
+    "batch_scoring": False,    # Score/rank with NumPy arrays (same ranking as filter_jobs)
+    "jd_enrichment": False,    # Fetch descriptions of filtered jobs and score pm_jd_keywords
+    "jd_max_jobs": 25,         # At most this many descriptions per run, best ranked first. One request
+                               # each from the search budget: ~12s apiece at 5 rpm, so 25 add ~5 min
+    "jd_workers": 2,           # Parallel description fetches (rate limits still apply)
+    "jd_keyword_weight": 1,    # Points added to total_score per pm_jd_keyword found
+    "jd_cache_path": "output/cache/job_descriptions.sqlite3",
+    "jd_cache_ttl_seconds": 604800, # Descriptions rarely change, keep them a week
+    "query_planning": False,   # Merge synonymous locations, skip searches that only repeat others
+    "query_stats_path": "output/query_stats.json",  # Per-search overlap history
+    "max_query_overlap": 0.95, # Skip a search once this share of its jobs were already found
+    "query_min_runs": 3,       # Runs of history needed before a search can be skipped
+    "query_probe_every": 7,    # Re-run skipped searches every N runs to refresh their history
+    "scheduled_mode": False,   # Give deeper pages to high-yield searches first (or pass --scheduled)
+    "request_budget": None,    # Max search requests per run in scheduled mode (None: no limit)
+    "search_deadline_seconds": None,  # Stop scheduling new requests after this long (None: no limit)
+    "scheduler_max_pages": 3,  # Deepest page any one search can get in scheduled mode
+    "query_yield_path": "output/query_yield.json",  # New jobs per request history, per search and page
+    "email_wait_seconds": 300, # How long a run waits at the end for queued digests to go out
+    "early_digest_seconds": None,  # Streaming runs: send the digest this long into scraping (None: at the end)
+    "early_digest_min_score": None,  # ...or once the email's 30 best jobs all score at least this
+    "metrics_json_path": "output/metrics/last_run.json",  # Per-run counters and stage timings (None: off)
+    "metrics_textfile_path": "output/metrics/linkedin_scraper.prom",  # Prometheus textfile collector (None: off)
+    "profiles_mode": False,    # Run every PROFILES entry off one shared fetch pass (or pass --profiles)
+    "queued_mode": False,      # Spread search pages over work queue workers (or pass --queued)
+    "queue_db": "output/work_queue.sqlite3",  # Leased search page tasks and their parsed jobs
+    "queue_lease_seconds": 300,  # A claimed page goes back to the pool if not done within this
+    "queue_max_attempts": 3,   # Give up on a page after this many claims
+    "queue_local_workers": 2,  # Worker processes the coordinator starts itself (0: remote workers only)
+    "queue_egress": None,      # Workers with the same egress share one request budget (None: host name)
+    "queue_poll_seconds": 2,   # How often workers and the coordinator check the queue
+    "queue_idle_exit_seconds": 60,  # Workers exit after the queue stays empty this long
+    "queue_run_timeout_seconds": 3600  # Coordinator stops waiting and reports what's done
+}
+
+# People to run for in profiles mode. "search" overrides SEARCH_CONFIG and
+# "email" overrides EMAIL_CONFIG (in mainV2.py) for that profile; searches
+# shared between profiles are fetched once per run.
+PROFILES = {
+    # "alex": {
+    #     "search": {"job_types": ["Director of Product"], "locations": ["India", "Remote"]},
+    #     "email": {"receiver_email": "alex@example.com"}
+    # }
 }
@@ -0,0 +1,187 @@
+import queue
+import smtplib
+import threading
+import time
+from collections import namedtuple
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+from report_renderer import EMAIL_TOP_JOBS, render_email, select_email_jobs
+
+DEFAULT_SMTP_HOST = "smtp.gmail.com"
+DEFAULT_SMTP_PORT = 465
+
+# One email to send: who gets it, its subject and HTML body
+Digest = namedtuple("Digest", "recipient subject html")
+
+# Errors a fresh connection won't fix
+PERMANENT_ERRORS = (smtplib.SMTPAuthenticationError, smtplib.SMTPRecipientsRefused,
+                    smtplib.SMTPSenderRefused, smtplib.SMTPNotSupportedError)
+
+
+def build_message(sender, digest):
+    msg = MIMEMultipart('alternative')
+    msg['Subject'] = digest.subject
+    msg['From'] = sender
+    msg['To'] = digest.recipient
+    msg.attach(MIMEText(digest.html, 'html'))
+    return msg.as_string()
+
+
+def get_recipients(email_config):
+    """
+    Who gets a digest: EMAIL_CONFIG's "recipients" ([{"email", "top_n",
+    "keywords"}, ...]), or else receiver_email with the default top jobs
+    """
+    recipients = email_config.get('recipients')
+    if recipients:
+        return recipients
+    if email_config.get('receiver_email'):
+        return [{"email": email_config['receiver_email']}]
+    return []
+
+
+def build_digests(jobs, recipients, html_report_path=None, default_html=None, top_jobs=None):
+    """
+    One digest per recipient: their top_n jobs (earliest posted first) out
+    of the jobs mentioning one of their keywords in the title, or all jobs.
+    For recipients with default settings, default_html (the body rendered
+    along with the report) or top_jobs (the email's jobs, already picked)
+    save selecting them again.
+    """
+    digests = []
+    for recipient in recipients:
+        keywords = [keyword.lower() for keyword in recipient.get('keywords') or ()]
+        top_n = recipient.get('top_n', EMAIL_TOP_JOBS)
+        if keywords:
+            matching = [job for job in jobs if any(keyword in job['title'].lower() for keyword in keywords)]
+        else:
+            matching = jobs
+        if not matching:
+            print(f"📧 No jobs for {recipient['email']} today, no digest")
+            continue
+
+        default_settings = not keywords and top_n == EMAIL_TOP_JOBS
+        if default_settings and default_html is not None:
+            html = default_html
+        elif default_settings and top_jobs is not None:
+            html = render_email(top_jobs, len(matching), html_report_path)
+        else:
+            html = render_email(select_email_jobs(matching, top_n), len(matching), html_report_path)
+        digests.append(Digest(
+            recipient['email'],
+            f"🎯 Daily Jobs: {len(matching)} Senior Product Management Opportunities",
+            html
+        ))
+    return digests
+
+
+class EmailDelivery:
+    """Digests sent over one SMTP session by a background worker
+
+    submit() only queues a digest, so the run goes on while mail is sent.
+    The worker logs in once and sends everything queued over the same
+    connection; a dropped connection or a temporary error reconnects and
+    retries with exponential backoff, up to max_retries per digest.
+    close() waits for the queue to drain and returns who got their digest.
+    """
+
+    def __init__(self, sender, password=None, host=DEFAULT_SMTP_HOST, port=DEFAULT_SMTP_PORT, use_ssl=True,
+                 starttls=False, timeout=30, max_retries=3, retry_backoff=5):
+        self.sender = sender
+        self.password = password
+        self.host = host
+        self.port = port
+        self.use_ssl = use_ssl
+        self.starttls = starttls
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        self.queue = queue.Queue()
+        self.results = {}   # recipient -> sent
+        self.session = None
+        self.worker = None
+
+    @classmethod
+    def from_config(cls, email_config):
+        """Delivery for EMAIL_CONFIG's sender and SMTP settings"""
+        return cls(
+            email_config['sender_email'],
+            email_config.get('sender_password'),
+            host=email_config.get('smtp_host', DEFAULT_SMTP_HOST),
+            port=email_config.get('smtp_port', DEFAULT_SMTP_PORT),
+            use_ssl=email_config.get('smtp_ssl', True),
+            starttls=email_config.get('smtp_starttls', False),
+            timeout=email_config.get('smtp_timeout', 30),
+            max_retries=email_config.get('smtp_max_retries', 3),
+            retry_backoff=email_config.get('smtp_retry_backoff', 5)
+        )
+
+    def submit(self, digest):
+        """Queue a digest, starting the worker on first use"""
+        if self.worker is None:
+            self.worker = threading.Thread(target=self._run, name="email-delivery", daemon=True)
+            self.worker.start()
+        self.queue.put(digest)
+
+    def close(self, timeout=None):
+        """Wait (up to timeout seconds) for queued digests, returns {recipient: sent}"""
+        if self.worker is not None:
+            self.queue.put(None)
+            self.worker.join(timeout)
+            if self.worker.is_alive():
+                print(f"⚠️ Email delivery still busy after {timeout}s, not waiting any longer")
+        return dict(self.results)
+
+    def _connect(self):
+        if self.use_ssl:
+            session = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            session = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            if self.starttls:
+                session.starttls()
+        if self.password:
+            session.login(self.sender, self.password)
+        return session
+
+    def _disconnect(self):
+        if self.session is not None:
+            try:
+                self.session.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.session = None
+
+    def _send(self, digest):
+        message = build_message(self.sender, digest)
+        for attempt in range(self.max_retries + 1):
+            try:
+                if self.session is None:
+                    self.session = self._connect()
+                self.session.sendmail(self.sender, digest.recipient, message)
+                print(f"✅ Daily job email sent successfully to {digest.recipient}")
+                return True
+            except PERMANENT_ERRORS as e:
+                print(f"❌ Error sending daily email to {digest.recipient}: {e}")
+                return False
+            except (smtplib.SMTPException, OSError) as e:
+                # Start over on a fresh connection
+                self._disconnect()
+                if attempt == self.max_retries:
+                    print(f"❌ Error sending daily email to {digest.recipient}: {e}")
+                    return False
+                delay = self.retry_backoff * (2 ** attempt)
+                print(f"⚠️ Email to {digest.recipient} failed ({e}), retrying in {delay:.0f}s")
+                time.sleep(delay)
+        return False
+
+    def _run(self):
+        try:
+            while True:
+                digest = self.queue.get()
+                if digest is None:
+                    return
+                self.results[digest.recipient] = self._send(digest)
+        finally:
+            self._disconnect()
@@ -0,0 +1,134 @@
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying - rate limiting and transient server errors
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Where requests go unless a client is pointed elsewhere (e.g. mock_linkedin_server.py)
+LINKEDIN_BASE_URL = "https://www.linkedin.com"
+
+
+class LinkedInClient:
+    """Pooled HTTP client shared by all searches in one run
+
+    Keeps connections alive across pages and searches, retries transient
+    failures with exponential backoff + jitter and honours Retry-After on
+    429/503 responses. Every attempt (including retries) goes through the
+    optional rate limiter. base_url is the scheme and host that endpoint
+    paths are joined to.
+    """
+
+    def __init__(self, headers=None, max_retries=2, timeout=15, limiter=None,
+                 pool_size=10, backoff_seconds=2.0, max_retry_wait=120, base_url=None):
+        self.base_url = (base_url or LINKEDIN_BASE_URL).rstrip("/")
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.limiter = limiter
+        self.backoff_seconds = backoff_seconds
+        self.max_retry_wait = max_retry_wait
+
+        self.session = requests.Session()
+        # Retries are handled here so that they respect the limiter and Retry-After
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if headers:
+            self.session.headers.update(headers)
+
+    @classmethod
+    def from_config(cls, safety_config, headers=None, limiter=None, pool_size=10, base_url=None):
+        """Build a client from SAFETY_CONFIG"""
+        return cls(
+            headers=headers,
+            max_retries=safety_config.get("max_retries", 2),
+            timeout=safety_config.get("request_timeout", 15),
+            limiter=limiter,
+            pool_size=pool_size,
+            backoff_seconds=safety_config.get("retry_backoff_seconds", 2.0),
+            max_retry_wait=safety_config.get("max_retry_wait", 120),
+            base_url=base_url
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def url(self, path):
+        """Absolute URL of an endpoint path on this client's host"""
+        return self.base_url + path
+
+    def _backoff_delay(self, attempt):
+        # Exponential backoff with full jitter on top of the base delay
+        delay = self.backoff_seconds * (2 ** attempt)
+        return min(self.max_retry_wait, delay + random.uniform(0, delay))
+
+    def _retry_after_delay(self, response):
+        """Seconds to wait according to a Retry-After header, or None"""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+        return min(self.max_retry_wait, max(0.0, delay))
+
+    def get(self, url, params=None, new_search=False):
+        """GET with retries; returns the final response or raises the last error"""
+        attempt = 0
+
+        while True:
+            if self.limiter:
+                self.limiter.acquire(new_search=new_search and attempt == 0)
+
+            start = time.perf_counter()
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            except requests.RequestException as e:
+                METRICS.inc("http_requests_total", status="error")
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                METRICS.inc("http_retries_total", reason="error")
+                logger.warning("⚠️ Request error (%s), retrying in %.1fs...", e, delay)
+            else:
+                METRICS.observe("http_request_seconds", time.perf_counter() - start)
+                METRICS.inc("http_requests_total", status=response.status_code)
+                METRICS.inc("http_response_bytes_total", len(response.content))
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                    return response
+
+                delay = None
+                if response.status_code in (429, 503):
+                    delay = self._retry_after_delay(response)
+                if delay is None:
+                    delay = self._backoff_delay(attempt)
+                METRICS.inc("http_retries_total", reason=response.status_code)
+                logger.warning("⚠️ Got status %s, retrying in %.1fs...", response.status_code, delay)
+                response.close()
+
+            time.sleep(delay)
+            attempt += 1
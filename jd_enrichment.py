@@ -0,0 +1,146 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from bs4 import BeautifulSoup
+
+from card_parser import parse_html
+from keyword_matcher import KeywordMatcher
+from response_cache import ResponseCache
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:  # lxml is optional, BeautifulSoup's html.parser still works
+    lxml = None
+
+# LinkedIn's public job detail endpoint (HTML fragment with the description)
+JOB_POSTING_PATH = "/jobs-guest/jobs/api/jobPosting/{job_id}"
+
+DESCRIPTION_CLASS = "show-more-less-html__markup"
+
+if lxml is not None:
+    _XP_DESCRIPTION = etree.XPath(
+        f'//div[contains(concat(" ", normalize-space(@class), " "), " {DESCRIPTION_CLASS} ")]'
+    )
+
+def extract_description(content):
+    """Plain text of the job description in a jobPosting page ("" if missing)"""
+    if lxml is not None:
+        # Decoded the way the card parsers decode search pages
+        root = parse_html(content)
+        if root is None:
+            return ""
+        elems = _XP_DESCRIPTION(root)
+        # itertext keeps words of adjacent block elements apart
+        return " ".join(" ".join(elems[0].itertext()).split()) if elems else ""
+
+    soup = BeautifulSoup(content, "html.parser")
+    elem = soup.find("div", class_=DESCRIPTION_CLASS)
+    return " ".join(elem.get_text(" ").split()) if elem else ""
+
+
+class JDEnricher:
+    """Scores the job descriptions of jobs that already passed filter_jobs
+
+    Descriptions are fetched on a small worker pool through one client (and
+    its rate limiter), so the cost is one request per surviving candidate.
+    They're cached by job ID as extracted text, so a job seen on several
+    days is fetched once. Each description is matched against
+    pm_jd_keywords and the number of keywords found is added to total_score.
+    """
+
+    def __init__(self, client, keywords, job_id, cache=None, max_workers=2, weight=1):
+        self.client = client
+        self.job_id = job_id  # job dict -> LinkedIn job ID or None
+        self.cache = cache
+        self.max_workers = max_workers
+        self.weight = weight
+        self.matcher = KeywordMatcher({'pm_jd_keywords': keywords})
+
+    @classmethod
+    def from_config(cls, client, search_config, scraper_config, job_id):
+        """Build an enricher (and its description cache) from the configs"""
+        cache = ResponseCache(
+            scraper_config.get("jd_cache_path", "output/cache/job_descriptions.sqlite3"),
+            ttl_seconds=scraper_config.get("jd_cache_ttl_seconds", 7 * 24 * 3600),
+            max_bytes=int(scraper_config.get("cache_max_mb", 50) * 1024 * 1024)
+        )
+        return cls(
+            client,
+            search_config.get("pm_jd_keywords", []),
+            job_id,
+            cache=cache,
+            max_workers=scraper_config.get("jd_workers", 2),
+            weight=scraper_config.get("jd_keyword_weight", 1)
+        )
+
+    def close(self):
+        if self.cache:
+            self.cache.close()
+
+    def fetch_description(self, job_id):
+        """Return (description text or None, from_cache)"""
+        url = self.client.url(JOB_POSTING_PATH.format(job_id=job_id))
+        cache_key = ResponseCache.make_key(url)
+
+        if self.cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached.decode("utf-8"), True
+
+        response = self.client.get(url)
+        if response.status_code != 200:
+            print(f"Job description {job_id} failed with status code: {response.status_code}")
+            return None, False
+
+        description = extract_description(response.content)
+        if self.cache:
+            self.cache.put(cache_key, description.encode("utf-8"))
+        return description, False
+
+    def score(self, description):
+        """Number of distinct pm_jd_keywords mentioned in a description"""
+        return len(self.matcher.scan(description).get('pm_jd_keywords', ()))
+
+    def enrich(self, jobs, max_jobs=None):
+        """
+        Add jd_score to jobs (in the given order, up to max_jobs) and fold it
+        into total_score. Jobs without an ID or whose fetch failed are left
+        as they are. Returns the number of requests made.
+        """
+        candidates = {}
+        for job in jobs[:max_jobs]:
+            job_id = self.job_id(job)
+            if job_id:
+                candidates[job_id] = job
+
+        requests_made = 0
+        enriched = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.fetch_description, job_id): job_id
+                for job_id in candidates
+            }
+
+            for future in as_completed(futures):
+                job_id = futures[future]
+                try:
+                    description, from_cache = future.result()
+                except Exception as e:
+                    print(f"❌ Error fetching job description {job_id}: {e}")
+                    requests_made += 1
+                    continue
+
+                if not from_cache:
+                    requests_made += 1
+                if description is None:
+                    continue
+
+                job = candidates[job_id]
+                jd_score = self.score(description)
+                job['jd_score'] = jd_score
+                job['total_score'] = job.get('total_score', 0) + jd_score * self.weight
+                enriched += 1
+
+        print(f"📄 Scored {enriched} of {len(candidates)} job descriptions ({requests_made} requests)")
+        return requests_made
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_ONE_SECOND = timedelta(seconds=1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+MICROSECONDS_PER_SECOND = 1_000_000
+MICROSECONDS_PER_HOUR = 3600 * MICROSECONDS_PER_SECOND
+
+# Age used to sort jobs whose posting time isn't known (oldest)
+UNKNOWN_AGE_HOURS = 999
+
+_UNSET = object()
+
+def parse_posted_date(date_posted):
+    """Parse a card's <time datetime> value into a naive datetime (None for N/A)"""
+    if date_posted == "N/A":
+        return None
+
+    if 'T' in date_posted:
+        job_date = datetime.fromisoformat(date_posted.replace('Z', '+00:00'))
+        return job_date.replace(tzinfo=None)
+
+    return datetime.strptime(date_posted[:10], '%Y-%m-%d')
+
+def naive_timestamp(moment):
+    """Whole seconds since 1970 on the naive local clock filter_jobs compares dates on"""
+    return (moment - _NAIVE_EPOCH) // _ONE_SECOND
+
+@lru_cache(maxsize=4096)
+def parse_posted_at(date_posted):
+    """A card's posting time as naive epoch seconds, None for N/A or unparseable dates"""
+    try:
+        job_date = parse_posted_date(date_posted)
+    except (TypeError, ValueError):
+        return None
+    return None if job_date is None else naive_timestamp(job_date)
+
+def get_posted_at(job):
+    """
+    posted_at of a job, as set by the card parsers.
+    
+    Jobs from older CSVs or other sources get it parsed from date_posted
+    once and stored, so re-filtering them doesn't parse again.
+    """
+    posted_at = job.get('posted_at', _UNSET)
+    if posted_at is _UNSET:
+        posted_at = parse_posted_at(job['date_posted'])
+        job['posted_at'] = posted_at
+    return posted_at
+
+def age_sort_hours(job):
+    """Numeric hours_since_posted for sorting ("Unknown" or missing sorts as UNKNOWN_AGE_HOURS)"""
+    hours = job.get('hours_since_posted', UNKNOWN_AGE_HOURS)
+    return hours if isinstance(hours, (int, float)) else UNKNOWN_AGE_HOURS
+
+
+class PostingWindow:
+    """A run's time-filter cutoffs, fixed once per filter pass
+
+    Times are naive epoch microseconds, so deciding whether a job is too old
+    and bucketing its freshness are integer comparisons against posted_at.
+    """
+
+    def __init__(self, max_hours_old=24, preferred_hours_old=12, now=None):
+        now = now or datetime.now()
+        self.now_us = (now - _NAIVE_EPOCH) // _ONE_MICROSECOND
+        self.oldest_us = self.now_us - round(max_hours_old * MICROSECONDS_PER_HOUR)
+        self.preferred_us = self.now_us - round(preferred_hours_old * MICROSECONDS_PER_HOUR)
+        self.day_us = self.now_us - 24 * MICROSECONDS_PER_HOUR
+
+    @classmethod
+    def from_config(cls, time_config, now=None):
+        """Window for SEARCH_CONFIG['time_filters']"""
+        return cls(time_config.get('max_hours_old', 24), time_config.get('preferred_hours_old', 12), now)
+
+    def is_too_old(self, posted_at):
+        return posted_at * MICROSECONDS_PER_SECOND < self.oldest_us
+
+    def freshness_score(self, posted_at):
+        posted_us = posted_at * MICROSECONDS_PER_SECOND
+        if posted_us >= self.preferred_us:
+            return 10
+        if posted_us >= self.day_us:
+            return 5
+        return 1
+
+    def hours_old(self, posted_at):
+        # Same divisions as timedelta.total_seconds() / 3600
+        return ((self.now_us - posted_at * MICROSECONDS_PER_SECOND) / MICROSECONDS_PER_SECOND) / 3600
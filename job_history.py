@@ -0,0 +1,157 @@
+import gzip
+import json
+import os
+import zlib
+from datetime import date, datetime, timedelta
+
+from job_record import Job
+
+# Every history row has exactly these keys, in this order (missing ones are null)
+HISTORY_FIELDS = Job.FIELDS
+
+PARTITION_PREFIX = "jobs-"
+DATA_SUFFIX = ".jsonl.gz"
+INDEX_SUFFIX = ".index.json"
+
+
+def _partition_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+class JobHistory:
+    """Append-only job history, one gzip JSONL partition per day
+
+    Each append adds a gzip member to the day's partition (concatenated
+    members are still one valid gzip file) with rows in the fixed
+    HISTORY_FIELDS schema, so files from different runs and versions read
+    the same way. Next to every partition a small index keeps its row
+    count, posted_at range and the posted_at of every job key in it, which
+    answers "have we had this job" and "which days hold jobs posted since"
+    without opening the data.
+    """
+
+    def __init__(self, directory, job_key, compress_level=6):
+        self.directory = directory
+        self.job_key = job_key  # job dict -> stable identity string
+        self.compress_level = compress_level
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, scraper_config, job_key):
+        """Open the history configured in SCRAPER_CONFIG"""
+        return cls(scraper_config.get("history_dir", "output/history"), job_key)
+
+    def _path(self, day, suffix):
+        return os.path.join(self.directory, f"{PARTITION_PREFIX}{day.isoformat()}{suffix}")
+
+    def partitions(self):
+        """Dates that have a partition, oldest first"""
+        days = []
+        for name in os.listdir(self.directory):
+            if name.startswith(PARTITION_PREFIX) and name.endswith(DATA_SUFFIX):
+                days.append(_partition_date(name[len(PARTITION_PREFIX):-len(DATA_SUFFIX)]))
+        return sorted(days)
+
+    def read_index(self, day):
+        try:
+            with open(self._path(day, INDEX_SUFFIX), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"rows": 0, "min_posted_at": None, "max_posted_at": None, "jobs": {}}
+
+    def _write_index(self, day, index):
+        path = self._path(day, INDEX_SUFFIX)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+    def append(self, jobs, day=None):
+        """Add jobs to the partition of day (default: today), returns how many were written"""
+        if not jobs:
+            return 0
+        day = _partition_date(day or datetime.now())
+
+        lines = []
+        index = self.read_index(day)
+        for job in jobs:
+            row = {field: job.get(field) for field in HISTORY_FIELDS}
+            lines.append(json.dumps(row, separators=(",", ":")))
+
+            posted_at = row["posted_at"]
+            index["jobs"][self.job_key(job)] = posted_at
+            if posted_at is not None:
+                if index["min_posted_at"] is None or posted_at < index["min_posted_at"]:
+                    index["min_posted_at"] = posted_at
+                if index["max_posted_at"] is None or posted_at > index["max_posted_at"]:
+                    index["max_posted_at"] = posted_at
+        index["rows"] += len(lines)
+
+        # One member per append: earlier runs' bytes are never rewritten
+        member = gzip.compress(("\n".join(lines) + "\n").encode("utf-8"), self.compress_level)
+        with open(self._path(day, DATA_SUFFIX), "ab") as f:
+            f.write(member)
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._write_index(day, index)
+        return len(lines)
+
+    def read_partition(self, day):
+        """Yield the rows of one partition as Job records, in append order"""
+        path = self._path(day, DATA_SUFFIX)
+        if not os.path.exists(path):
+            return
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            try:
+                for line in f:
+                    row = json.loads(line)
+                    # Unset fields come back unset, as the pipeline stages left them
+                    yield Job({field: value for field, value in row.items()
+                               if value is not None or field == "posted_at"})
+            except (EOFError, zlib.error, gzip.BadGzipFile):
+                # Member cut short by a crash mid-append, everything before it is intact
+                print(f"⚠️ History partition {path} ends in a truncated append, skipped the rest")
+
+    def load(self, start=None, end=None, posted_since=None):
+        """
+        Jobs of the partitions from start to end (dates, inclusive), oldest
+        first, in one sequential pass. With posted_since (naive epoch
+        seconds), partitions whose index shows nothing that recent are
+        skipped and older rows are dropped.
+        """
+        start = _partition_date(start) if start else None
+        end = _partition_date(end) if end else None
+
+        for day in self.partitions():
+            if (start and day < start) or (end and day > end):
+                continue
+
+            if posted_since is not None:
+                max_posted_at = self.read_index(day)["max_posted_at"]
+                if max_posted_at is not None and max_posted_at < posted_since:
+                    continue
+
+            for job in self.read_partition(day):
+                if posted_since is not None and job['posted_at'] is not None and job['posted_at'] < posted_since:
+                    continue
+                yield job
+
+    def find(self, job_key):
+        """Dates of the partitions that hold job_key, from the indexes alone"""
+        return [day for day in self.partitions() if job_key in self.read_index(day)["jobs"]]
+
+
+def load_history(days=30, directory="output/history", job_key=None, posted_since=None):
+    """
+    The last days of job history as a list of Job records (e.g. for analysis
+    across runs). job_key only matters for appending, any key works here.
+    """
+    history = JobHistory(directory, job_key or (lambda job: job['link']))
+    start = datetime.now().date() - timedelta(days=days - 1)
+    return list(history.load(start=start, posted_since=posted_since))
@@ -0,0 +1,113 @@
+import sys
+from collections.abc import MutableMapping
+
+
+def _normalize(value):
+    return sys.intern(value.lower().strip()) if isinstance(value, str) else value
+
+
+class Job(MutableMapping):
+    """Compact job record that still behaves like the old job dicts
+
+    Known fields live in __slots__ instead of a per-record dict, repeated
+    strings (company, location, search keywords) are interned, and the
+    lowercased/stripped forms of title, company and location are computed
+    once when set. Item access (job['title'], job.get(...), csv.DictWriter,
+    the HTML renderers) works as before; keys outside FIELDS are kept in a
+    small overflow dict. Always assign through job[key] so the normalized
+    forms stay in sync.
+    """
+
+    # Key order of the old job dicts, with posted_at next to date_posted
+    FIELDS = (
+        'title', 'company', 'location', 'link', 'date_posted', 'posted_at', 'search_keywords',
+        'easy_apply', 'scraped_at', 'freshness_score', 'hours_since_posted',
+        'seniority_score', 'location_score', 'relevance_score', 'total_score', 'jd_score'
+    )
+    NORMALIZED_FIELDS = ('title', 'company', 'location')
+    INTERNED_FIELDS = ('company', 'location', 'search_keywords')
+
+    __slots__ = FIELDS + ('title_lower', 'company_lower', 'location_lower', '_extra')
+
+    def __init__(self, *args, **fields):
+        self._extra = None
+        for key, value in dict(*args, **fields).items():
+            self[key] = value
+
+    def __getitem__(self, key):
+        if key in _FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in _FIELD_SET:
+            if key in _INTERNED_SET and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, key, value)
+            if key in _NORMALIZED_SET:
+                setattr(self, f"{key}_lower", _normalize(value))
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in _FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        for key in self.FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, key):
+        if key in _FIELD_SET:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def get(self, key, default=None):
+        # Hot path for filters and renderers, skips the KeyError round trip
+        if key in _FIELD_SET:
+            return getattr(self, key, default)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def copy(self):
+        return Job(self)
+
+    def __repr__(self):
+        return f"Job({dict(self)!r})"
+
+    def __reduce__(self):
+        return (Job, (dict(self),))
+
+
+_FIELD_SET = frozenset(Job.FIELDS)
+_NORMALIZED_SET = frozenset(Job.NORMALIZED_FIELDS)
+_INTERNED_SET = frozenset(Job.INTERNED_FIELDS)
+
+
+def lowered(job, field):
+    """Lowercased, stripped title/company/location of a Job or a plain dict"""
+    value = getattr(job, f"{field}_lower", None)
+    if value is None:
+        value = job[field].lower().strip()
+    return value
@@ -0,0 +1,109 @@
+import os
+import sqlite3
+from datetime import datetime
+
+# Keep well below SQLite's host parameter limit
+LOOKUP_CHUNK_SIZE = 500
+
+
+class SeenJobsStore:
+    """Persistent record of every job seen across runs
+
+    Rows are keyed on the LinkedIn job ID (or the normalized URL when the
+    link carries no ID) in a WITHOUT ROWID table, so membership checks stay
+    index lookups even with hundreds of thousands of stored jobs.
+    """
+
+    def __init__(self, path, job_key):
+        self.path = path
+        self.job_key = job_key  # job dict -> stable identity string
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_jobs (
+                job_key TEXT PRIMARY KEY,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                times_seen INTEGER NOT NULL DEFAULT 1,
+                title TEXT,
+                company TEXT,
+                link TEXT
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+
+    @classmethod
+    def from_config(cls, scraper_config, job_key):
+        """Open the store configured in SCRAPER_CONFIG"""
+        return cls(scraper_config.get("seen_jobs_db", "output/seen_jobs.sqlite3"), job_key)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def _seen_keys(self, keys):
+        seen = set()
+        for i in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+            chunk = keys[i:i + LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT job_key FROM seen_jobs WHERE job_key IN ({placeholders})", chunk
+            )
+            seen.update(row[0] for row in rows)
+        return seen
+
+    def split_new(self, jobs):
+        """Split jobs into (never seen before, already seen) lists"""
+        keys = [self.job_key(job) for job in jobs]
+        seen = self._seen_keys(list(set(keys)))
+
+        new_jobs = []
+        old_jobs = []
+        for job, key in zip(jobs, keys):
+            if key in seen:
+                old_jobs.append(job)
+            else:
+                new_jobs.append(job)
+
+        return new_jobs, old_jobs
+
+    def is_new(self, job):
+        """Whether job isn't in the store yet (uncommitted marks count as stored)"""
+        return not self._seen_keys([self.job_key(job)])
+
+    def mark_seen(self, jobs, seen_at=None, commit=True):
+        """
+        Record jobs as seen now, keeping first_seen for known ones.
+
+        With commit=False the rows stay in the open transaction until the next
+        committing call, so a run that dies half way records nothing.
+        """
+        seen_at = seen_at or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        self.conn.executemany("""
+            INSERT INTO seen_jobs (job_key, first_seen, last_seen, title, company, link)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (job_key) DO UPDATE SET
+                last_seen = excluded.last_seen,
+                times_seen = times_seen + 1
+        """, [
+            (self.job_key(job), seen_at, seen_at, job['title'], job['company'], job['link'])
+            for job in jobs
+        ])
+        if commit:
+            self.conn.commit()
+
+    def commit(self):
+        self.conn.commit()
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM seen_jobs").fetchone()[0]
@@ -0,0 +1,76 @@
+from collections import deque
+
+
+class KeywordMatcher:
+    """Case-insensitive multi-pattern substring matcher (Aho-Corasick)
+
+    Built once from named keyword lists; scan() walks the text a single time
+    and reports, per list, the positions of every keyword found. Overlapping
+    keywords ("lead" and "leadership") are all reported, so counts match
+    running `keyword.lower() in text.lower()` for each keyword separately.
+    """
+
+    def __init__(self, keyword_groups):
+        self.keyword_groups = {name: list(keywords or []) for name, keywords in keyword_groups.items()}
+
+        self._goto = [{}]      # state -> {char: next state}
+        self._fail = [0]
+        self._outputs = [[]]   # state -> [(group, keyword position)] ending here
+
+        for name, keywords in self.keyword_groups.items():
+            for position, keyword in enumerate(keywords):
+                self._add(keyword.lower(), (name, position))
+
+        self._build_failure_links()
+
+    def _add(self, keyword, output):
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        self._outputs[state].append(output)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+
+                # Inherit the matches of the longest proper suffix
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+
+    def scan(self, text):
+        """Return {group: set of keyword positions found in text}"""
+        hits = {}
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+
+        # Empty keywords match any text, like `"" in text`
+        for name, position in outputs[0]:
+            hits.setdefault(name, set()).add(position)
+
+        state = 0
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for name, position in outputs[state]:
+                hits.setdefault(name, set()).add(position)
+
+        return hits
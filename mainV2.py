@@ -1,23 +1,44 @@
-@import requests
-from bs4 import BeautifulSoup
 import csv
 from datetime import datetime, timedelta
 import time
 import random
 import os
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import socket
+import subprocess
+import sys
 import logging
 import urllib.parse
 import re
 from difflib import SequenceMatcher
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from card_parser import CardParsePool, get_card_parser
+from email_delivery import Digest, EmailDelivery, build_digests, get_recipients
+from http_client import LINKEDIN_BASE_URL, LinkedInClient
+from query_planner import QueryPlanner, query_key
+from query_scheduler import QueryScheduler
+from rate_limiter import RateLimiter
+from jd_enrichment import JDEnricher
+from job_dates import PostingWindow, age_sort_hours, get_posted_at, naive_timestamp
+from job_history import JobHistory
+from job_record import Job, lowered
+from job_store import SeenJobsStore
+from keyword_matcher import KeywordMatcher
+from metrics import METRICS
+from near_duplicates import NearDuplicateIndex, SIMILARITY_WEIGHTS
+from report_renderer import EMAIL_TOP_JOBS, render_email, render_report, render_report_and_email, select_email_jobs
+from response_cache import ResponseCache
+from streaming_output import StreamingCSVWriter, write_csv_atomically
+from top_k import TopJobs
+from work_queue import QueueRateLimiter, WorkQueue
+
+logger = logging.getLogger(__name__)
 
 def extract_job_id_from_url(url):
     """Extract LinkedIn job ID from URL"""
     # Pattern to match LinkedIn job IDs
     patterns = [
-        r'/jobs/view/(\d+)',
+        r'/jobs/view/(?:[^/?#]*-)?(\d+)',  # Plain or slugged: /jobs/view/title-at-company-123
         r'jobId=(\d+)',
         r'/job/(\d+)'
     ]
@@ -57,340 +78,787 @@ def normalize_linkedin_url(url):
     
     return clean_url
 
+def get_job_key(job):
+    """Stable identity for a job: LinkedIn job ID, else the URL without tracking"""
+    return extract_job_id_from_url(job['link']) or normalize_linkedin_url(job['link'])
+
 def calculate_job_similarity(job1, job2):
     """Calculate similarity score between two jobs"""
     # Compare titles
     title_similarity = SequenceMatcher(None, 
-        job1['title'].lower(), 
-        job2['title'].lower()
+        lowered(job1, 'title'), 
+        lowered(job2, 'title')
     ).ratio()
     
     # Compare companies
     company_similarity = SequenceMatcher(None,
-        job1['company'].lower(),
-        job2['company'].lower()
+        lowered(job1, 'company'),
+        lowered(job2, 'company')
     ).ratio()
     
     # Compare locations
     location_similarity = SequenceMatcher(None,
-        job1['location'].lower(),
-        job2['location'].lower()
+        lowered(job1, 'location'),
+        lowered(job2, 'location')
     ).ratio()
     
-    # Weighted average
-    overall_similarity = (title_similarity * 0.6 + 
-                         company_similarity * 0.3 + 
-                         location_similarity * 0.1)
+    # Weighted average (shared with NearDuplicateIndex)
+    title_weight, company_weight, location_weight = SIMILARITY_WEIGHTS
+    overall_similarity = (title_similarity * title_weight + 
+                         company_similarity * company_weight + 
+                         location_similarity * location_weight)
     
     return overall_similarity
 
 def remove_similar_jobs(jobs, similarity_threshold=0.85):
-    """Remove jobs that are too similar to existing ones"""
+    """
+    Remove jobs that are too similar to existing ones
+    
+    Candidates come from NearDuplicateIndex, which only skips kept jobs that
+    provably can't clear the threshold, so the same jobs are kept as when
+    comparing each job with every kept job.
+    """
     unique_jobs = []
+    index = NearDuplicateIndex(similarity_threshold)
+    debug = logger.isEnabledFor(logging.DEBUG)
     
     for job in jobs:
-        is_similar = False
+        match = index.find_similar(job)
         
-        for existing_job in unique_jobs:
-            similarity = calculate_job_similarity(job, existing_job)
-            
-            if similarity > similarity_threshold:
-                print(f"Similar job found ({similarity:.2f}): {job['title']} at {job['company']}")
-                is_similar = True
-                break
+        if match:
+            if debug:
+                logger.debug("Similar job found (%.2f): %s at %s", match[1], job['title'], job['company'])
+            continue
         
-        if not is_similar:
-            unique_jobs.append(job)
+        unique_jobs.append(job)
+        index.add(job)
     
+    METRICS.inc('similar_jobs_total', len(jobs) - len(unique_jobs))
     return unique_jobs
 
-def scrape_linkedin_jobs_24h(keywords, location, max_jobs=50):
-    """
-    Scrape LinkedIn jobs from the past 24 hours with fixed URL handling
-    """
-    jobs = []
-    
-    # LinkedIn's public job search endpoint
-    base_url = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
-    
-    # Headers to mimic a real browser
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-        "Referer": "https://www.linkedin.com/jobs/search",
-        "Sec-Fetch-Dest": "document",
-        "Sec-Fetch-Mode": "navigate"
-    }
-    
-    # Search parameters
-    params = {
+# LinkedIn's public job search endpoint (joined to the client's base URL)
+LINKEDIN_SEARCH_PATH = "/jobs-guest/jobs/api/seeMoreJobPostings/search"
+LINKEDIN_SEARCH_URL = LINKEDIN_BASE_URL + LINKEDIN_SEARCH_PATH
+
+# Headers to mimic a real browser
+REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Referer": "https://www.linkedin.com/jobs/search",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate"
+}
+
+JOBS_PER_PAGE = 25
+
+def get_max_pages(max_jobs):
+    """Number of result pages to request for a search (25 jobs per page)"""
+    return min(3, (max_jobs // JOBS_PER_PAGE) + 1)  # Conservative limit
+
+def estimate_pages_fetched(found, max_jobs):
+    """Result pages a search needed to return found jobs (it stops at max_jobs or a short page)"""
+    if found >= max_jobs:
+        pages = -(-found // JOBS_PER_PAGE)
+    else:
+        pages = found // JOBS_PER_PAGE + 1
+    return min(pages, get_max_pages(max_jobs))
+
+def build_search_params(keywords, location, page):
+    """Query parameters for one page of a search"""
+    return {
         "keywords": keywords,
         "location": location,
         "f_TPR": "r86400",  # Past 24 hours filter
         "sortBy": "DD",     # Sort by date (most recent first)
-        "start": 0
+        "start": page * JOBS_PER_PAGE
     }
+
+_default_client = None
+
+def get_default_client():
+    """Shared client for callers that don't manage their own (e.g. test mode)"""
+    global _default_client
+    if _default_client is None:
+        from config import SAFETY_CONFIG
+        _default_client = LinkedInClient.from_config(SAFETY_CONFIG, headers=REQUEST_HEADERS)
+    return _default_client
+
+_default_cache = None
+
+def get_default_cache():
+    """Shared response cache from SCRAPER_CONFIG, or None when disabled"""
+    global _default_cache
+    from config import SCRAPER_CONFIG
+    if _default_cache is None and SCRAPER_CONFIG.get('response_cache', False):
+        _default_cache = ResponseCache.from_config(SCRAPER_CONFIG)
+    return _default_cache
+
+_default_parse_pool = None
+
+def get_default_parse_pool():
+    """Shared card parsing process pool from SCRAPER_CONFIG, or None when parsing stays in-thread"""
+    global _default_parse_pool
+    from config import SCRAPER_CONFIG
+    if _default_parse_pool is None:
+        _default_parse_pool = CardParsePool.from_config(SCRAPER_CONFIG)
+    return _default_parse_pool
+
+def fetch_search_page(keywords, location, page, client=None, cache=None):
+    """
+    Fetch one results page.
+    
+    Returns (body, from_cache); body is None on failure. Fresh pages are
+    served from the response cache without touching the network.
+    """
+    client = client or get_default_client()
+    cache = cache or get_default_cache()
+    params = build_search_params(keywords, location, page)
+    url = client.url(LINKEDIN_SEARCH_PATH)
+    
+    cache_key = None
+    if cache:
+        cache_key = ResponseCache.make_key(url, params)
+        content = cache.get(cache_key)
+        if content is not None:
+            logger.debug("Using cached page %d of '%s' in '%s'", page + 1, keywords, location)
+            METRICS.inc('cache_hits_total')
+            return content, True
+    
+    try:
+        logger.debug("Fetching page %d of '%s' in '%s'...", page + 1, keywords, location)
+        response = client.get(url, params=params, new_search=(page == 0))
+        
+        if response.status_code == 200:
+            if cache:
+                cache.put(cache_key, response.content)
+            return response.content, False
+        
+        METRICS.inc('page_failures_total', reason='status')
+        logger.warning("Request failed with status code: %s", response.status_code)
+        
+    except Exception as e:
+        METRICS.inc('page_failures_total', reason='error')
+        logger.warning("Error fetching page %d of '%s' in '%s': %s", page + 1, keywords, location, e)
+    
+    return None, False
+
+def is_last_useful_page(page_jobs, cutoff=None, seen_job_keys=None):
+    """
+    Decide whether paging further can still produce results.
+    
+    Results are sorted newest first (sortBy=DD), so once a whole page is
+    older than the cutoff, or made only of jobs already collected this run,
+    the pages after it won't add anything filter_jobs would keep.
+    """
+    if not page_jobs:
+        return True
+    
+    if cutoff is not None:
+        all_stale = True
+        for job in page_jobs:
+            posted_at = get_posted_at(job)
+            if posted_at is None or posted_at >= cutoff:
+                all_stale = False
+                break
+        
+        if all_stale:
+            METRICS.inc('pagination_stops_total', reason='stale')
+            logger.debug("⏹️ Whole page is older than the time window, stopping pagination")
+            return True
+    
+    if seen_job_keys is not None and all(get_job_key(job) in seen_job_keys for job in page_jobs):
+        METRICS.inc('pagination_stops_total', reason='seen')
+        logger.debug("⏹️ Whole page was already seen this run, stopping pagination")
+        return True
+    
+    return False
+
+def get_posting_cutoff(max_hours_old):
+    """Oldest posted_at (naive epoch seconds) still inside the configured window"""
+    if max_hours_old is None:
+        return None
+    return naive_timestamp(datetime.now() - timedelta(hours=max_hours_old))
+
+def parse_job_cards(content, keywords, location, max_jobs=None, backend=None):
+    """Extract job dicts from the HTML of one results page"""
+    if backend is None:
+        from config import SCRAPER_CONFIG
+        backend = SCRAPER_CONFIG.get('parser_backend')
+    
+    start = time.perf_counter()
+    jobs = get_card_parser(backend)(content, keywords, location, max_jobs)
+    METRICS.observe('parse_page_seconds', time.perf_counter() - start)
+    METRICS.observe('cards_per_page', len(jobs))
+    return jobs
+
+def parsed_page_jobs(future, keywords):
+    """Job records from a CardParsePool future, recording its parse metrics"""
+    seconds, rows = future.result()
+    METRICS.observe('parse_page_seconds', seconds)
+    METRICS.observe('cards_per_page', len(rows))
+    return CardParsePool.to_jobs(rows, keywords)
+
+def iter_linkedin_jobs_24h(keywords, location, max_jobs=50, client=None, cache=None,
+                           max_hours_old=None, seen_job_keys=None):
+    """
+    Generator form of scrape_linkedin_jobs_24h: yields each job as soon as
+    its page is parsed, so later pipeline stages don't wait for the search.
+    """
+    found = 0
+    cutoff = get_posting_cutoff(max_hours_old)
     
     # Calculate number of pages (25 jobs per page)
-    max_pages = min(3, (max_jobs // 25) + 1)  # Conservative limit
+    max_pages = get_max_pages(max_jobs)
     
-    print(f"Searching for '{keywords}' jobs in '{location}' from past 24 hours...")
+    logger.debug("Searching for '%s' jobs in '%s' from past 24 hours...", keywords, location)
     
     for page in range(max_pages):
-        params["start"] = page * 25
+        content, from_cache = fetch_search_page(keywords, location, page, client, cache)
+        if content is None:
+            break
         
-        try:
-            print(f"Fetching page {page + 1}...")
-            response = requests.get(base_url, headers=headers, params=params, timeout=15)
+        page_jobs = parse_job_cards(content, keywords, location, max_jobs - found)
+        found += len(page_jobs)
+        logger.debug("Found %d jobs on page %d", len(page_jobs), page + 1)
+        
+        last_page = is_last_useful_page(page_jobs, cutoff, seen_job_keys)
+        if seen_job_keys is not None:
+            seen_job_keys.update(get_job_key(job) for job in page_jobs)
+        
+        yield from page_jobs
+        
+        if last_page or found >= max_jobs:
+            break
+        
+        # Cached pages cost no request, so there is nothing to wait for
+        if from_cache:
+            continue
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, "html.parser")
-                
-                # Find all job cards
-                job_cards = soup.find_all("li")
-                
-                page_jobs = 0
-                for card in job_cards:
-                    try:
-                        # Extract job link - FIXED VERSION
-                        link_elem = card.find("a", {"data-tracking-control-name": "public_jobs_jserp-result_search-card"})
-                        if not link_elem:
+        # Random delay between requests (important for avoiding rate limits)
+        delay = random.uniform(3, 7)
+        logger.debug("Waiting %.1f seconds before next request...", delay)
+        time.sleep(delay)
+    
+    logger.info("Found %d jobs for '%s' in '%s'", found, keywords, location)
+
+def scrape_linkedin_jobs_24h(keywords, location, max_jobs=50, client=None, cache=None,
+                            max_hours_old=None, seen_job_keys=None):
+    """
+    Scrape LinkedIn jobs from the past 24 hours with fixed URL handling
+    
+    Paging stops early once a page is entirely older than max_hours_old or
+    entirely made of jobs in seen_job_keys (shared across a run's searches,
+    updated in place).
+    """
+    return list(iter_linkedin_jobs_24h(keywords, location, max_jobs, client, cache,
+                                       max_hours_old, seen_job_keys))
+
+def search_grid(job_types, locations):
+    """Every (job_type, location) search, in config order"""
+    return [(job_type, location) for job_type in job_types for location in locations]
+
+def iter_searches_concurrently(queries, max_jobs, client, max_workers=4, cache=None, max_hours_old=None,
+                               parse_pool=None, stop_at_seen_jobs=True):
+    """
+    Run every (keywords, location, page) fetch of queries on a bounded worker pool.
+    
+    All requests go through one client and its rate limiter, so the request
+    rate stays within SAFETY_CONFIG while the sleeps overlap. Page N+1 of a
+    search is only queued once page N succeeded, the search still needs
+    more jobs and is_last_useful_page didn't stop it. With a CardParsePool
+    (default: parse_processes in SCRAPER_CONFIG) pages are parsed in other
+    processes while responses keep coming in. stop_at_seen_jobs=False keeps
+    paging through jobs other searches already returned.
+    Yields ((keywords, location), page_jobs) in completion order.
+    """
+    found = {query: 0 for query in queries}
+    max_pages = get_max_pages(max_jobs)
+    cutoff = get_posting_cutoff(max_hours_old)
+    seen_job_keys = set()  # Only touched from this thread, no lock needed
+    parse_pool = parse_pool or get_default_parse_pool()
+    
+    print(f"⚡ Running {len(queries)} searches with {max_workers} workers...")
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}  # future -> (step, keywords, location, page), step "fetch" or "parse"
+        for keywords, location in queries:
+            future = executor.submit(fetch_search_page, keywords, location, 0, client, cache)
+            pending[future] = ("fetch", keywords, location, 0)
+        
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            
+            for future in done:
+                step, keywords, location, page = pending.pop(future)
+                query = (keywords, location)
+                try:
+                    if step == "parse":
+                        page_jobs = parsed_page_jobs(future, keywords)
+                    else:
+                        content, _ = future.result()
+                        if content is None:
                             continue
                         
-                        # Get href and clean it properly
-                        raw_href = link_elem.get("href", "")
-                        if not raw_href:
+                        if parse_pool:
+                            parse_future = parse_pool.submit(content, keywords, location, max_jobs - found[query])
+                            pending[parse_future] = ("parse", keywords, location, page)
                             continue
-                        
-                        # Fix malformed URLs
-                        if raw_href.startswith("https://"):
-                            # URL is already complete
-                            clean_link = raw_href
-                        elif raw_href.startswith("/jobs/view/"):
-                            # Relative URL - add LinkedIn domain
-                            clean_link = "https://www.linkedin.com" + raw_href
-                        else:
-                            # Malformed or unusual format - extract job ID
-                            job_id = raw_href.split("/")[-1].split("?")[0]
-                            clean_link = f"https://www.linkedin.com/jobs/view/{job_id}"
-                        
-                        # Remove duplicate domains if present
-                        clean_link = clean_link.replace("https://www.linkedin.comhttps://", "https://")
-                        clean_link = clean_link.replace("https://www.linkedin.com//", "https://www.linkedin.com/")
-                        
-                        # Extract job title
-                        title_elem = card.find("h3", class_="base-search-card__title")
-                        if not title_elem:
+                        page_jobs = parse_job_cards(content, keywords, location, max_jobs - found[query])
+                except Exception as e:
+                    METRICS.inc('page_failures_total', reason='parse')
+                    logger.warning("❌ Error parsing %s in %s page %d: %s", keywords, location, page + 1, e)
+                    continue
+                
+                found[query] += len(page_jobs)
+                logger.debug("Found %d jobs for '%s' in '%s' on page %d", len(page_jobs), keywords, location, page + 1)
+                
+                last_page = is_last_useful_page(page_jobs, cutoff, seen_job_keys if stop_at_seen_jobs else None)
+                seen_job_keys.update(get_job_key(job) for job in page_jobs)
+                
+                if not last_page and found[query] < max_jobs and page + 1 < max_pages:
+                    next_future = executor.submit(fetch_search_page, keywords, location, page + 1, client, cache)
+                    pending[next_future] = ("fetch", keywords, location, page + 1)
+                
+                # Queue the next page before handing this one downstream
+                yield query, page_jobs
+
+def run_searches_concurrently(queries, max_jobs, client, max_workers=4, cache=None, max_hours_old=None,
+                              stop_at_seen_jobs=True):
+    """
+    Run all searches on a worker pool (see iter_searches_concurrently).
+    Returns [((keywords, location), jobs), ...] in the order of queries.
+    """
+    results = {query: [] for query in queries}
+    
+    for query, page_jobs in iter_searches_concurrently(queries, max_jobs, client, max_workers, cache, max_hours_old,
+                                                       stop_at_seen_jobs=stop_at_seen_jobs):
+        results[query].extend(page_jobs)
+    
+    return list(results.items())
+
+def iter_scheduled_searches(scheduler, max_jobs, client, max_workers=4, cache=None, max_hours_old=None,
+                            parse_pool=None, stop_at_seen_jobs=True):
+    """
+    Fetch the pages a QueryScheduler picks, on a bounded worker pool.
+    
+    The scheduler hands out every search's first page, then deeper pages
+    of the searches with the best yield, until its request budget or
+    deadline runs out. Each parsed page reports back how many jobs no
+    earlier page of the run had, which updates the yield history. As in
+    iter_searches_concurrently, a search yields at most max_jobs jobs and
+    gets no deeper page once it has them, returned a short page or
+    is_last_useful_page stopped it. Pages go to parse_pool and
+    stop_at_seen_jobs applies the same way.
+    Yields ((keywords, location), page_jobs) in completion order.
+    """
+    found = {query: 0 for query in scheduler.queries}
+    cutoff = get_posting_cutoff(max_hours_old)
+    seen_job_keys = set()  # Only touched from this thread, no lock needed
+    parse_pool = parse_pool or get_default_parse_pool()
+    
+    print(f"📈 Scheduling {len(scheduler.queries)} searches with {max_workers} workers...")
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}  # future -> (step, (query, page), from_cache), step "fetch" or "parse"
+        
+        def submit_next():
+            # Pages waiting on the parse pool don't hold a fetch slot
+            while sum(1 for step, _, _ in pending.values() if step == "fetch") < max_workers:
+                task = scheduler.next_request()
+                if task is None:
+                    return
+                (keywords, location), page = task
+                future = executor.submit(fetch_search_page, keywords, location, page, client, cache)
+                pending[future] = ("fetch", task, False)
+        
+        submit_next()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            
+            for future in done:
+                step, (query, page), from_cache = pending.pop(future)
+                keywords, location = query
+                try:
+                    if step == "parse":
+                        page_jobs = parsed_page_jobs(future, keywords)
+                    else:
+                        content, from_cache = future.result()
+                        if content is None:
+                            scheduler.record_failure(query, page)
                             continue
-                            
-                        # Extract company name
-                        company_elem = card.find("h4", class_="base-search-card__subtitle")
-                        
-                        # Extract location
-                        location_elem = card.find("span", class_="job-search-card__location")
                         
-                        # Extract posting date
-                        date_elem = card.find("time")
-                        
-                        # Check for Easy Apply
-                        easy_apply_elem = card.find("span", string=lambda text: text and "Easy Apply" in text if text else False)
-                        has_easy_apply = easy_apply_elem is not None
-                        
-                        # Clean and format the data
-                        job_data = {
-                            "title": title_elem.get_text().strip(),
-                            "company": company_elem.get_text().strip() if company_elem else "N/A",
-                            "location": location_elem.get_text().strip() if location_elem else location,
-                            "link": clean_link,
-                            "date_posted": date_elem.get("datetime", "N/A") if date_elem else "N/A",
-                            "search_keywords": keywords,
-                            "easy_apply": has_easy_apply,
-                            "scraped_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        }
-                        
-                        jobs.append(job_data)
-                        page_jobs += 1
-                        
-                        if len(jobs) >= max_jobs:
-                            break
-                            
-                    except Exception as e:
-                        print(f"Error parsing job card: {e}")
-                        continue
+                        if parse_pool:
+                            parse_future = parse_pool.submit(content, keywords, location, max_jobs - found[query])
+                            pending[parse_future] = ("parse", (query, page), from_cache)
+                            continue
+                        page_jobs = parse_job_cards(content, keywords, location, max_jobs - found[query])
+                except Exception as e:
+                    METRICS.inc('page_failures_total', reason='parse')
+                    logger.warning("❌ Error parsing %s in %s page %d: %s", keywords, location, page + 1, e)
+                    scheduler.record_failure(query, page)
+                    continue
                 
-                print(f"Found {page_jobs} jobs on page {page + 1}")
+                found[query] += len(page_jobs)
+                logger.debug("Found %d jobs for '%s' in '%s' on page %d", len(page_jobs), keywords, location, page + 1)
                 
-                if len(jobs) >= max_jobs:
-                    break
-                    
-            else:
-                print(f"Request failed with status code: {response.status_code}")
-                break
+                last_page = is_last_useful_page(page_jobs, cutoff, seen_job_keys if stop_at_seen_jobs else None)
+                page_keys = {get_job_key(job) for job in page_jobs}
+                new_jobs = len(page_keys - seen_job_keys)
+                seen_job_keys.update(page_keys)
                 
-        except Exception as e:
-            print(f"Error fetching page {page + 1}: {e}")
-            break
+                more_pages = not last_page and len(page_jobs) >= JOBS_PER_PAGE and found[query] < max_jobs
+                scheduler.record_page(query, page, new_jobs, from_cache, more_pages=more_pages)
+                yield query, page_jobs
             
-        # Random delay between requests (important for avoiding rate limits)
-        delay = random.uniform(3, 7)
-        print(f"Waiting {delay:.1f} seconds before next request...")
-        time.sleep(delay)
+            # Deeper pages only become eligible as results come back
+            submit_next()
     
-    print(f"Total jobs found: {len(jobs)}")
-    return jobs
+    print(scheduler.summary())
+    scheduler.save()
 
-def remove_duplicates(jobs):
-    """Enhanced deduplication using multiple criteria"""
-    unique_jobs = []
-    seen_combinations = set()
-    seen_job_ids = set()
-    seen_titles_companies = set()
+def run_scheduled_searches(scheduler, max_jobs, client, max_workers=4, cache=None, max_hours_old=None,
+                           stop_at_seen_jobs=True):
+    """
+    Run the searches of a QueryScheduler (see iter_scheduled_searches).
+    Returns [((keywords, location), jobs), ...] in the scheduler's query order.
+    """
+    results = {query: [] for query in scheduler.queries}
     
-    print(f"Starting deduplication of {len(jobs)} jobs...")
+    for query, page_jobs in iter_scheduled_searches(scheduler, max_jobs, client, max_workers, cache, max_hours_old,
+                                                    stop_at_seen_jobs=stop_at_seen_jobs):
+        results[query].extend(page_jobs)
     
-    for job in jobs:
+    return list(results.items())
+
+class DuplicateFilter:
+    """
+    Incremental form of remove_duplicates' rules.
+    
+    check() is called once per job, in order, and remembers every job it
+    lets through, so it can sit in a streaming pipeline as well as in the
+    list-based remove_duplicates.
+    """
+    
+    def __init__(self):
+        self.seen_combinations = set()
+        self.seen_job_ids = set()
+        self.seen_titles_companies = set()
+    
+    def check(self, job):
+        """Return the rule job duplicates ("Job ID", "Title+Company", "URL") or None if it's new"""
         # Extract job ID from LinkedIn URL
         job_id = extract_job_id_from_url(job['link'])
         
         # Create a combination key for title + company
-        title_company_key = f"{job['title'].lower().strip()}|{job['company'].lower().strip()}"
+        title_company_key = f"{lowered(job, 'title')}|{lowered(job, 'company')}"
         
         # Create a normalized URL without tracking parameters
         base_url = normalize_linkedin_url(job['link'])
         
-        # Check multiple deduplication criteria
-        duplicate_found = False
-        
         # 1. Check by Job ID (most reliable)
-        if job_id and job_id in seen_job_ids:
-            duplicate_found = True
-            print(f"Duplicate by Job ID: {job['title']} at {job['company']}")
+        if job_id and job_id in self.seen_job_ids:
+            return "Job ID"
         
         # 2. Check by Title + Company combination
-        elif title_company_key in seen_titles_companies:
-            duplicate_found = True
-            print(f"Duplicate by Title+Company: {job['title']} at {job['company']}")
+        if title_company_key in self.seen_titles_companies:
+            return "Title+Company"
         
         # 3. Check by normalized URL
-        elif base_url in seen_combinations:
-            duplicate_found = True
-            print(f"Duplicate by URL: {job['title']} at {job['company']}")
+        if base_url in self.seen_combinations:
+            return "URL"
         
-        if not duplicate_found:
+        if job_id:
+            self.seen_job_ids.add(job_id)
+        self.seen_titles_companies.add(title_company_key)
+        self.seen_combinations.add(base_url)
+        return None
+
+# Duplicates found per DuplicateFilter rule, and near-duplicates, for the streaming pipeline
+DUPLICATE_HITS = {rule: METRICS.bind('duplicates_total', rule=rule) for rule in ("Job ID", "Title+Company", "URL")}
+SIMILAR_HITS = METRICS.bind('similar_jobs_total')
+
+def remove_duplicates(jobs):
+    """Enhanced deduplication using multiple criteria"""
+    unique_jobs = []
+    duplicates = DuplicateFilter()
+    
+    hits = {}
+    debug = logger.isEnabledFor(logging.DEBUG)
+    
+    print(f"Starting deduplication of {len(jobs)} jobs...")
+    
+    for job in jobs:
+        rule = duplicates.check(job)
+        if rule:
+            hits[rule] = hits.get(rule, 0) + 1
+            if debug:
+                logger.debug("Duplicate by %s: %s at %s", rule, job['title'], job['company'])
+        else:
             unique_jobs.append(job)
-            if job_id:
-                seen_job_ids.add(job_id)
-            seen_titles_companies.add(title_company_key)
-            seen_combinations.add(base_url)
+    
+    for rule, count in hits.items():
+        METRICS.inc('duplicates_total', count, rule=rule)
     
     removed_count = len(jobs) - len(unique_jobs)
     print(f"✅ Removed {removed_count} duplicates, kept {len(unique_jobs)} unique jobs")
     
     return unique_jobs
 
+# Keyword lists from SEARCH_CONFIG matched against "title company"
+FILTER_KEYWORD_LISTS = ('exclude_junior_keywords', 'seniority_keywords', 'required_keywords')
+
+_filter_matchers = {}
+
+def get_filter_matchers(config):
+    """
+    Compiled (company, title+company) matchers for a search config.
+    
+    Cached on the keyword lists themselves, so each config is compiled once
+    however many times filter_jobs runs.
+    """
+    cache_key = (
+        tuple(config.get('companies_to_exclude') or ()),
+        tuple(tuple(config.get(name) or ()) for name in FILTER_KEYWORD_LISTS)
+    )
+    
+    matchers = _filter_matchers.get(cache_key)
+    if matchers is None:
+        company_matcher = KeywordMatcher({'companies_to_exclude': config.get('companies_to_exclude')})
+        text_matcher = KeywordMatcher({name: config.get(name) for name in FILTER_KEYWORD_LISTS})
+        matchers = (company_matcher, text_matcher)
+        _filter_matchers[cache_key] = matchers
+    
+    return matchers
+
+# Why score_job dropped a job, one counter per reason
+FILTER_DROPS = {
+    reason: METRICS.bind('filter_drops_total', reason=reason)
+    for reason in ('excluded_company', 'junior', 'not_senior', 'too_old', 'no_required_keyword')
+}
+
+def score_job(job, config, window=None, matchers=None):
+    """
+    Apply filter_jobs' checks to one job.
+    
+    Sets the score fields on the job and returns True if it should be kept.
+    Callers scoring many jobs pass the run's PostingWindow and
+    get_filter_matchers(config) in.
+    """
+    company_matcher, text_matcher = matchers or get_filter_matchers(config)
+    
+    # Skip excluded companies
+    if company_matcher.scan(lowered(job, 'company')):
+        FILTER_DROPS['excluded_company'].inc()
+        return False
+    
+    # ENHANCED SENIORITY FILTERING
+    job_text = f"{lowered(job, 'title')} {lowered(job, 'company')}"
+    # One pass finds the junior, seniority and required keyword hits
+    keyword_hits = text_matcher.scan(job_text)
+    
+    # Check for junior-level exclusions
+    if config.get('exclude_junior_keywords'):
+        if keyword_hits.get('exclude_junior_keywords'):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Skipping junior role: %s", job['title'])
+            FILTER_DROPS['junior'].inc()
+            return False
+    
+    # Check for senior-level indicators
+    seniority_score = len(keyword_hits.get('seniority_keywords', ()))
+    
+    # Require minimum seniority score for inclusion
+    if seniority_score < 1:  # At least 1 senior indicator required
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Skipping non-senior role: %s (score: %s)", job['title'], seniority_score)
+        FILTER_DROPS['not_senior'].inc()
+        return False
+    
+    # Location preference scoring (India first)
+    location_score = 0
+    job_location = lowered(job, 'location')
+    if 'india' in job_location:
+        location_score += 10  # High preference for India
+    elif 'mumbai' in job_location or 'bangalore' in job_location or 'delhi' in job_location:
+        location_score += 15  # Even higher for major Indian cities
+    elif 'remote' in job_location:
+        location_score += 5   # Medium preference for remote
+    
+    # TIME-BASED FILTERING
+    if config.get('time_filters'):
+        window = window or PostingWindow.from_config(config['time_filters'])
+        posted_at = get_posted_at(job)
+        
+        if posted_at is not None:
+            if window.is_too_old(posted_at):
+                FILTER_DROPS['too_old'].inc()
+                return False
+            
+            # Freshness scoring
+            job['freshness_score'] = window.freshness_score(posted_at)
+            job['hours_since_posted'] = round(window.hours_old(posted_at), 1)
+        
+        elif job['date_posted'] != "N/A":
+            # Date present but unparseable
+            job['freshness_score'] = 1
+            job['hours_since_posted'] = "Unknown"
+    
+    # Check for required keywords
+    if config.get('required_keywords'):
+        if not keyword_hits.get('required_keywords'):
+            FILTER_DROPS['no_required_keyword'].inc()
+            return False
+    
+    # Calculate comprehensive scoring
+    job['seniority_score'] = seniority_score
+    job['location_score'] = location_score
+    job['relevance_score'] = seniority_score  # For backward compatibility
+    
+    # Total score combines seniority, location, and freshness
+    total_score = (seniority_score * 3) + location_score + job.get('freshness_score', 1)
+    job['total_score'] = total_score
+    
+    return True
+
+def rank_jobs(jobs):
+    """Sort scored jobs in place: total score (highest first), then posting time (newest first)"""
+    jobs.sort(key=lambda x: (x['total_score'], -age_sort_hours(x)), reverse=True)
+    return jobs
+
 def filter_jobs(jobs, config):
     """Apply enhanced filters for senior-level product management roles"""
-    filtered_jobs = []
+    window = PostingWindow.from_config(config.get('time_filters') or {})
+    matchers = get_filter_matchers(config)
+    filtered_jobs = [job for job in jobs if score_job(job, config, window, matchers)]
+    
+    # Sort by total score (highest first), then by posting time (newest first)
+    rank_jobs(filtered_jobs)
+    
+    print(f"Filtered to {len(filtered_jobs)} senior-level product management jobs")
+    return filtered_jobs
+
+def enrich_job_descriptions(filtered_jobs, search_config, scraper_config, safety_config, base_url=None,
+                            limiter=None):
+    """
+    Score the descriptions of filtered jobs on pm_jd_keywords and re-rank them.
+    
+    Runs after filter_jobs, so only the surviving candidates (up to
+    jd_max_jobs, best first) cost a request. Fetches draw from limiter,
+    the run's search limiter, so searches and descriptions share one
+    SAFETY_CONFIG budget; without one (the serial search path relies on
+    sleeps) they get a limiter of their own.
+    """
+    if not filtered_jobs:
+        return filtered_jobs
+    
+    client = LinkedInClient.from_config(safety_config, headers=REQUEST_HEADERS,
+                                        limiter=limiter or RateLimiter.from_config(safety_config),
+                                        pool_size=scraper_config.get('jd_workers', 2), base_url=base_url)
+    with client:
+        enricher = JDEnricher.from_config(client, search_config, scraper_config,
+                                           lambda job: extract_job_id_from_url(job['link']))
+        try:
+            enricher.enrich(filtered_jobs, scraper_config.get('jd_max_jobs'))
+        finally:
+            enricher.close()
+    
+    return rank_jobs(filtered_jobs)
+
+def filter_job_stream(jobs, config, scraper_config, seen_store=None, incremental=False, stats=None):
+    """
+    Streaming form of remove_duplicates -> remove_similar_jobs -> filter_jobs.
+    
+    Jobs are checked one at a time as the scraper yields them, and each one
+    that clears every stage is scored and yielded straight away (unranked).
+    Unique jobs are staged in seen_store without committing, so a killed
+    run doesn't mark anything as reported. Counts per stage go into stats.
+    """
+    stats = stats if stats is not None else {}
+    for name in ('scraped', 'duplicates', 'similar', 'unique', 'new', 'kept'):
+        stats.setdefault(name, 0)
+    
+    duplicates = DuplicateFilter()
+    similar_index = None
+    if scraper_config.get('remove_similar_jobs', False):
+        similar_index = NearDuplicateIndex(scraper_config.get('similarity_threshold', 0.90))
+    
+    matchers = get_filter_matchers(config)
     current_time = datetime.now()
+    window = PostingWindow.from_config(config.get('time_filters') or {}, current_time)
+    seen_at = current_time.strftime('%Y-%m-%d %H:%M:%S')
+    debug = logger.isEnabledFor(logging.DEBUG)
     
     for job in jobs:
-        # Skip excluded companies
-        if any(company.lower() in job['company'].lower() 
-               for company in config.get('companies_to_exclude', [])):
-            continue
-        
-        # ENHANCED SENIORITY FILTERING
-        job_text = f"{job['title']} {job['company']}".lower()
-        
-        # Check for junior-level exclusions
-        if config.get('exclude_junior_keywords'):
-            has_junior = any(keyword.lower() in job_text 
-                           for keyword in config['exclude_junior_keywords'])
-            if has_junior:
-                print(f"Skipping junior role: {job['title']}")
-                continue
-        
-        # Check for senior-level indicators
-        seniority_score = 0
-        if config.get('seniority_keywords'):
-            for keyword in config['seniority_keywords']:
-                if keyword.lower() in job_text:
-                    seniority_score += 1
+        stats['scraped'] += 1
         
-        # Require minimum seniority score for inclusion
-        if seniority_score < 1:  # At least 1 senior indicator required
-            print(f"Skipping non-senior role: {job['title']} (score: {seniority_score})")
+        rule = duplicates.check(job)
+        if rule:
+            if debug:
+                logger.debug("Duplicate by %s: %s at %s", rule, job['title'], job['company'])
+            DUPLICATE_HITS[rule].inc()
+            stats['duplicates'] += 1
             continue
         
-        # Location preference scoring (India first)
-        location_score = 0
-        job_location = job['location'].lower()
-        if 'india' in job_location:
-            location_score += 10  # High preference for India
-        elif 'mumbai' in job_location or 'bangalore' in job_location or 'delhi' in job_location:
-            location_score += 15  # Even higher for major Indian cities
-        elif 'remote' in job_location:
-            location_score += 5   # Medium preference for remote
-        
-        # TIME-BASED FILTERING
-        if config.get('time_filters'):
-            time_config = config['time_filters']
-            
-            try:
-                if job['date_posted'] != "N/A":
-                    if 'T' in job['date_posted']:
-                        job_date = datetime.fromisoformat(job['date_posted'].replace('Z', '+00:00'))
-                        job_date = job_date.replace(tzinfo=None)
-                    else:
-                        job_date = datetime.strptime(job['date_posted'][:10], '%Y-%m-%d')
-                    
-                    hours_old = (current_time - job_date).total_seconds() / 3600
-                    
-                    max_hours = time_config.get('max_hours_old', 24)
-                    if hours_old > max_hours:
-                        continue
-                    
-                    # Freshness scoring
-                    preferred_hours = time_config.get('preferred_hours_old', 12)
-                    if hours_old <= preferred_hours:
-                        job['freshness_score'] = 10
-                    elif hours_old <= 24:
-                        job['freshness_score'] = 5
-                    else:
-                        job['freshness_score'] = 1
-                        
-                    job['hours_since_posted'] = round(hours_old, 1)
-                    
-            except Exception as e:
-                job['freshness_score'] = 1
-                job['hours_since_posted'] = "Unknown"
-        
-        # Check for required keywords
-        if config.get('required_keywords'):
-            has_required = any(keyword.lower() in job_text 
-                             for keyword in config['required_keywords'])
-            if not has_required:
+        if similar_index is not None:
+            match = similar_index.find_similar(job)
+            if match:
+                if debug:
+                    logger.debug("Similar job found (%.2f): %s at %s", match[1], job['title'], job['company'])
+                SIMILAR_HITS.inc()
+                stats['similar'] += 1
                 continue
+            similar_index.add(job)
         
-        # Calculate comprehensive scoring
-        job['seniority_score'] = seniority_score
-        job['location_score'] = location_score
-        job['relevance_score'] = seniority_score  # For backward compatibility
+        stats['unique'] += 1
         
-        # Total score combines seniority, location, and freshness
-        total_score = (seniority_score * 3) + location_score + job.get('freshness_score', 1)
-        job['total_score'] = total_score
+        if seen_store is not None:
+            is_new = seen_store.is_new(job)
+            seen_store.mark_seen([job], seen_at, commit=False)
+            if is_new:
+                stats['new'] += 1
+            elif incremental:
+                continue
         
-        filtered_jobs.append(job)
+        if score_job(job, config, window, matchers):
+            stats['kept'] += 1
+            yield job
+
+# Title words used by categorize_jobs, compiled once
+CATEGORY_MATCHER = KeywordMatcher({
+    'senior': ['senior', 'lead', 'principal', 'staff', 'director', 'vp', 'head', 'chief'],
+    'entry_level': ['junior', 'entry', 'associate', 'graduate'],
+    'remote': ['remote']
+})
+
+_job_categories = {}
+
+def categorize_job(job):
+    """Name of the category categorize_jobs puts a job in"""
+    title_lower = lowered(job, 'title')
+    location_lower = lowered(job, 'location')
     
-    # Sort by total score (highest first), then by posting time (newest first)
-    filtered_jobs.sort(key=lambda x: (x['total_score'], -x.get('hours_since_posted', 999)), reverse=True)
+    # Titles and locations repeat a lot across searches, categorize each pair once
+    category = _job_categories.get((title_lower, location_lower))
+    if category is not None:
+        return category
     
-    print(f"Filtered to {len(filtered_jobs)} senior-level product management jobs")
-    return filtered_jobs
+    title_hits = CATEGORY_MATCHER.scan(title_lower)
+    
+    # Categorize by seniority
+    if 'senior' in title_hits:
+        category = 'senior'
+    elif 'entry_level' in title_hits:
+        category = 'entry_level'
+    elif 'remote' in location_lower or 'remote' in title_hits:
+        category = 'remote'
+    else:
+        category = 'mid_level'
+    
+    _job_categories[(title_lower, location_lower)] = category
+    return category
 
 def categorize_jobs(jobs):
     """Categorize jobs by type for better organization"""
@@ -403,23 +871,17 @@ def categorize_jobs(jobs):
     }
     
     for job in jobs:
-        title_lower = job['title'].lower()
-        location_lower = job['location'].lower()
-        
-        # Categorize by seniority
-        if any(word in title_lower for word in ['senior', 'lead', 'principal', 'staff', 'director', 'vp', 'head', 'chief']):
-            categories['senior'].append(job)
-        elif any(word in title_lower for word in ['junior', 'entry', 'associate', 'graduate']):
-            categories['entry_level'].append(job)
-        elif 'remote' in location_lower or 'remote' in title_lower:
-            categories['remote'].append(job)
-        else:
-            categories['mid_level'].append(job)
+        categories[categorize_job(job)].append(job)
     
     return categories
 
 def save_to_csv(jobs, filename):
-    """Save jobs to CSV file"""
+    """
+    Save jobs to CSV file
+    
+    The header is always every Job field in order, whatever the first job
+    happens to carry: missing fields are left empty, unknown keys dropped.
+    """
     os.makedirs(os.path.dirname(filename), exist_ok=True)
     
     if not jobs:
@@ -427,372 +889,715 @@ def save_to_csv(jobs, filename):
         return
     
     with open(filename, 'w', newline='', encoding='utf-8') as file:
-        writer = csv.DictWriter(file, fieldnames=jobs[0].keys())
+        writer = csv.DictWriter(file, fieldnames=Job.FIELDS, extrasaction='ignore')
         writer.writeheader()
         writer.writerows(jobs)
     
     print(f"Saved {len(jobs)} jobs to {filename}")
 
+def save_job_history(jobs, scraper_config):
+    """Append a run's reported jobs to the partitioned history (see job_history.py), if enabled"""
+    if not scraper_config.get('job_history', False):
+        return
+    
+    with METRICS.timer('stage_seconds', stage='save_history'):
+        written = JobHistory.from_config(scraper_config, get_job_key).append(jobs)
+    print(f"🗄️ Added {written} jobs to the history in {scraper_config.get('history_dir', 'output/history')}")
+
 def create_html_report(jobs, filename, title="LinkedIn Jobs Report"):
     """Create an HTML report for easy viewing"""
     os.makedirs(os.path.dirname(filename), exist_ok=True)
     
-    # Group jobs by category for better organization
-    categories = categorize_jobs(jobs)
-    
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>{title}</title>
-        <meta charset="UTF-8">
-        <style>
-            body {{ 
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;
-                line-height: 1.6;
-                max-width: 1200px;
-                margin: 0 auto;
-                padding: 20px;
-                background-color: #f8f9fa;
-            }}
-            .header {{
-                background: linear-gradient(135deg, #0077b5, #00a0dc);
-                color: white;
-                padding: 30px;
-                border-radius: 10px;
-                margin-bottom: 30px;
-                text-align: center;
-            }}
-            .stats {{
-                display: flex;
-                justify-content: space-around;
-                margin: 20px 0;
-                flex-wrap: wrap;
-            }}
-            .stat-box {{
-                background: white;
-                padding: 15px;
-                border-radius: 8px;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                margin: 5px;
-                text-align: center;
-                min-width: 120px;
-            }}
-            .category {{
-                margin: 30px 0;
-            }}
-            .category-title {{
-                color: #0077b5;
-                border-bottom: 2px solid #0077b5;
-                padding-bottom: 10px;
-                margin-bottom: 20px;
-            }}
-            .job {{
-                background: white;
-                border: 1px solid #e1e5e9;
-                margin: 15px 0;
-                padding: 20px;
-                border-radius: 8px;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-                transition: box-shadow 0.3s ease;
-            }}
-            .job:hover {{
-                box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-            }}
-            .job-title {{
-                color: #0077b5;
-                font-weight: bold;
-                font-size: 18px;
-                margin-bottom: 8px;
-            }}
-            .job-title a {{
-                color: #0077b5;
-                text-decoration: none;
-            }}
-            .job-title a:hover {{
-                text-decoration: underline;
-            }}
-            .company {{
-                color: #666;
-                font-weight: 500;
-                margin-bottom: 5px;
-            }}
-            .location {{
-                color: #888;
-                font-size: 14px;
-                margin-bottom: 5px;
-            }}
-            .date {{
-                color: #999;
-                font-size: 12px;
-            }}
-            .easy-apply {{
-                background: #28a745;
-                color: white;
-                padding: 4px 8px;
-                border-radius: 4px;
-                font-size: 12px;
-                margin-left: 10px;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>{title}</h1>
-            <p>Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</p>
-        </div>
-        
-        <div class="stats">
-            <div class="stat-box">
-                <h3>{len(jobs)}</h3>
-                <p>Total Jobs</p>
-            </div>
-            <div class="stat-box">
-                <h3>{len(categories['senior'])}</h3>
-                <p>Senior Level</p>
-            </div>
-            <div class="stat-box">
-                <h3>{len(categories['mid_level'])}</h3>
-                <p>Mid Level</p>
-            </div>
-            <div class="stat-box">
-                <h3>{len(categories['entry_level'])}</h3>
-                <p>Entry Level</p>
-            </div>
-            <div class="stat-box">
-                <h3>{len(categories['remote'])}</h3>
-                <p>Remote</p>
-            </div>
-        </div>
-    """
-    
-    # Add jobs by category
-    for category_name, category_jobs in categories.items():
-        if category_jobs:
-            html_content += f"""
-            <div class="category">
-                <h2 class="category-title">{category_name.replace('_', ' ').title()} Jobs ({len(category_jobs)})</h2>
-            """
-            
-            for job in category_jobs:
-                hours_old = job.get('hours_since_posted', 'Unknown')
-                if isinstance(hours_old, (int, float)) and hours_old <= 6:
-                    time_badge = f'<span style="background: #28a745; color: white; padding: 2px 8px; border-radius: 12px; font-size: 11px; margin-left: 5px;">🔥 {hours_old}h ago</span>'
-                elif isinstance(hours_old, (int, float)) and hours_old <= 12:
-                    time_badge = f'<span style="background: #ffc107; color: black; padding: 2px 8px; border-radius: 12px; font-size: 11px; margin-left: 5px;">⚡ {hours_old}h ago</span>'
-                elif isinstance(hours_old, (int, float)):
-                    time_badge = f'<span style="background: #6c757d; color: white; padding: 2px 8px; border-radius: 12px; font-size: 11px; margin-left: 5px;">🕒 {hours_old}h ago</span>'
-                else:
-                    time_badge = ''
-                
-                easy_apply_badge = '<span class="easy-apply">✅ Easy Apply</span>' if job.get('easy_apply', False) else ''
-                
-                html_content += f"""
-                <div class="job">
-                    <div class="job-title">
-                        <a href="{job['link']}" target="_blank">{job['title']}</a>
-                        {time_badge}
-                        {easy_apply_badge}
-                    </div>
-                    <div class="company">{job['company']}</div>
-                    <div class="location">📍 {job['location']}</div>
-                    <div class="date">🕒 Posted: {job['date_posted']}</div>
-                </div>
-                """
-            
-            html_content += "</div>"
-    
-    html_content += """
-    </body>
-    </html>
-    """
-    
+    # Cards are written straight to the file, grouped by category
     with open(filename, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        render_report(jobs, categorize_job, f.write, title)
     
     print(f"HTML report saved to {filename}")
 
-def send_daily_job_email(jobs, sender_email, sender_password, receiver_email, html_report_path=None):
-    """Send daily job report via email with link to full HTML report"""
+def send_daily_job_email(jobs, sender_email, sender_password, receiver_email, html_report_path=None,
+                         email_html=None, email_config=None, top_jobs=None):
+    """
+    Send daily job report via email with link to full HTML report
+    
+    email_html is the body from render_report_and_email when the report was
+    just rendered, and top_jobs the email's jobs when they were already
+    picked (e.g. TopJobs.freshest() while streaming); otherwise they are
+    selected and rendered here. Sends right away and waits for the result;
+    daily runs queue their digests instead (see publish_daily_reports).
+    SMTP settings come from email_config.
+    """
     if not jobs:
         print("No jobs to email")
         return False
     
-    # Sort jobs by time (earliest first) and limit to top 30
-    sorted_jobs = sorted(jobs, key=lambda x: x.get('hours_since_posted', 999))
-    top_jobs = sorted_jobs[:30]
-    remaining_count = max(0, len(jobs) - 30)
+    if email_html is None:
+        # Earliest posted first, limited to the top 30
+        top_jobs = top_jobs if top_jobs is not None else select_email_jobs(jobs)
+        email_html = render_email(top_jobs, len(jobs), html_report_path)
+        print(f"📧 Emailing top {len(top_jobs)} jobs (earliest first) out of {len(jobs)} total")
+    else:
+        print(f"📧 Emailing top {min(len(jobs), EMAIL_TOP_JOBS)} jobs (earliest first) out of {len(jobs)} total")
     
-    print(f"📧 Emailing top {len(top_jobs)} jobs (earliest first) out of {len(jobs)} total")
+    delivery = EmailDelivery.from_config({**(email_config or {}), 'sender_email': sender_email,
+                                          'sender_password': sender_password})
+    delivery.submit(Digest(receiver_email,
+                           f"🎯 Daily Jobs: {len(jobs)} Senior Product Management Opportunities", email_html))
+    return delivery.close().get(receiver_email, False)
+
+# Background deliveries of this run, one SMTP session per (sender, host, port)
+_email_deliveries = {}
+
+def get_email_delivery(email_config):
+    """The run's EmailDelivery for email_config's sender and SMTP server"""
+    key = (email_config['sender_email'], email_config.get('smtp_host'), email_config.get('smtp_port'))
+    delivery = _email_deliveries.get(key)
+    if delivery is None:
+        delivery = EmailDelivery.from_config(email_config)
+        _email_deliveries[key] = delivery
+    return delivery
+
+def finish_email_deliveries(timeout=None):
+    """Wait for the run's queued digests (up to timeout seconds each session), returns {recipient: sent}"""
+    results = {}
+    for delivery in _email_deliveries.values():
+        results.update(delivery.close(timeout))
+    _email_deliveries.clear()
     
-    # Convert file path to proper format for email link
-    if html_report_path:
-        # Convert Windows path to file URL
-        file_url = f"file:///{html_report_path.replace('\\', '/').replace(' ', '%20')}"
-        report_filename = os.path.basename(html_report_path)
-    else:
-        file_url = "#"
-        report_filename = "report.html"
-    
-    # Create HTML email content with prominent report link
-    html_content = f"""
-    <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; margin: 0; padding: 20px; }}
-            .header {{ background: #0077b5; color: white; padding: 20px; text-align: center; border-radius: 8px; }}
-            .report-link {{ 
-                background: #28a745; 
-                color: white; 
-                padding: 20px; 
-                text-align: center; 
-                border-radius: 8px; 
-                margin: 20px 0;
-                border: none;
-            }}
-            .report-link a {{ 
-                color: white; 
-                text-decoration: none; 
-                font-weight: bold; 
-                font-size: 18px;
-                display: block;
-            }}
-            .job {{ border: 1px solid #ddd; margin: 10px 0; padding: 15px; border-radius: 5px; }}
-            .job-title {{ color: #0077b5; font-weight: bold; font-size: 16px; margin-bottom: 5px; }}
-            .company {{ color: #666; margin: 5px 0; }}
-            .fresh-job {{ background-color: #e8f4f8; }}
-            .easy-apply {{ background: #0077b5; color: white; padding: 4px 8px; border-radius: 4px; font-size: 12px; }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h2>🎯 Daily Senior Product Management Jobs</h2>
-            <p>Top {len(top_jobs)} opportunities (sorted by posting time)</p>
-            <p>{datetime.now().strftime('%B %d, %Y')}</p>
-            {f'<p style="font-size: 14px;">({remaining_count} more jobs in full report)</p>' if remaining_count > 0 else ''}
-        </div>
-        
-        <div class="report-link">
-            <a href="{file_url}" target="_blank">
-                📊 CLICK HERE: View Complete Report ({len(jobs)} jobs)
-            </a>
-            <p style="margin: 10px 0 0 0; font-size: 14px;">
-                File: {report_filename}
-            </p>
-        </div>
-        
-        <h3 style="color: #0077b5; border-bottom: 2px solid #0077b5; padding-bottom: 5px;">
-            🕒 Latest Jobs (Sorted by Posting Time - Earliest First)
-        </h3>
-    """
-    
-    # Add jobs sorted by time
-    for i, job in enumerate(top_jobs, 1):
-        hours_ago = job.get('hours_since_posted', 'Unknown')
-        easy_apply = job.get('easy_apply', False)
-        
-        # Time-based styling
-        if isinstance(hours_ago, (int, float)) and hours_ago <= 6:
-            job_class = "job fresh-job"
-            time_badge = f'<span style="background: #28a745; color: white; padding: 2px 6px; border-radius: 12px; font-size: 11px;">🔥 {hours_ago}h ago</span>'
-        elif isinstance(hours_ago, (int, float)) and hours_ago <= 12:
-            job_class = "job fresh-job"
-            time_badge = f'<span style="background: #ffc107; color: black; padding: 2px 6px; border-radius: 12px; font-size: 11px;">⚡ {hours_ago}h ago</span>'
-        else:
-            job_class = "job"
-            time_badge = f'<span style="background: #6c757d; color: white; padding: 2px 6px; border-radius: 12px; font-size: 11px;">🕒 {hours_ago}h ago</span>'
-        
-        easy_apply_badge = '<span class="easy-apply">✅ Easy Apply</span>' if easy_apply else ''
-        
-        html_content += f"""
-        <div class="{job_class}">
-            <div style="display: flex; justify-content: space-between; align-items: flex-start;">
-                <div style="flex: 1;">
-                    <div class="job-title">
-                        {i}. <a href="{job['link']}" target="_blank">{job['title']}</a>
-                    </div>
-                    <div class="company">🏢 {job['company']}</div>
-                    <div style="color: #888; font-size: 14px;">📍 {job['location']}</div>
-                </div>
-                <div style="text-align: right;">
-                    {time_badge}
-                    <br>
-                    {easy_apply_badge}
-                </div>
-            </div>
-        </div>
-        """
-    
-    html_content += """
-        <div style="margin-top: 30px; padding: 20px; background: #f8f9fa; text-align: center; border-radius: 8px;">
-            <p><strong>📊 Don't forget to check the complete HTML report above for all jobs!</strong></p>
-            <p><em>Sent automatically by your LinkedIn Job Scraper</em></p>
-            <p style="font-size: 12px; color: #666;">Happy job hunting! 🚀</p>
-        </div>
-    </body>
-    </html>
-    """
-    
-    # Send email
+    for sent in results.values():
+        METRICS.inc('emails_total', status='sent' if sent else 'failed')
+    if results:
+        print(f"📧 {sum(results.values())} of {len(results)} digests delivered")
+    return results
+
+def collect_unique_jobs(jobs, all_jobs, job_urls_seen):
+    """Quick deduplication during collection, returns how many jobs were new"""
+    METRICS.inc('jobs_total', len(jobs), stage='scraped')
+    before = len(all_jobs)
+    for job in jobs:
+        job_id = extract_job_id_from_url(job['link'])
+        base_key = f"{lowered(job, 'title')}|{lowered(job, 'company')}"
+        
+        if job_id not in job_urls_seen and base_key not in job_urls_seen:
+            all_jobs.append(job)
+            job_urls_seen.add(job_id or job['link'])
+            job_urls_seen.add(base_key)
+    
+    return len(all_jobs) - before
+
+def publish_daily_reports(filtered_jobs, html_filename, email_config, send_email=True):
+    """
+    Write the HTML report and queue each recipient's digest, returns how many were queued
+    
+    Digests go out in the background (see email_delivery.py);
+    automated_daily_run waits for them once everything else is done.
+    send_email=False only writes the report (the digest went out early).
+    """
+    os.makedirs(os.path.dirname(html_filename), exist_ok=True)
+    
+    # One pass over the ranked jobs renders the report and picks the email's jobs
+    with open(html_filename, 'w', encoding='utf-8') as f:
+        email_html = render_report_and_email(filtered_jobs, categorize_job, f.write,
+                                             "Senior Product Management Jobs - India Focus", html_filename)
+    print(f"HTML report saved to {html_filename}")
+    
+    if not send_email:
+        return 0
+    
+    if not email_config.get('sender_email'):
+        print("📧 No sender configured in EMAIL_CONFIG, skipping the email")
+        return 0
+    
+    if not filtered_jobs:
+        print("No jobs to email")
+        return 0
+    
+    digests = build_digests(filtered_jobs, get_recipients(email_config), html_filename, email_html)
+    delivery = get_email_delivery(email_config)
+    for digest in digests:
+        delivery.submit(digest)
+    
+    print(f"📧 Queued {len(digests)} digests from {email_config['sender_email']}")
+    return len(digests)
+
+def print_daily_summary(filtered_jobs, csv_filename, html_filename, email_sent):
+    print("📊 Daily run completed:")
+    print(f"   Found: {len(filtered_jobs)} senior-level jobs")
+    print(f"   CSV: {csv_filename}")
+    print(f"   HTML: {html_filename}")
+    print(f"   Email: {'✅ Queued with HTML link' if email_sent else '❌ Not sent'}")
+
+def iter_daily_searches(search_config, client, concurrent=False, max_workers=4, seen_job_keys=None,
+                        queries=None, scheduler=None):
+    """
+    Yield the jobs of every search (default: the whole config grid) as their
+    pages are parsed. With a QueryScheduler, it decides the pages instead.
+    """
+    max_hours_old = search_config.get('time_filters', {}).get('max_hours_old')
+    if queries is None:
+        queries = search_grid(search_config['job_types'], search_config['locations'])
+    
+    if scheduler is not None:
+        for _, page_jobs in iter_scheduled_searches(scheduler, search_config['max_jobs_per_search'], client,
+                                                    max_workers, max_hours_old=max_hours_old):
+            yield from page_jobs
+        return
+    
+    if concurrent:
+        for _, page_jobs in iter_searches_concurrently(
+            queries,
+            search_config['max_jobs_per_search'],
+            client,
+            max_workers,
+            max_hours_old=max_hours_old
+        ):
+            yield from page_jobs
+        return
+    
+    for job_type, location in queries:
+        logger.info("📍 Searching: %s in %s", job_type, location)
+        
+        try:
+            yield from iter_linkedin_jobs_24h(job_type, location, search_config['max_jobs_per_search'], client,
+                                              max_hours_old=max_hours_old, seen_job_keys=seen_job_keys)
+            
+            time.sleep(random.uniform(12, 20))  # Increased delay for safety
+        except Exception as e:
+            logger.warning("❌ Error searching %s in %s: %s", job_type, location, e)
+            continue
+
+def early_digest_due(top_jobs, scraper_config, started):
+    """
+    Whether a streaming run's digest can go out before scraping finishes:
+    early_digest_seconds have passed, or the email's worth of best jobs all
+    reach early_digest_min_score
+    """
+    deadline = scraper_config.get('early_digest_seconds')
+    if deadline is not None and time.monotonic() - started >= deadline:
+        return True
+    
+    min_score = scraper_config.get('early_digest_min_score')
+    lowest_score = top_jobs.lowest_score()
+    return min_score is not None and lowest_score is not None and lowest_score >= min_score
+
+def send_early_digest(filtered_jobs, top_jobs, html_filename, email_config):
+    """Queue the digests from the jobs kept so far, returns how many were queued"""
+    if not email_config.get('sender_email'):
+        return 0
+    
+    digests = build_digests(filtered_jobs, get_recipients(email_config), html_filename,
+                            top_jobs=top_jobs.freshest())
+    delivery = get_email_delivery(email_config)
+    for digest in digests:
+        delivery.submit(digest)
+    
+    print(f"📧 Early digest: queued {len(digests)} digests from the first {top_jobs.count} kept jobs")
+    return len(digests)
+
+def streaming_daily_run(search_config, scraper_config, safety_config, client, csv_filename,
+                        concurrent=False, incremental=False, queries=None, scheduler=None,
+                        email_config=None, html_filename=None):
+    """
+    Scrape, dedupe, filter and write the CSV as one streaming pass.
+    
+    Jobs that pass every filter are appended to a *_partial.csv as they
+    arrive, so a killed run still leaves usable output; only the final
+    ranking buffers the kept jobs. The email's top jobs are kept up to date
+    on the way, so with early_digest_seconds or early_digest_min_score set
+    (and email_config) the digest goes out before the searches are done;
+    stats['early_digest'] then counts the digests queued. Returns (ranked
+    jobs, stats, seen store); the caller commits the store once reports
+    have gone out.
+    """
+    partial_filename = csv_filename.replace('.csv', '_partial.csv')
+    seen_store = SeenJobsStore.from_config(scraper_config, get_job_key)
+    stats = {'early_digest': 0}
+    filtered_jobs = []
+    top_jobs = TopJobs(EMAIL_TOP_JOBS)
+    early_digest = email_config is not None and (scraper_config.get('early_digest_seconds') is not None or
+                                                 scraper_config.get('early_digest_min_score') is not None)
+    started = time.monotonic()
+    
+    with METRICS.timer('stage_seconds', stage='stream'), client, StreamingCSVWriter(partial_filename) as writer:
+        jobs = iter_daily_searches(search_config, client, concurrent,
+                                   scraper_config.get('max_workers', 4), seen_job_keys=set(), queries=queries,
+                                   scheduler=scheduler)
+        for job in filter_job_stream(jobs, search_config, scraper_config, seen_store, incremental, stats):
+            writer.write(job)
+            filtered_jobs.append(job)
+            top_jobs.add(job)
+            
+            if early_digest and early_digest_due(top_jobs, scraper_config, started):
+                stats['early_digest'] = send_early_digest(filtered_jobs, top_jobs, html_filename, email_config)
+                early_digest = False
+    
+    for stage in ('scraped', 'unique', 'new', 'kept'):
+        METRICS.inc('jobs_total', stats[stage], stage=stage)
+    print(f"🔍 Streamed {stats['scraped']} jobs: {stats['duplicates']} duplicates, "
+          f"{stats['similar']} similar, {stats['new']} of {stats['unique']} not seen in earlier runs")
+    
+    if scraper_config.get('jd_enrichment', False):
+        with METRICS.timer('stage_seconds', stage='enrich'):
+            enrich_job_descriptions(filtered_jobs, search_config, scraper_config, safety_config, client.base_url,
+                                    client.limiter)
+    
+    with METRICS.timer('stage_seconds', stage='save_csv'):
+        rank_jobs(filtered_jobs)
+        write_csv_atomically(filtered_jobs, csv_filename)
+        os.remove(partial_filename)
+    save_job_history(filtered_jobs, scraper_config)
+    
+    return filtered_jobs, stats, seen_store
+
+def automated_daily_run(concurrent=None, incremental=None, streaming=None, scheduled=None, base_url=None,
+                        profiles=None, queued=None, run_id=None):
+    """
+    Main function for automated daily job scraping and emailing with enhanced deduplication
+    
+    base_url sends every LinkedIn request to another host instead, e.g. a
+    mock_linkedin_server.py instance for end-to-end tests. profiles
+    ({name: {"search": {...}, "email": {...}}}, see config.PROFILES) runs
+    every profile off one shared fetch pass; streaming does not apply there.
+    queued spreads the searches over work queue workers (see
+    run_queued_pipeline); run_id resumes an earlier queued run.
+    """
+    from config import SCRAPER_CONFIG, PROFILES
+    
+    if profiles is None and SCRAPER_CONFIG.get('profiles_mode', False):
+        profiles = PROFILES
+    if queued is None:
+        queued = SCRAPER_CONFIG.get('queued_mode', False)
+    
+    METRICS.reset()
     try:
-        msg = MIMEMultipart('alternative')
-        msg['Subject'] = f"🎯 Daily Jobs: {len(jobs)} Senior Product Management Opportunities"
-        msg['From'] = sender_email
-        msg['To'] = receiver_email
+        with METRICS.timer('stage_seconds', stage='total'):
+            if profiles:
+                run_profiles_pipeline(profiles, concurrent, incremental, scheduled, base_url)
+            elif queued:
+                run_queued_pipeline(incremental, base_url, run_id)
+            else:
+                run_daily_pipeline(concurrent, incremental, streaming, scheduled, base_url)
+    finally:
+        # Digests were queued as reports were written, wait for them last
+        finish_email_deliveries(SCRAPER_CONFIG.get('email_wait_seconds', 300))
+        # Written on every exit, so a failed or empty run still shows up in monitoring
+        METRICS.write(SCRAPER_CONFIG.get('metrics_json_path'), SCRAPER_CONFIG.get('metrics_textfile_path'))
+
+# Email configuration - ADD YOUR ACTUAL DETAILS
+EMAIL_CONFIG = {
+    "sender_email": "",        # Replace with your email
+    "sender_password": "", # Replace with your App Password
+    "receiver_email": "",      # Where to send the daily report
+    "recipients": [],          # Or several: [{"email": ..., "top_n": 10, "keywords": ["Director"]}]
+    "smtp_host": "smtp.gmail.com",
+    "smtp_port": 465,
+    "smtp_ssl": True,          # False for plain SMTP (e.g. a local test server), see smtp_starttls
+    "smtp_starttls": False,
+    "smtp_timeout": 30,
+    "smtp_max_retries": 3      # Reconnect and retry a digest this many times
+}
+
+def search_queries(queries, max_jobs, client, concurrent=False, max_workers=4, max_hours_old=None,
+                   scheduler=None, stop_at_seen_jobs=True):
+    """
+    Run every search of a batch run, returns [((keywords, location), jobs), ...] in query order.
+    With stop_at_seen_jobs, a search stops paging at a page of jobs earlier searches already returned.
+    """
+    if scheduler:
+        return run_scheduled_searches(scheduler, max_jobs, client, max_workers, max_hours_old=max_hours_old,
+                                      stop_at_seen_jobs=stop_at_seen_jobs)
+    
+    if concurrent:
+        return run_searches_concurrently(queries, max_jobs, client, max_workers, max_hours_old=max_hours_old,
+                                         stop_at_seen_jobs=stop_at_seen_jobs)
+    
+    results = []
+    # Lets later searches stop paging through known jobs
+    seen_job_keys = set() if stop_at_seen_jobs else None
+    
+    # Search with enhanced configuration and inline deduplication
+    for job_type, location in queries:
+        logger.info("📍 Searching: %s in %s", job_type, location)
+        
+        try:
+            jobs = scrape_linkedin_jobs_24h(job_type, location, max_jobs, client,
+                                            max_hours_old=max_hours_old, seen_job_keys=seen_job_keys)
+            results.append(((job_type, location), jobs))
+            
+            time.sleep(random.uniform(12, 20))  # Increased delay for safety
+        except Exception as e:
+            logger.warning("❌ Error searching %s in %s: %s", job_type, location, e)
+            continue
+    
+    return results
+
+def record_query_results(planner, results, max_jobs, scheduler=None):
+    """Collect searches' jobs with inline deduplication, feeding the planner's overlap history"""
+    all_jobs = []
+    job_urls_seen = set()  # Track URLs we've already found
+    
+    for (job_type, location), jobs in results:
+        added = collect_unique_jobs(jobs, all_jobs, job_urls_seen)
+        if planner:
+            pages = scheduler.pages[(job_type, location)] if scheduler else estimate_pages_fetched(len(jobs), max_jobs)
+            planner.record(job_type, location, len(jobs), added, pages)
+    
+    if planner:
+        planner.finish_run()
+    
+    return all_jobs
+
+def make_search_client(safety_config, concurrent, max_workers, base_url=None):
+    # One shared limiter keeps the whole pool within SAFETY_CONFIG; the serial
+    # path keeps its own sleeps between pages and searches
+    limiter = RateLimiter.from_config(safety_config) if concurrent else None
+    return LinkedInClient.from_config(safety_config, headers=REQUEST_HEADERS,
+                                      limiter=limiter, pool_size=max_workers,
+                                      base_url=base_url)
+
+def run_daily_pipeline(concurrent=None, incremental=None, streaming=None, scheduled=None, base_url=None):
+    """Search, dedupe, filter, save, report and email (one automated_daily_run)"""
+    from config import SEARCH_CONFIG, OUTPUT_CONFIG, SAFETY_CONFIG, SCRAPER_CONFIG
+    
+    if concurrent is None:
+        concurrent = SCRAPER_CONFIG.get('concurrent_mode', False)
+    if incremental is None:
+        incremental = SCRAPER_CONFIG.get('incremental_mode', False)
+    if streaming is None:
+        streaming = SCRAPER_CONFIG.get('streaming_mode', False)
+    if scheduled is None:
+        scheduled = SCRAPER_CONFIG.get('scheduled_mode', False)
+    
+    print(f"🚀 Starting automated senior-level job search at {datetime.now()}")
+    
+    max_workers = SCRAPER_CONFIG.get('max_workers', 4)
+    max_hours_old = SEARCH_CONFIG.get('time_filters', {}).get('max_hours_old')
+    client = make_search_client(SAFETY_CONFIG, concurrent or scheduled, max_workers, base_url)
+    
+    # Skip synonymous and historically redundant searches (optional)
+    queries = search_grid(SEARCH_CONFIG['job_types'], SEARCH_CONFIG['locations'])
+    planner = None
+    if SCRAPER_CONFIG.get('query_planning', False):
+        planner = QueryPlanner.from_config(SCRAPER_CONFIG)
+        plan = planner.plan(SEARCH_CONFIG['job_types'], SEARCH_CONFIG['locations'],
+                            get_max_pages(SEARCH_CONFIG['max_jobs_per_search']))
+        queries = plan.queries
+        print(plan.summary(len(SEARCH_CONFIG['job_types']) * len(SEARCH_CONFIG['locations'])))
+    
+    # Spend a request budget on the searches with the best yield (optional)
+    scheduler = None
+    if scheduled:
+        max_pages = get_max_pages(SEARCH_CONFIG['max_jobs_per_search'])
+        scheduler = QueryScheduler.from_config(queries, SCRAPER_CONFIG, max_pages=max_pages)
+    
+    if streaming:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        csv_filename = f"{OUTPUT_CONFIG['csv_folder']}senior_jobs_{timestamp}.csv"
+        html_filename = f"{OUTPUT_CONFIG['html_folder']}senior_jobs_{timestamp}.html"
+        os.makedirs(OUTPUT_CONFIG['html_folder'], exist_ok=True)
         
-        part = MIMEText(html_content, 'html')
-        msg.attach(part)
+        filtered_jobs, stats, seen_store = streaming_daily_run(
+            SEARCH_CONFIG, SCRAPER_CONFIG, SAFETY_CONFIG, client, csv_filename, concurrent, incremental, queries,
+            scheduler, EMAIL_CONFIG, html_filename
+        )
         
-        with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
-            server.login(sender_email, sender_password)
-            server.sendmail(sender_email, receiver_email, msg.as_string())
+        if incremental and not stats['new']:
+            seen_store.commit()
+            seen_store.close()
+            print("✅ No new jobs since last run")
+            return
         
-        print(f"✅ Daily job email sent successfully to {receiver_email}")
-        return True
+        print(f"📊 Final job count: {len(filtered_jobs)} unique, relevant jobs")
+        with METRICS.timer('stage_seconds', stage='publish'):
+            email_sent = publish_daily_reports(filtered_jobs, html_filename, EMAIL_CONFIG,
+                                               send_email=not stats['early_digest'])
+        email_sent = email_sent or stats['early_digest']
+        
+        # Unique jobs were staged while streaming, record them now the reports went out
+        seen_store.commit()
+        seen_store.close()
+        
+        print_daily_summary(filtered_jobs, csv_filename, html_filename, email_sent)
+        return
+    
+    max_jobs = SEARCH_CONFIG['max_jobs_per_search']
+    
+    with METRICS.timer('stage_seconds', stage='search'), client:
+        results = search_queries(queries, max_jobs, client, concurrent, max_workers, max_hours_old, scheduler)
+    all_jobs = record_query_results(planner, results, max_jobs, scheduler)
+    
+    finish_daily_run(all_jobs, SEARCH_CONFIG, SCRAPER_CONFIG, SAFETY_CONFIG, OUTPUT_CONFIG, EMAIL_CONFIG,
+                     incremental, base_url, limiter=client.limiter)
+
+def profile_configs(profiles, search_config, scraper_config, email_config):
+    """
+    Each profile's (name, search config, scraper config, email config)
+    
+    A profile's "search" and "email" entries override SEARCH_CONFIG and
+    EMAIL_CONFIG; it gets its own seen-jobs database so incremental runs
+    track what each person was already sent, its own query planner stats
+    (a search is only redundant next to that profile's other searches) and
+    its own job history.
+    """
+    db_base, db_ext = os.path.splitext(scraper_config.get('seen_jobs_db', "output/seen_jobs.sqlite3"))
+    stats_base, stats_ext = os.path.splitext(scraper_config.get('query_stats_path', "output/query_stats.json"))
+    
+    configs = []
+    for name, profile in profiles.items():
+        profile_scraper = {
+            **scraper_config,
+            'seen_jobs_db': f"{db_base}_{name}{db_ext}",
+            'query_stats_path': f"{stats_base}_{name}{stats_ext}",
+            'history_dir': os.path.join(scraper_config.get('history_dir', "output/history"), name)
+        }
+        # A profile's receiver_email stands on its own, not next to the base recipients
+        configs.append((name, {**search_config, **profile.get('search', {})}, profile_scraper,
+                        {**email_config, 'recipients': [], **profile.get('email', {})}))
+    return configs
+
+def loosest_max_hours_old(search_configs):
+    """Posting age to stop paging at that still serves every profile (None: no limit)"""
+    limits = [config.get('time_filters', {}).get('max_hours_old') for config in search_configs]
+    return None if None in limits else max(limits)
+
+def run_profiles_pipeline(profiles, concurrent=None, incremental=None, scheduled=None, base_url=None):
+    """
+    One automated_daily_run for several people sharing a single fetch pass
+    
+    Every profile's searches are merged, and each (keywords, location) is
+    fetched once, synonymous locations included, as deep as the largest
+    max_jobs_per_search needs. Each profile then gets the first
+    max_jobs_per_search jobs of its searches, as a run of its own would,
+    through its own dedupe, filters, reports and email. Network cost grows
+    with the unique searches, not with the number of profiles.
+    """
+    from config import SEARCH_CONFIG, OUTPUT_CONFIG, SAFETY_CONFIG, SCRAPER_CONFIG
+    
+    if concurrent is None:
+        concurrent = SCRAPER_CONFIG.get('concurrent_mode', False)
+    if incremental is None:
+        incremental = SCRAPER_CONFIG.get('incremental_mode', False)
+    if scheduled is None:
+        scheduled = SCRAPER_CONFIG.get('scheduled_mode', False)
+    
+    configs = profile_configs(profiles, SEARCH_CONFIG, SCRAPER_CONFIG, EMAIL_CONFIG)
+    print(f"🚀 Starting automated job search for {len(configs)} profiles at {datetime.now()}")
+    
+    # Union of every profile's searches, each fetched once
+    queries = {}          # query_key -> (keywords, location) to fetch
+    profile_keys = []     # per profile, the query keys whose results it gets
+    planners = []         # per profile, its QueryPlanner (or None)
+    for name, search_config, scraper_config, _ in configs:
+        grid = search_grid(search_config['job_types'], search_config['locations'])
+        planner = QueryPlanner.from_config(scraper_config) if scraper_config.get('query_planning', False) else None
+        planners.append(planner)
+        if planner:
+            plan = planner.plan(search_config['job_types'], search_config['locations'],
+                                get_max_pages(search_config['max_jobs_per_search']))
+            grid = plan.queries
+            print(f"👤 {name}: {plan.summary(len(search_config['job_types']) * len(search_config['locations']))}")
         
+        keys = []
+        for job_type, location in grid:
+            key = query_key(job_type, location)
+            queries.setdefault(key, (job_type, location))
+            if key not in keys:
+                keys.append(key)
+        profile_keys.append(keys)
+    
+    requested = sum(len(keys) for keys in profile_keys)
+    print(f"🔗 {len(queries)} unique searches for {requested} across profiles")
+    
+    search_configs = [search_config for _, search_config, _, _ in configs]
+    max_jobs = max(config['max_jobs_per_search'] for config in search_configs)
+    max_hours_old = loosest_max_hours_old(search_configs)
+    max_workers = SCRAPER_CONFIG.get('max_workers', 4)
+    client = make_search_client(SAFETY_CONFIG, concurrent or scheduled, max_workers, base_url)
+    
+    # Spend a request budget on the searches with the best yield (optional)
+    query_list = list(queries.values())
+    scheduler = None
+    if scheduled:
+        scheduler = QueryScheduler.from_config(query_list, SCRAPER_CONFIG, max_pages=get_max_pages(max_jobs))
+    
+    with METRICS.timer('stage_seconds', stage='search'), client:
+        # A page of jobs one profile's search already returned can still be new to another profile
+        results = search_queries(query_list, max_jobs, client, concurrent, max_workers, max_hours_old, scheduler,
+                                 stop_at_seen_jobs=False)
+    
+    results_by_key = {query_key(*query): jobs for query, jobs in results}
+    
+    for (name, search_config, scraper_config, email_config), keys, planner in zip(configs, profile_keys, planners):
+        print(f"\n👤 Profile: {name}")
+        # Results are in page order, so this is what the profile's own run would have parsed; its
+        # planner records overlap among its own searches only
+        profile_max_jobs = search_config['max_jobs_per_search']
+        profile_results = [(queries[key], results_by_key.get(key, [])[:profile_max_jobs]) for key in keys]
+        all_jobs = record_query_results(planner, profile_results, profile_max_jobs, scheduler)
+        
+        finish_daily_run(all_jobs, search_config, scraper_config, SAFETY_CONFIG, OUTPUT_CONFIG, email_config,
+                         incremental, base_url, profile=name, limiter=client.limiter)
+
+def process_queue_task(queue, task, worker_id, client, cache=None):
+    """Fetch and parse one leased search page, then store it (or hand it back on failure)"""
+    max_jobs, max_hours_old = queue.run_settings(task.run_id)
+    
+    content, _ = fetch_search_page(task.keywords, task.location, task.page, client, cache)
+    if content is None:
+        queue.fail(task, worker_id, "fetch failed")
+        return False
+    
+    try:
+        # Earlier pages of the search filled their share of max_jobs
+        page_jobs = parse_job_cards(content, task.keywords, task.location,
+                                    max_jobs - task.page * JOBS_PER_PAGE)
     except Exception as e:
-        print(f"❌ Error sending daily email: {e}")
+        METRICS.inc('page_failures_total', reason='parse')
+        logger.warning("❌ Error parsing %s in %s page %d: %s", task.keywords, task.location, task.page + 1, e)
+        queue.fail(task, worker_id, e)
         return False
+    
+    logger.debug("Found %d jobs for '%s' in '%s' on page %d", len(page_jobs), task.keywords, task.location,
+                 task.page + 1)
+    next_page = (not is_last_useful_page(page_jobs, get_posting_cutoff(max_hours_old))
+                 and len(page_jobs) >= JOBS_PER_PAGE and task.page * JOBS_PER_PAGE + len(page_jobs) < max_jobs
+                 and task.page + 1 < get_max_pages(max_jobs))
+    
+    if not queue.complete(task, worker_id, page_jobs, next_page):
+        logger.warning("⚠️ Lease on %s in %s page %d expired, result dropped", task.keywords, task.location,
+                       task.page + 1)
+        return False
+    return True
+
+def get_queue_egress(scraper_config):
+    """Name of this host's egress: queue workers with the same one share a request budget"""
+    return scraper_config.get('queue_egress') or socket.gethostname()
 
-def automated_daily_run():
-    """Main function for automated daily job scraping and emailing with enhanced deduplication"""
-    from config import SEARCH_CONFIG, OUTPUT_CONFIG
+def run_queue_worker(worker_id=None, base_url=None, queue_db=None):
+    """
+    Claim and fetch search pages from the work queue until it stays empty
     
-    # Email configuration - ADD YOUR ACTUAL DETAILS
-    EMAIL_CONFIG = {
-        "sender_email": "",        # Replace with your email
-        "sender_password": "" # Replace with your App Password
-        "receiver_email": ""       # Where to send the daily report
-    }
+    Any number of workers, on this host or others sharing the queue file,
+    can run side by side. Workers share one SAFETY_CONFIG budget per egress
+    (queue_egress, by default the host name) through a limiter kept in the
+    queue file, so adding workers on a host adds no requests per minute.
+    queue_db overrides the configured queue file.
+    """
+    from config import SAFETY_CONFIG, SCRAPER_CONFIG
     
-    print(f"🚀 Starting automated senior-level job search at {datetime.now()}")
+    queue_config = {**SCRAPER_CONFIG, 'queue_db': queue_db} if queue_db else SCRAPER_CONFIG
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    poll_seconds = SCRAPER_CONFIG.get('queue_poll_seconds', 2)
+    idle_exit_seconds = SCRAPER_CONFIG.get('queue_idle_exit_seconds', 60)
+    egress = get_queue_egress(SCRAPER_CONFIG)
+    cache = get_default_cache()
+    processed = 0
+    idle_since = time.monotonic()
     
-    all_jobs = []
-    job_urls_seen = set()  # Track URLs we've already found
+    with WorkQueue.from_config(queue_config) as queue:
+        # Workers behind one egress draw from the same bucket, kept next to the tasks
+        limiter = QueueRateLimiter.from_config(queue.path, SAFETY_CONFIG, egress)
+        client = LinkedInClient.from_config(SAFETY_CONFIG, headers=REQUEST_HEADERS, limiter=limiter,
+                                            pool_size=1, base_url=base_url)
+        print(f"👷 Worker {worker_id} polling {queue.path} (egress {egress})")
+        
+        with client:
+            while True:
+                task = queue.claim(worker_id)
+                if task is None:
+                    # Leased tasks may still come back if their worker dies
+                    if not queue.has_work() and time.monotonic() - idle_since >= idle_exit_seconds:
+                        break
+                    time.sleep(poll_seconds)
+                    continue
+                
+                if process_queue_task(queue, task, worker_id, client, cache):
+                    processed += 1
+                idle_since = time.monotonic()
+        limiter.close()
     
-    # Search with enhanced configuration and inline deduplication
-    for job_type in SEARCH_CONFIG['job_types']:
-        for location in SEARCH_CONFIG['locations']:
-            print(f"📍 Searching: {job_type} in {location}")
-            
+    print(f"👷 Worker {worker_id} finished {processed} pages")
+    return processed
+
+def start_local_workers(count, queue_db, base_url=None):
+    """Worker processes on this host for a queued run (see run_queue_worker)"""
+    command = [sys.executable, os.path.abspath(__file__), "worker", "--queue-db", queue_db]
+    if base_url:
+        command += ["--base-url", base_url]
+    return [subprocess.Popen(command, stdout=subprocess.DEVNULL) for _ in range(count)]
+
+def run_queued_pipeline(incremental=None, base_url=None, run_id=None):
+    """
+    Coordinate one automated_daily_run through the work queue
+    
+    Queues every search, starts queue_local_workers worker processes (more
+    can join from other hosts with `python mainV2.py worker`), waits for the
+    run to finish or queue_run_timeout_seconds, then dedupes, filters and
+    publishes the merged results. Re-running with the same run_id resumes a
+    crashed run without fetching its finished pages again.
+    """
+    from config import SEARCH_CONFIG, OUTPUT_CONFIG, SAFETY_CONFIG, SCRAPER_CONFIG
+    
+    if incremental is None:
+        incremental = SCRAPER_CONFIG.get('incremental_mode', False)
+    
+    print(f"🚀 Starting queued job search at {datetime.now()}")
+    
+    queries = search_grid(SEARCH_CONFIG['job_types'], SEARCH_CONFIG['locations'])
+    planner = None
+    if SCRAPER_CONFIG.get('query_planning', False):
+        planner = QueryPlanner.from_config(SCRAPER_CONFIG)
+        plan = planner.plan(SEARCH_CONFIG['job_types'], SEARCH_CONFIG['locations'],
+                            get_max_pages(SEARCH_CONFIG['max_jobs_per_search']))
+        queries = plan.queries
+        print(plan.summary(len(SEARCH_CONFIG['job_types']) * len(SEARCH_CONFIG['locations'])))
+    
+    max_jobs = SEARCH_CONFIG['max_jobs_per_search']
+    max_hours_old = SEARCH_CONFIG.get('time_filters', {}).get('max_hours_old')
+    poll_seconds = SCRAPER_CONFIG.get('queue_poll_seconds', 2)
+    timeout = SCRAPER_CONFIG.get('queue_run_timeout_seconds', 3600)
+    
+    with WorkQueue.from_config(SCRAPER_CONFIG) as queue:
+        run_id = queue.create_run(queries, max_jobs, max_hours_old, run_id)
+        print(f"📋 Run {run_id}: {len(queries)} searches queued")
+        
+        workers = start_local_workers(SCRAPER_CONFIG.get('queue_local_workers', 2), queue.path, base_url)
+        deadline = time.monotonic() + timeout
+        
+        with METRICS.timer('stage_seconds', stage='search'):
             try:
-                jobs = scrape_linkedin_jobs_24h(job_type, location, SEARCH_CONFIG['max_jobs_per_search'])
-                
-                # Quick deduplication during collection
-                for job in jobs:
-                    job_id = extract_job_id_from_url(job['link'])
-                    base_key = f"{job['title'].lower()}|{job['company'].lower()}"
-                    
-                    if job_id not in job_urls_seen and base_key not in job_urls_seen:
-                        all_jobs.append(job)
-                        job_urls_seen.add(job_id or job['link'])
-                        job_urls_seen.add(base_key)
-                
-                time.sleep(random.uniform(12, 20))  # Increased delay for safety
-            except Exception as e:
-                print(f"❌ Error searching {job_type} in {location}: {e}")
-                continue
+                while not queue.is_finished(run_id):
+                    if time.monotonic() >= deadline:
+                        print(f"⏰ Run {run_id} not finished after {timeout}s, going on with what's done")
+                        break
+                    time.sleep(poll_seconds)
+            finally:
+                for worker in workers:
+                    worker.terminate()
+                    worker.wait()
+        
+        status = queue.status(run_id)
+        print(f"📋 Run {run_id}: {status['done']} pages done, {status['failed']} failed")
+        for keywords, location, page, error in queue.failures(run_id):
+            print(f"❌ Gave up on {keywords} in {location} page {page + 1}: {error}")
+        
+        results = queue.results(run_id)
     
+    all_jobs = record_query_results(planner, results, max_jobs)
+    
+    # Descriptions come out of this host's budget, shared with its queue workers
+    limiter = QueueRateLimiter.from_config(queue.path, SAFETY_CONFIG, get_queue_egress(SCRAPER_CONFIG))
+    try:
+        finish_daily_run(all_jobs, SEARCH_CONFIG, SCRAPER_CONFIG, SAFETY_CONFIG, OUTPUT_CONFIG, EMAIL_CONFIG,
+                         incremental, base_url, limiter=limiter)
+    finally:
+        limiter.close()
+
+def finish_daily_run(all_jobs, search_config, scraper_config, safety_config, output_config, email_config,
+                     incremental=False, base_url=None, profile=None, limiter=None):
+    """
+    Dedupe, filter, save, report and email a batch run's collected jobs (for
+    one profile); limiter is the run's, for fetching job descriptions
+    """
     if not all_jobs:
         print("❌ No jobs found in automated run")
         return
@@ -801,48 +1606,94 @@ def automated_daily_run():
     
     # ENHANCED DEDUPLICATION PROCESS
     # Step 1: Remove exact duplicates
-    unique_jobs = remove_duplicates(all_jobs)
+    with METRICS.timer('stage_seconds', stage='dedupe'):
+        unique_jobs = remove_duplicates(all_jobs)
     
     # Step 2: Remove similar jobs (optional, for very strict deduplication)
-    # unique_jobs = remove_similar_jobs(unique_jobs, similarity_threshold=0.90)
+    if scraper_config.get('remove_similar_jobs', False):
+        with METRICS.timer('stage_seconds', stage='similar'):
+            unique_jobs = remove_similar_jobs(unique_jobs, scraper_config.get('similarity_threshold', 0.90))
+    METRICS.inc('jobs_total', len(unique_jobs), stage='unique')
     
-    # Step 3: Apply your existing filters
-    filtered_jobs = filter_jobs(unique_jobs, SEARCH_CONFIG)
+    # Step 3: Drop jobs already reported in earlier runs (incremental mode)
+    seen_store = SeenJobsStore.from_config(scraper_config, get_job_key)
+    new_jobs, _ = seen_store.split_new(unique_jobs)
+    METRICS.inc('jobs_total', len(new_jobs), stage='new')
+    print(f"🆕 {len(new_jobs)} of {len(unique_jobs)} jobs not seen in earlier runs")
+    
+    if incremental:
+        if not new_jobs:
+            seen_store.mark_seen(unique_jobs)
+            seen_store.close()
+            print("✅ No new jobs since last run")
+            return
+        run_jobs = new_jobs
+    else:
+        run_jobs = unique_jobs
+    
+    # Step 4: Apply your existing filters
+    with METRICS.timer('stage_seconds', stage='filter'):
+        if scraper_config.get('batch_scoring', False):
+            # NumPy is only needed for the columnar scorer
+            from batch_scoring import filter_jobs_batch
+            filtered_jobs = filter_jobs_batch(run_jobs, search_config)
+        else:
+            filtered_jobs = filter_jobs(run_jobs, search_config)
+    METRICS.inc('jobs_total', len(filtered_jobs), stage='kept')
+    
+    # Step 5: Score job descriptions of the survivors (optional, one request per job)
+    if scraper_config.get('jd_enrichment', False):
+        with METRICS.timer('stage_seconds', stage='enrich'):
+            filtered_jobs = enrich_job_descriptions(filtered_jobs, search_config, scraper_config, safety_config,
+                                                    base_url, limiter)
     
     print(f"📊 Final job count: {len(filtered_jobs)} unique, relevant jobs")
     
     # Save results
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    csv_filename = f"{OUTPUT_CONFIG['csv_folder']}senior_jobs_{timestamp}.csv"
-    html_filename = f"{OUTPUT_CONFIG['html_folder']}senior_jobs_{timestamp}.html"
-    
-    os.makedirs(OUTPUT_CONFIG['csv_folder'], exist_ok=True)
-    os.makedirs(OUTPUT_CONFIG['html_folder'], exist_ok=True)
-    
-    save_to_csv(filtered_jobs, csv_filename)
-    create_html_report(filtered_jobs, html_filename, "Senior Product Management Jobs - India Focus")
-    
-    # Send enhanced email with HTML report link
-    email_sent = send_daily_job_email(
-        filtered_jobs,
-        EMAIL_CONFIG['sender_email'],
-        EMAIL_CONFIG['sender_password'], 
-        EMAIL_CONFIG['receiver_email'],
-        html_filename  # Pass HTML file path for the link
-    )
+    name = f"senior_jobs_{profile}_{timestamp}" if profile else f"senior_jobs_{timestamp}"
+    csv_filename = f"{output_config['csv_folder']}{name}.csv"
+    html_filename = f"{output_config['html_folder']}{name}.html"
     
-    print(f"📊 Daily run completed:")
-    print(f"   Found: {len(filtered_jobs)} senior-level jobs")
-    print(f"   CSV: {csv_filename}")
-    print(f"   HTML: {html_filename}")
-    print(f"   Email: {'✅ Sent with HTML link' if email_sent else '❌ Failed'}")
+    os.makedirs(output_config['csv_folder'], exist_ok=True)
+    os.makedirs(output_config['html_folder'], exist_ok=True)
+    
+    with METRICS.timer('stage_seconds', stage='save_csv'):
+        save_to_csv(filtered_jobs, csv_filename)
+    save_job_history(filtered_jobs, scraper_config)
+    with METRICS.timer('stage_seconds', stage='publish'):
+        email_sent = publish_daily_reports(filtered_jobs, html_filename, email_config)
+    
+    # Record everything scraped this run, after the reports went out
+    seen_store.mark_seen(unique_jobs)
+    seen_store.close()
+    
+    print_daily_summary(filtered_jobs, csv_filename, html_filename, email_sent)
 
 if __name__ == "__main__":
-    import sys
+    # Per-job lines (duplicates, skipped roles...) are debug output: pass --verbose to see them
+    logging.basicConfig(level=logging.DEBUG if "--verbose" in sys.argv else logging.INFO, format="%(message)s")
     
     if len(sys.argv) > 1 and sys.argv[1] == "daily":
+        from config import PROFILES
+        
         # Run automated daily job
-        automated_daily_run()
+        automated_daily_run(
+            concurrent=True if "--concurrent" in sys.argv else None,
+            incremental=True if "--incremental" in sys.argv else None,
+            streaming=True if "--streaming" in sys.argv else None,
+            scheduled=True if "--scheduled" in sys.argv else None,
+            base_url=sys.argv[sys.argv.index("--base-url") + 1] if "--base-url" in sys.argv else None,
+            profiles=PROFILES if "--profiles" in sys.argv else None,
+            queued=True if "--queued" in sys.argv else None,
+            run_id=sys.argv[sys.argv.index("--run-id") + 1] if "--run-id" in sys.argv else None
+        )
+    elif len(sys.argv) > 1 and sys.argv[1] == "worker":
+        # Fetch pages for queued runs (python mainV2.py daily --queued)
+        run_queue_worker(
+            base_url=sys.argv[sys.argv.index("--base-url") + 1] if "--base-url" in sys.argv else None,
+            queue_db=sys.argv[sys.argv.index("--queue-db") + 1] if "--queue-db" in sys.argv else None
+        )
     else:
         # Run test
         from config import SEARCH_CONFIG, OUTPUT_CONFIG
@@ -0,0 +1,164 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Prefix of every metric name in the Prometheus textfile
+METRIC_PREFIX = "linkedin_scraper"
+
+def _label_key(labels):
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+def _escape_label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_labels(key):
+    if not key:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in key) + "}"
+
+def _write_atomically(path, text):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+class BoundCounter:
+    """One labelled counter of a Metrics registry (see Metrics.bind)"""
+
+    __slots__ = ("metrics", "key")
+
+    def __init__(self, metrics, key):
+        self.metrics = metrics
+        self.key = key
+
+    def inc(self, value=1):
+        self.metrics._add(self.key, value)
+
+
+class Metrics:
+    """Counters and timing summaries for one run
+
+    Counters only go up (requests, bytes, dedup hits by rule, filter drops
+    by reason...); summaries keep count, sum and max of observed values
+    (seconds per page, cards per page, seconds per pipeline stage). Both
+    are keyed by name plus optional labels. Safe to update from the fetch
+    worker threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Start a new run: drop everything recorded so far"""
+        with self._lock:
+            self.counters = {}    # (name, labels) -> value
+            self.summaries = {}   # (name, labels) -> [count, sum, max]
+            self.started_at = time.time()
+
+    def inc(self, name, value=1, **labels):
+        self._add((name, _label_key(labels)), value)
+
+    def _add(self, key, value):
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def bind(self, name, **labels):
+        """A counter with its labels resolved once, for per-job hot loops"""
+        return BoundCounter(self, (name, _label_key(labels)))
+
+    def observe(self, name, value, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            summary = self.summaries.get(key)
+            if summary is None:
+                self.summaries[key] = [1, value, value]
+            else:
+                summary[0] += 1
+                summary[1] += value
+                if value > summary[2]:
+                    summary[2] = value
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Observe the wall time of a block in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def counter(self, name, **labels):
+        return self.counters.get((name, _label_key(labels)), 0)
+
+    def summary(self):
+        """Everything recorded this run as a JSON-friendly dict"""
+        with self._lock:
+            counters = sorted(self.counters.items())
+            summaries = sorted((key, list(value)) for key, value in self.summaries.items())
+
+        result = {
+            "started_at": self.started_at,
+            "duration_seconds": round(time.time() - self.started_at, 3),
+            "counters": {},
+            "summaries": {}
+        }
+        for (name, labels), value in counters:
+            result["counters"].setdefault(name, []).append({"labels": dict(labels), "value": value})
+        for (name, labels), (count, total, maximum) in summaries:
+            result["summaries"].setdefault(name, []).append({
+                "labels": dict(labels),
+                "count": count,
+                "sum": round(total, 6),
+                "max": round(maximum, 6)
+            })
+        return result
+
+    def prometheus_text(self):
+        """The run in Prometheus text exposition format (for node_exporter's textfile collector)"""
+        with self._lock:
+            counters = sorted(self.counters.items())
+            summaries = sorted((key, list(value)) for key, value in self.summaries.items())
+
+        # Every sample of a metric family has to follow its TYPE line as one group
+        families = {}
+
+        def sample(family, kind, line):
+            families.setdefault(family, (kind, []))[1].append(line)
+
+        for (name, labels), value in counters:
+            metric = f"{METRIC_PREFIX}_{name}"
+            sample(metric, "counter", f"{metric}{_format_labels(labels)} {value}")
+
+        for (name, labels), (count, total, maximum) in summaries:
+            metric = f"{METRIC_PREFIX}_{name}"
+            sample(metric, "summary", f"{metric}_count{_format_labels(labels)} {count}")
+            sample(metric, "summary", f"{metric}_sum{_format_labels(labels)} {total:.6f}")
+            sample(f"{metric}_max", "gauge", f"{metric}_max{_format_labels(labels)} {maximum:.6f}")
+
+        metric = f"{METRIC_PREFIX}_last_run_timestamp_seconds"
+        sample(metric, "gauge", f"{metric} {self.started_at:.0f}")
+
+        lines = []
+        for family, (kind, samples) in families.items():
+            lines.append(f"# TYPE {family} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+    def write(self, json_path=None, textfile_path=None):
+        """Write the JSON summary and/or the Prometheus textfile (atomically)"""
+        if json_path:
+            _write_atomically(json_path, json.dumps(self.summary(), indent=2) + "\n")
+        if textfile_path:
+            _write_atomically(textfile_path, self.prometheus_text())
+
+
+# Process-wide registry the pipeline records into
+METRICS = Metrics()
@@ -0,0 +1,309 @@
+import argparse
+import html
+import json
+import os
+import random
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+SEARCH_PATH = "/jobs-guest/jobs/api/seeMoreJobPostings/search"
+JOB_POSTING_PREFIX = "/jobs-guest/jobs/api/jobPosting/"
+STATS_PATH = "/stats"
+
+JOBS_PER_PAGE = 25
+
+COMPANIES = [
+    "Google", "Microsoft", "Flipkart", "Swiggy", "Zomato", "Razorpay", "PhonePe", "Paytm", "Meesho", "CRED",
+    "Atlassian", "Uber", "Freshworks", "Zoho", "Amazon", "Walmart Global Tech India", "Groww", "Zepto"
+]
+
+TITLE_QUALIFIERS = [
+    "", " - Payments", ", Growth", " (Platform)", " - AI", ", B2B SaaS", " - Consumer", " - Ads", ", Search",
+    " - Lending", ", Marketplace", " - Data Platform", ", Checkout", " - Onboarding", ", Developer Tools"
+]
+
+# Made-up employers on top of COMPANIES, so title+company pairs rarely repeat by chance like real results
+_NAME_PARTS = ["nova", "quant", "astra", "pixel", "kite", "lumen", "orbit", "terra", "vista", "apex", "nimbus",
+               "tidal", "zen", "blue", "swift", "delta"]
+_NAME_SUFFIXES = ["Technologies", "Labs", "Solutions", "Systems", "Analytics", "Software", "Networks"]
+EMPLOYERS = COMPANIES + [f"{first.title()}{second} {suffix}"
+                         for first in _NAME_PARTS for second in _NAME_PARTS[::3] for suffix in _NAME_SUFFIXES[:3]]
+
+CITIES = [
+    "Bengaluru, Karnataka, India", "Mumbai, Maharashtra, India", "Gurugram, Haryana, India",
+    "Hyderabad, Telangana, India", "New Delhi, Delhi, India", "Pune, Maharashtra, India"
+]
+
+DESCRIPTION_PHRASES = [
+    "Own the product roadmap and vision for a platform used by millions.",
+    "Drive go-to-market and launch coordination with sales and marketing.",
+    "Lead stakeholder management across engineering, design and business teams.",
+    "Define pricing strategy and build the business case for new bets.",
+    "Work on customer segmentation and market research with analytics.",
+    "Mentor a team of product managers and grow product leadership.",
+    "Partner with engineering on delivery, quality and technical debt.",
+    "Bring 10+ years of experience in consumer or B2B products."
+]
+
+def _stable_seed(*parts):
+    return zlib.crc32("|".join(parts).encode("utf-8"))
+
+def _slug(text):
+    return "-".join("".join(c if c.isalnum() else " " for c in text.lower()).split())
+
+
+class MockLinkedInServer:
+    """Local stand-in for LinkedIn's guest job search endpoints
+
+    Serves seeMoreJobPostings/search pages of realistic job cards for any
+    keywords/location/start, generated deterministically (the same query
+    always returns the same jobs) or cycled from fixture pages. A share of
+    each search's jobs come from a pool shared by every location with the
+    same keywords, so runs see the cross-search duplicates real runs do.
+    Latency, 429s (with Retry-After), 5xx errors and malformed card links
+    can be injected at configurable rates. jobPosting/<id> returns a job
+    description; /stats returns request counts by status as JSON.
+
+    Use it as a context manager and point the scraper at base_url.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, results_per_search=75, shared_share=0.3,
+                 latency_ms=0, latency_jitter_ms=0, rate_429=0.0, rate_5xx=0.0, malformed_href_rate=0.0,
+                 retry_after=1, fixture_dir=None, seed=0):
+        self.results_per_search = results_per_search
+        self.shared_share = shared_share
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.malformed_href_rate = malformed_href_rate
+        self.retry_after = retry_after
+        self.fixture_pages = self._load_fixtures(fixture_dir) if fixture_dir else None
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "statuses": {}, "cards": 0}
+
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @staticmethod
+    def _load_fixtures(fixture_dir):
+        pages = []
+        for name in sorted(os.listdir(fixture_dir)):
+            if name.endswith(".html"):
+                with open(os.path.join(fixture_dir, name), "rb") as f:
+                    pages.append(f.read())
+        return pages
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _count(self, status, cards=0):
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["statuses"][str(status)] = self.stats["statuses"].get(str(status), 0) + 1
+            self.stats["cards"] += cards
+
+    def _roll(self):
+        with self._lock:
+            return self._random.random()
+
+    def injected_fault(self):
+        """Status code to fail this request with, or None to serve it"""
+        roll = self._roll()
+        if roll < self.rate_429:
+            return 429
+        if roll < self.rate_429 + self.rate_5xx:
+            return (500, 502, 503)[int(roll * 1000) % 3]
+        return None
+
+    def delay(self):
+        if self.latency_ms or self.latency_jitter_ms:
+            time.sleep((self.latency_ms + self._roll() * self.latency_jitter_ms) / 1000)
+
+    def card_html(self, keywords, location, index):
+        """One search result card; position index of the (keywords, location) search"""
+        shared = _stable_seed("share", keywords, location, str(index)) % 1000 < self.shared_share * 1000
+        # Shared jobs are the same posting for every location searched with these keywords
+        key = ("shared", keywords, str(index)) if shared else ("own", keywords, location, str(index))
+        rng = random.Random(_stable_seed(*key))
+
+        job_id = 4000000000 + _stable_seed(*key) % 100000000
+        title = f"{keywords}{rng.choice(TITLE_QUALIFIERS)}"
+        company = rng.choice(EMPLOYERS)
+        job_location = rng.choice(CITIES) if "india" in location.lower() else location
+        # Sorted newest first, like sortBy=DD: later positions are older
+        minutes_old = int(index * (36 * 60) / max(self.results_per_search, 1)) + rng.randint(0, 30)
+        posted = datetime.now() - timedelta(minutes=minutes_old)
+        easy_apply = rng.random() < 0.3
+
+        href = f"https://in.linkedin.com/jobs/view/{_slug(title)}-at-{_slug(company)}-{job_id}" \
+               f"?position={index % JOBS_PER_PAGE + 1}&amp;pageNum=0&amp;refId=mock&amp;trackingId=mock"
+        if self._roll() < self.malformed_href_rate:
+            href = rng.choice([
+                f"/jobs/view/{_slug(title)}-{job_id}?refId=mock",
+                f"in.linkedin.com/jobs/view/{job_id}?trk=public_jobs",
+                f"https://www.linkedin.comhttps://in.linkedin.com/jobs/view/{job_id}"
+            ])
+
+        benefits = ('<div class="job-posting-benefits text-sm">'
+                    '<span class="job-posting-benefits__text">Easy Apply</span></div>') if easy_apply else ""
+        return f'''<li>
+    <div class="base-card relative w-full base-card--link base-search-card job-search-card" data-entity-urn="urn:li:jobPosting:{job_id}">
+      <a class="base-card__full-link absolute top-0 right-0 bottom-0 left-0 p-0 z-[2]" href="{href}" data-tracking-control-name="public_jobs_jserp-result_search-card">
+        <span class="sr-only">{html.escape(title)}</span>
+      </a>
+      <div class="base-search-card__info">
+        <h3 class="base-search-card__title">
+          {html.escape(title)}
+        </h3>
+        <h4 class="base-search-card__subtitle">
+          <a class="hidden-nested-link" href="https://in.linkedin.com/company/{_slug(company)}">{html.escape(company)}</a>
+        </h4>
+        <div class="base-search-card__metadata">
+          <span class="job-search-card__location">{html.escape(job_location)}</span>{benefits}
+          <time class="job-search-card__listdate" datetime="{posted.strftime('%Y-%m-%d')}">{minutes_old // 60} hours ago</time>
+        </div>
+      </div>
+    </div>
+  </li>
+'''
+
+    def search_page(self, keywords, location, start):
+        """(body, cards) of one results page"""
+        if self.fixture_pages is not None:
+            page = start // JOBS_PER_PAGE
+            if page >= len(self.fixture_pages):
+                return b"", 0
+            body = self.fixture_pages[page]
+            return body, body.count(b"<li")
+
+        end = min(start + JOBS_PER_PAGE, self.results_per_search)
+        cards = [self.card_html(keywords, location, index) for index in range(start, end)]
+        return "".join(cards).encode("utf-8"), len(cards)
+
+    def job_posting(self, job_id):
+        rng = random.Random(_stable_seed("posting", job_id))
+        paragraphs = "".join(f"<p>{phrase}</p>" for phrase in rng.sample(DESCRIPTION_PHRASES, 4))
+        return (f'<section class="description"><div class="show-more-less-html__markup">'
+                f'{paragraphs}</div></section>').encode("utf-8")
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+
+                if url.path == STATS_PATH:
+                    with server._lock:
+                        body = json.dumps(server.stats).encode("utf-8")
+                    self._send(200, body, "application/json")
+                    return
+
+                if url.path != SEARCH_PATH and not url.path.startswith(JOB_POSTING_PREFIX):
+                    server._count(404)
+                    self._send(404)
+                    return
+
+                server.delay()
+                fault = server.injected_fault()
+                if fault:
+                    server._count(fault)
+                    headers = {"Retry-After": str(server.retry_after)} if fault in (429, 503) else None
+                    self._send(fault, headers=headers)
+                    return
+
+                if url.path.startswith(JOB_POSTING_PREFIX):
+                    server._count(200)
+                    self._send(200, server.job_posting(url.path[len(JOB_POSTING_PREFIX):]))
+                    return
+
+                query = parse_qs(url.query)
+                try:
+                    start = int(query.get("start", ["0"])[0])
+                except ValueError:
+                    server._count(400)
+                    self._send(400)
+                    return
+
+                body, cards = server.search_page(query.get("keywords", [""])[0],
+                                                 query.get("location", [""])[0], start)
+                server._count(200, cards)
+                self._send(200, body)
+
+            def log_message(self, format, *args):
+                pass  # One line per request would drown the benchmark output
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for LinkedIn's guest job search endpoint")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--results-per-search", type=int, default=75, help="jobs each search has in total")
+    parser.add_argument("--shared-share", type=float, default=0.3,
+                        help="share of a search's jobs also returned for its keywords in other locations")
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0)
+    parser.add_argument("--rate-429", type=float, default=0.0, help="share of requests answered with 429")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="share of requests answered with 500/502/503")
+    parser.add_argument("--malformed-hrefs", type=float, default=0.0, help="share of cards with a broken link")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429/503")
+    parser.add_argument("--fixtures", help="serve these fixture pages (by start) instead of generated ones")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = MockLinkedInServer(
+        args.host, args.port, args.results_per_search, args.shared_share, args.latency_ms,
+        args.latency_jitter_ms, args.rate_429, args.rate_5xx, args.malformed_hrefs, args.retry_after,
+        args.fixtures, args.seed
+    )
+    print(f"🧪 Mock LinkedIn listening on {server.base_url}")
+    print(f"   Run the pipeline against it: python mainV2.py daily --concurrent --base-url {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"Served {server.stats['requests']} requests: {server.stats['statuses']}")
+
+
+if __name__ == "__main__":
+    main()
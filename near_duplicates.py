@@ -0,0 +1,153 @@
+from collections import Counter
+from difflib import SequenceMatcher
+
+from job_record import lowered
+
+# Weights of the title, company and location similarity in the overall score
+SIMILARITY_WEIGHTS = (0.6, 0.3, 0.1)
+
+# Keeps the lower bounds below from pruning a pair that only clears the
+# threshold by float rounding
+_BOUND_EPSILON = 1e-9
+
+
+class NearDuplicateIndex:
+    """Incremental near-duplicate detection for job listings
+
+    Finds a kept job above the threshold whenever the exhaustive scan over
+    every kept job (calculate_job_similarity) would, by only pruning pairs
+    that provably can't get there. With the other two components at 1.0,
+    the weights give the lowest title and company similarity a match can
+    have. Kept jobs are blocked by company; a new job's company is compared
+    once with each distinct kept company, and inside the blocks that can
+    still match, each distinct title once with each distinct kept title.
+    Both use the SequenceMatcher upper bounds (real_quick_ratio(),
+    quick_ratio()) before the real ratio, and only the surviving titles are
+    checked job by job with the weighted score, from cached ratios.
+    """
+
+    def __init__(self, similarity_threshold=0.85, weights=SIMILARITY_WEIGHTS):
+        self.similarity_threshold = similarity_threshold
+        self.weights = weights
+
+        title_weight, company_weight, location_weight = weights
+        self.min_title_similarity = (
+            (similarity_threshold - company_weight - location_weight) / title_weight - _BOUND_EPSILON
+        )
+        self.min_company_similarity = (
+            (similarity_threshold - title_weight - location_weight) / company_weight - _BOUND_EPSILON
+        )
+
+        self.companies = []           # kept companies in insertion order
+        self.company_candidates = {}  # company -> [companies checked, companies that may match]
+
+        self.blocks = {}              # company -> {title: [kept jobs]}
+        self.block_titles = {}        # company -> kept titles in insertion order
+        self.title_candidates = {}    # (company, title) -> [titles checked, titles that may match]
+        self._ratios = {}             # (a, b) -> SequenceMatcher(None, a, b).ratio()
+        self._reachable = {}          # (a, b, minimum) -> whether the ratio can reach minimum
+        self._char_counts = {}        # string -> Counter of its characters
+
+    def _ratio(self, a, b):
+        ratio = self._ratios.get((a, b))
+        if ratio is None:
+            ratio = SequenceMatcher(None, a, b).ratio()
+            self._ratios[(a, b)] = ratio
+        return ratio
+
+    def _counts(self, text):
+        counts = self._char_counts.get(text)
+        if counts is None:
+            counts = Counter(text)
+            self._char_counts[text] = counts
+        return counts
+
+    def _may_reach(self, a, b, minimum):
+        """Whether SequenceMatcher(None, a, b).ratio() can be at least minimum"""
+        key = (a, b, minimum)
+        reachable = self._reachable.get(key)
+        if reachable is not None:
+            return reachable
+
+        total = len(a) + len(b)
+        if not total or minimum <= 0:
+            reachable = True
+        # Same upper bounds as real_quick_ratio() and quick_ratio(), without
+        # building a SequenceMatcher for pairs they already rule out
+        elif 2.0 * min(len(a), len(b)) / total < minimum:
+            reachable = False
+        elif 2.0 * sum((self._counts(a) & self._counts(b)).values()) / total < minimum:
+            reachable = False
+        else:
+            reachable = self._ratio(a, b) >= minimum
+
+        self._reachable[key] = reachable
+        return reachable
+
+    def _candidates(self, entry, text, others, minimum):
+        # Only the others added since the last lookup need checking
+        for other in others[entry[0]:]:
+            total = len(text) + len(other)
+            # Length bound first: most pairs end here without a cache entry
+            if total and 2.0 * min(len(text), len(other)) / total < minimum:
+                continue
+            if self._may_reach(text, other, minimum):
+                entry[1].append(other)
+        entry[0] = len(others)
+        return entry[1]
+
+    def _candidate_companies(self, company):
+        """Kept companies whose blocks may hold a job similar to one at company"""
+        entry = self.company_candidates.get(company)
+        if entry is None:
+            entry = [0, []]
+            self.company_candidates[company] = entry
+        return self._candidates(entry, company, self.companies, self.min_company_similarity)
+
+    def _candidate_titles(self, company, title):
+        """Kept titles in a block that may still clear the threshold against title"""
+        entry = self.title_candidates.get((company, title))
+        if entry is None:
+            entry = [0, []]
+            self.title_candidates[(company, title)] = entry
+        return self._candidates(entry, title, self.block_titles[company], self.min_title_similarity)
+
+    def similarity(self, job1, job2):
+        """Same weighted score as calculate_job_similarity, from cached ratios"""
+        title_weight, company_weight, location_weight = self.weights
+        title_similarity = self._ratio(lowered(job1, 'title'), lowered(job2, 'title'))
+        company_similarity = self._ratio(lowered(job1, 'company'), lowered(job2, 'company'))
+        location_similarity = self._ratio(lowered(job1, 'location'), lowered(job2, 'location'))
+
+        return (title_similarity * title_weight +
+                company_similarity * company_weight +
+                location_similarity * location_weight)
+
+    def find_similar(self, job):
+        """Return (kept_job, similarity) for a kept job above the threshold, or None"""
+        title = lowered(job, 'title')
+
+        for company in self._candidate_companies(lowered(job, 'company')):
+            block = self.blocks[company]
+            for other_title in self._candidate_titles(company, title):
+                for existing_job in block[other_title]:
+                    similarity = self.similarity(job, existing_job)
+                    if similarity > self.similarity_threshold:
+                        return existing_job, similarity
+
+        return None
+
+    def add(self, job):
+        """Keep a job so later ones are compared against it"""
+        title = lowered(job, 'title')
+        company = lowered(job, 'company')
+
+        block = self.blocks.get(company)
+        if block is None:
+            block = self.blocks[company] = {}
+            self.block_titles[company] = []
+            self.companies.append(company)
+        if title not in block:
+            block[title] = []
+            self.block_titles[company].append(title)
+        block[title].append(job)
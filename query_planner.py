@@ -0,0 +1,154 @@
+import json
+import os
+import re
+
+# Spellings LinkedIn treats as the same place, mapped to one canonical word
+LOCATION_SYNONYMS = {
+    "bengaluru": "bangalore",
+    "new delhi": "delhi",
+    "gurugram": "gurgaon",
+    "bombay": "mumbai",
+    "madras": "chennai",
+    "calcutta": "kolkata"
+}
+
+_SYNONYM_PATTERN = re.compile(r"\b(" + "|".join(map(re.escape, LOCATION_SYNONYMS)) + r")\b")
+
+# Runs of history kept per query
+HISTORY_LENGTH = 10
+
+def normalize_keywords(keywords):
+    return " ".join(keywords.lower().split())
+
+def normalize_location(location):
+    """Canonical form of a search location ("Bengaluru, India" -> "bangalore, india")"""
+    location = " ".join(location.lower().split())
+    return _SYNONYM_PATTERN.sub(lambda match: LOCATION_SYNONYMS[match.group(1)], location)
+
+def query_key(keywords, location):
+    return f"{normalize_keywords(keywords)}|{normalize_location(location)}"
+
+
+class QueryPlan:
+    """Searches to run this time, and what was left out and why"""
+
+    def __init__(self, queries, merged, dropped, requests_saved):
+        self.queries = queries          # [(keywords, location)] to search, in config order
+        self.merged = merged            # [(query, query it duplicates)]
+        self.dropped = dropped          # [(query, overlap ratio)]
+        self.requests_saved = requests_saved
+
+    def summary(self, total):
+        return (f"🧭 Query plan: {len(self.queries)} of {total} searches "
+                f"({len(self.merged)} merged as synonyms, {len(self.dropped)} dropped for overlap), "
+                f"~{self.requests_saved} requests saved")
+
+
+class QueryPlanner:
+    """Plans the (job_type, location) searches of a run from past overlap
+
+    Synonymous searches ("Bangalore, India" / "Bengaluru, India") are merged
+    up front. After every run each search records how many jobs it returned,
+    how many of those no earlier search in the run had found, and roughly
+    how many pages it cost. Searches whose recent results were almost all
+    overlap are dropped; every probe_every runs they're searched again so
+    their history stays current.
+    """
+
+    def __init__(self, stats_path, max_overlap=0.95, min_runs=3, probe_every=7):
+        self.stats_path = stats_path
+        self.max_overlap = max_overlap
+        self.min_runs = min_runs
+        self.probe_every = probe_every
+        self.stats = self._load()
+
+    @classmethod
+    def from_config(cls, scraper_config):
+        """Build a planner from SCRAPER_CONFIG"""
+        return cls(
+            scraper_config.get("query_stats_path", "output/query_stats.json"),
+            max_overlap=scraper_config.get("max_query_overlap", 0.95),
+            min_runs=scraper_config.get("query_min_runs", 3),
+            probe_every=scraper_config.get("query_probe_every", 7)
+        )
+
+    def _load(self):
+        try:
+            with open(self.stats_path, encoding="utf-8") as f:
+                stats = json.load(f)
+        except (OSError, ValueError):
+            stats = {}
+        stats.setdefault("runs", 0)
+        stats.setdefault("queries", {})
+        return stats
+
+    def save(self):
+        """Write the stats file (atomically, a crash leaves the old one)"""
+        directory = os.path.dirname(self.stats_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temp_path = f"{self.stats_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.stats, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.stats_path)
+
+    def overlap(self, keywords, location):
+        """Share of a search's recent jobs that earlier searches already found, or None if too little history"""
+        history = self.stats["queries"].get(query_key(keywords, location), {}).get("history", [])
+        if len(history) < self.min_runs:
+            return None
+
+        found = sum(run[0] for run in history)
+        unique = sum(run[1] for run in history)
+        return 1.0 if found == 0 else 1 - unique / found
+
+    def average_pages(self, keywords, location, default):
+        history = self.stats["queries"].get(query_key(keywords, location), {}).get("history", [])
+        if not history:
+            return default
+        return sum(run[2] for run in history) / len(history)
+
+    def plan(self, job_types, locations, default_pages=1):
+        """Decide which searches of the job_types x locations grid to run"""
+        queries = []
+        merged = []
+        dropped = []
+        saved = 0.0
+        canonical = {}
+        probing = self.probe_every and self.stats["runs"] % self.probe_every == 0
+
+        for keywords in job_types:
+            for location in locations:
+                query = (keywords, location)
+                key = query_key(keywords, location)
+
+                if key in canonical:
+                    merged.append((query, canonical[key]))
+                    saved += self.average_pages(keywords, location, default_pages)
+                    continue
+                canonical[key] = query
+
+                overlap = self.overlap(keywords, location)
+                if not probing and overlap is not None and overlap >= self.max_overlap:
+                    dropped.append((query, overlap))
+                    saved += self.average_pages(keywords, location, default_pages)
+                    continue
+
+                queries.append(query)
+
+        if not queries and dropped:
+            # Never plan an empty run
+            queries.append(dropped.pop(0)[0])
+
+        return QueryPlan(queries, merged, dropped, round(saved))
+
+    def record(self, keywords, location, found, unique, pages):
+        """Add one run's result for a search (unique = jobs no earlier search had)"""
+        entry = self.stats["queries"].setdefault(query_key(keywords, location), {"history": []})
+        entry["history"] = (entry["history"] + [[found, unique, pages]])[-HISTORY_LENGTH:]
+
+    def finish_run(self):
+        """Count the run and save the stats"""
+        self.stats["runs"] += 1
+        self.save()
@@ -0,0 +1,143 @@
+import heapq
+import json
+import os
+import time
+
+from query_planner import query_key
+
+# Weight of older observations each time a (search, page) yield is updated
+YIELD_DECAY = 0.8
+
+# Without history, a deeper page is expected to bring this share of the
+# new jobs the previous page of the same search brought
+DEEPER_PAGE_DISCOUNT = 0.5
+
+
+class QueryScheduler:
+    """Decides which result page to fetch next under a request budget
+
+    Every search gets its first page before any search gets a second one;
+    first pages are ordered by their historical yield, with searches that
+    have no history first so they get measured. After that, deeper pages
+    compete on a heap by expected yield: new unique jobs per request, from
+    that search's (decayed) history at that page depth, or a discounted
+    estimate from the page before it. Scheduling stops at the request
+    budget or the deadline, whichever comes first.
+    """
+
+    def __init__(self, queries, stats_path, request_budget=None, deadline_seconds=None, max_pages=3):
+        self.queries = list(queries)
+        self.stats_path = stats_path
+        self.request_budget = request_budget
+        self.max_pages = max_pages
+        self.deadline = time.monotonic() + deadline_seconds if deadline_seconds else None
+        self.stats = self._load()
+
+        self.requests = 0        # network requests issued (cached pages are refunded)
+        self.new_jobs = 0
+        self.pages = {query: 0 for query in self.queries}  # pages fetched per search
+        self.deeper_pages = 0
+        self._sequence = 0       # heap tie-breaker, keeps equal yields in config order
+        self._deeper = []        # heap of (-expected yield, sequence, query, page)
+
+        first_pages = sorted(
+            self.queries,
+            key=lambda query: -self._history_yield(query, 0, float("inf"))
+        )
+        self._first_pages = [(query, 0) for query in first_pages]
+        self._first_pages.reverse()  # popped from the end
+
+    @classmethod
+    def from_config(cls, queries, scraper_config, max_pages=None):
+        """
+        Build a scheduler for queries from SCRAPER_CONFIG; max_pages (the
+        pages the searches' max_jobs need) caps scheduler_max_pages
+        """
+        depth = scraper_config.get("scheduler_max_pages", 3)
+        return cls(
+            queries,
+            scraper_config.get("query_yield_path", "output/query_yield.json"),
+            request_budget=scraper_config.get("request_budget"),
+            deadline_seconds=scraper_config.get("search_deadline_seconds"),
+            max_pages=min(depth, max_pages) if max_pages is not None else depth
+        )
+
+    def _load(self):
+        try:
+            with open(self.stats_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        """Write the yield history (atomically, a crash leaves the old file)"""
+        directory = os.path.dirname(self.stats_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temp_path = f"{self.stats_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.stats, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.stats_path)
+
+    def _history_yield(self, query, page, default=None):
+        entry = self.stats.get(query_key(*query), {}).get(str(page))
+        if not entry or entry[0] <= 0:
+            return default
+        requests, new_jobs = entry
+        return new_jobs / requests
+
+    def _exhausted(self):
+        if self.request_budget is not None and self.requests >= self.request_budget:
+            return True
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def next_request(self):
+        """(query, page) to fetch next, or None when the budget, deadline or work runs out"""
+        if self._exhausted():
+            return None
+
+        if self._first_pages:
+            task = self._first_pages.pop()
+        elif self._deeper:
+            _, _, query, page = heapq.heappop(self._deeper)
+            task = (query, page)
+            self.deeper_pages += 1
+        else:
+            return None
+
+        self.requests += 1
+        return task
+
+    def has_pending(self):
+        return bool(self._first_pages or self._deeper)
+
+    def record_page(self, query, page, new_jobs, from_cache=False, more_pages=True):
+        """
+        Record a fetched page: new_jobs it added to the run, whether it came
+        from the cache (no request spent) and whether paging further is
+        still worthwhile. Queues the next page of the search if so.
+        """
+        self.pages[query] += 1
+        if from_cache:
+            self.requests -= 1
+        else:
+            entry = self.stats.setdefault(query_key(*query), {}).setdefault(str(page), [0.0, 0.0])
+            entry[0] = entry[0] * YIELD_DECAY + 1
+            entry[1] = entry[1] * YIELD_DECAY + new_jobs
+        self.new_jobs += new_jobs
+
+        if more_pages and page + 1 < self.max_pages:
+            expected = self._history_yield(query, page + 1, new_jobs * DEEPER_PAGE_DISCOUNT)
+            heapq.heappush(self._deeper, (-expected, self._sequence, query, page + 1))
+            self._sequence += 1
+
+    def record_failure(self, query, page):
+        """A fetch or parse that failed spends the request but says nothing about the search's yield"""
+        self.pages[query] += 1
+
+    def summary(self):
+        budget = self.request_budget if self.request_budget is not None else "unlimited"
+        per_request = self.new_jobs / self.requests if self.requests else 0
+        return (f"📈 Scheduled {self.requests} requests (budget {budget}): {self.new_jobs} new jobs, "
+                f"{per_request:.1f} per request, {self.deeper_pages} deeper pages")
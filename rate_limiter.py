@@ -0,0 +1,55 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe token bucket shared by every request in a run"""
+
+    def __init__(self, max_requests_per_minute, min_delay_between_searches=0, burst=1):
+        # A rate of 0/None disables the bucket (useful for local testing)
+        self.rate = (max_requests_per_minute or 0) / 60.0
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.min_delay_between_searches = min_delay_between_searches or 0
+        self.last_refill = time.monotonic()
+        self.last_search_started = None
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, safety_config):
+        """Build a limiter from SAFETY_CONFIG"""
+        return cls(
+            safety_config.get("max_requests_per_minute", 0),
+            safety_config.get("min_delay_between_searches", 0)
+        )
+
+    def _refill(self, now):
+        if self.rate > 0:
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def acquire(self, new_search=False):
+        """Block until a request may be sent
+
+        new_search marks the first page of a (keywords, location) search, which
+        must also respect min_delay_between_searches.
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                wait = 0.0
+                if self.rate > 0 and self.tokens < 1:
+                    wait = (1 - self.tokens) / self.rate
+                if new_search and self.last_search_started is not None:
+                    wait = max(wait, self.last_search_started + self.min_delay_between_searches - now)
+
+                if wait <= 0:
+                    if self.rate > 0:
+                        self.tokens -= 1
+                    if new_search:
+                        self.last_search_started = now
+                    return
+
+            time.sleep(wait)
@@ -0,0 +1,421 @@
+import os
+from datetime import datetime
+from functools import lru_cache
+from html import escape
+
+from top_k import TopK, freshness_key
+
+# Number of jobs listed in the daily email
+EMAIL_TOP_JOBS = 30
+
+# Report sections, in the order categorize_jobs returns them
+REPORT_CATEGORIES = ('senior', 'mid_level', 'entry_level', 'remote', 'other')
+
+EASY_APPLY_BADGE = '<span class="easy-apply">✅ Easy Apply</span>'
+
+REPORT_TIME_BADGES = (
+    (6, '<span style="background: #28a745; color: white; padding: 2px 8px; border-radius: 12px; font-size: 11px; margin-left: 5px;">🔥 {hours}h ago</span>'),
+    (12, '<span style="background: #ffc107; color: black; padding: 2px 8px; border-radius: 12px; font-size: 11px; margin-left: 5px;">⚡ {hours}h ago</span>'),
+    (None, '<span style="background: #6c757d; color: white; padding: 2px 8px; border-radius: 12px; font-size: 11px; margin-left: 5px;">🕒 {hours}h ago</span>')
+)
+
+EMAIL_TIME_BADGES = (
+    (6, "job fresh-job", '<span style="background: #28a745; color: white; padding: 2px 6px; border-radius: 12px; font-size: 11px;">🔥 {hours}h ago</span>'),
+    (12, "job fresh-job", '<span style="background: #ffc107; color: black; padding: 2px 6px; border-radius: 12px; font-size: 11px;">⚡ {hours}h ago</span>'),
+    (None, "job", '<span style="background: #6c757d; color: white; padding: 2px 6px; border-radius: 12px; font-size: 11px;">🕒 {hours}h ago</span>')
+)
+
+
+# Templates are f-string functions, so Python compiles them once at import
+
+def report_head_html(title, generated_on, total_jobs, senior, mid_level, entry_level, remote):
+    """Page head, styles and category counts of the HTML report"""
+    return f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>{title}</title>
+        <meta charset="UTF-8">
+        <style>
+            body {{ 
+                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;
+                line-height: 1.6;
+                max-width: 1200px;
+                margin: 0 auto;
+                padding: 20px;
+                background-color: #f8f9fa;
+            }}
+            .header {{
+                background: linear-gradient(135deg, #0077b5, #00a0dc);
+                color: white;
+                padding: 30px;
+                border-radius: 10px;
+                margin-bottom: 30px;
+                text-align: center;
+            }}
+            .stats {{
+                display: flex;
+                justify-content: space-around;
+                margin: 20px 0;
+                flex-wrap: wrap;
+            }}
+            .stat-box {{
+                background: white;
+                padding: 15px;
+                border-radius: 8px;
+                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+                margin: 5px;
+                text-align: center;
+                min-width: 120px;
+            }}
+            .category {{
+                margin: 30px 0;
+            }}
+            .category-title {{
+                color: #0077b5;
+                border-bottom: 2px solid #0077b5;
+                padding-bottom: 10px;
+                margin-bottom: 20px;
+            }}
+            .job {{
+                background: white;
+                border: 1px solid #e1e5e9;
+                margin: 15px 0;
+                padding: 20px;
+                border-radius: 8px;
+                box-shadow: 0 2px 4px rgba(0,0,0,0.05);
+                transition: box-shadow 0.3s ease;
+            }}
+            .job:hover {{
+                box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+            }}
+            .job-title {{
+                color: #0077b5;
+                font-weight: bold;
+                font-size: 18px;
+                margin-bottom: 8px;
+            }}
+            .job-title a {{
+                color: #0077b5;
+                text-decoration: none;
+            }}
+            .job-title a:hover {{
+                text-decoration: underline;
+            }}
+            .company {{
+                color: #666;
+                font-weight: 500;
+                margin-bottom: 5px;
+            }}
+            .location {{
+                color: #888;
+                font-size: 14px;
+                margin-bottom: 5px;
+            }}
+            .date {{
+                color: #999;
+                font-size: 12px;
+            }}
+            .easy-apply {{
+                background: #28a745;
+                color: white;
+                padding: 4px 8px;
+                border-radius: 4px;
+                font-size: 12px;
+                margin-left: 10px;
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="header">
+            <h1>{title}</h1>
+            <p>Generated on {generated_on}</p>
+        </div>
+        
+        <div class="stats">
+            <div class="stat-box">
+                <h3>{total_jobs}</h3>
+                <p>Total Jobs</p>
+            </div>
+            <div class="stat-box">
+                <h3>{senior}</h3>
+                <p>Senior Level</p>
+            </div>
+            <div class="stat-box">
+                <h3>{mid_level}</h3>
+                <p>Mid Level</p>
+            </div>
+            <div class="stat-box">
+                <h3>{entry_level}</h3>
+                <p>Entry Level</p>
+            </div>
+            <div class="stat-box">
+                <h3>{remote}</h3>
+                <p>Remote</p>
+            </div>
+        </div>
+    """
+
+
+def report_category_html(category_title, count):
+    return f"""
+            <div class="category">
+                <h2 class="category-title">{category_title} Jobs ({count})</h2>
+            """
+
+
+def report_job_html(link, title, time_badge, easy_apply_badge, company, location, date_posted):
+    return f"""
+                <div class="job">
+                    <div class="job-title">
+                        <a href="{link}" target="_blank">{title}</a>
+                        {time_badge}
+                        {easy_apply_badge}
+                    </div>
+                    <div class="company">{company}</div>
+                    <div class="location">📍 {location}</div>
+                    <div class="date">🕒 Posted: {date_posted}</div>
+                </div>
+                """
+
+
+REPORT_END = """
+    </body>
+    </html>
+    """
+
+
+def email_head_html(top_count, sent_on, remaining_note, file_url, total_jobs, report_filename):
+    """Styles, header and report link of the daily email"""
+    return f"""
+    <html>
+    <head>
+        <style>
+            body {{ font-family: Arial, sans-serif; line-height: 1.6; margin: 0; padding: 20px; }}
+            .header {{ background: #0077b5; color: white; padding: 20px; text-align: center; border-radius: 8px; }}
+            .report-link {{ 
+                background: #28a745; 
+                color: white; 
+                padding: 20px; 
+                text-align: center; 
+                border-radius: 8px; 
+                margin: 20px 0;
+                border: none;
+            }}
+            .report-link a {{ 
+                color: white; 
+                text-decoration: none; 
+                font-weight: bold; 
+                font-size: 18px;
+                display: block;
+            }}
+            .job {{ border: 1px solid #ddd; margin: 10px 0; padding: 15px; border-radius: 5px; }}
+            .job-title {{ color: #0077b5; font-weight: bold; font-size: 16px; margin-bottom: 5px; }}
+            .company {{ color: #666; margin: 5px 0; }}
+            .fresh-job {{ background-color: #e8f4f8; }}
+            .easy-apply {{ background: #0077b5; color: white; padding: 4px 8px; border-radius: 4px; font-size: 12px; }}
+        </style>
+    </head>
+    <body>
+        <div class="header">
+            <h2>🎯 Daily Senior Product Management Jobs</h2>
+            <p>Top {top_count} opportunities (sorted by posting time)</p>
+            <p>{sent_on}</p>
+            {remaining_note}
+        </div>
+        
+        <div class="report-link">
+            <a href="{file_url}" target="_blank">
+                📊 CLICK HERE: View Complete Report ({total_jobs} jobs)
+            </a>
+            <p style="margin: 10px 0 0 0; font-size: 14px;">
+                File: {report_filename}
+            </p>
+        </div>
+        
+        <h3 style="color: #0077b5; border-bottom: 2px solid #0077b5; padding-bottom: 5px;">
+            🕒 Latest Jobs (Sorted by Posting Time - Earliest First)
+        </h3>
+    """
+
+
+def email_job_html(job_class, rank, link, title, company, location, time_badge, easy_apply_badge):
+    return f"""
+        <div class="{job_class}">
+            <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+                <div style="flex: 1;">
+                    <div class="job-title">
+                        {rank}. <a href="{link}" target="_blank">{title}</a>
+                    </div>
+                    <div class="company">🏢 {company}</div>
+                    <div style="color: #888; font-size: 14px;">📍 {location}</div>
+                </div>
+                <div style="text-align: right;">
+                    {time_badge}
+                    <br>
+                    {easy_apply_badge}
+                </div>
+            </div>
+        </div>
+        """
+
+
+EMAIL_END = """
+        <div style="margin-top: 30px; padding: 20px; background: #f8f9fa; text-align: center; border-radius: 8px;">
+            <p><strong>📊 Don't forget to check the complete HTML report above for all jobs!</strong></p>
+            <p><em>Sent automatically by your LinkedIn Job Scraper</em></p>
+            <p style="font-size: 12px; color: #666;">Happy job hunting! 🚀</p>
+        </div>
+    </body>
+    </html>
+    """
+
+
+@lru_cache(maxsize=16384)
+def _escape_repeated(text):
+    """html.escape for values shared by many jobs (title, company, location, date)"""
+    return escape(str(text))
+
+
+def _is_hours(value):
+    return isinstance(value, (int, float))
+
+
+@lru_cache(maxsize=1024, typed=True)
+def report_time_badge(hours_old):
+    """Freshness badge of a report card, rendered once per distinct age"""
+    if not _is_hours(hours_old):
+        return ''
+    for limit, badge in REPORT_TIME_BADGES:
+        if limit is None or hours_old <= limit:
+            return badge.format(hours=hours_old)
+
+
+@lru_cache(maxsize=1024, typed=True)
+def email_time_badge(hours_ago):
+    """(css class, freshness badge) of an email entry, rendered once per distinct age"""
+    for limit, job_class, badge in EMAIL_TIME_BADGES:
+        if limit is None or (_is_hours(hours_ago) and hours_ago <= limit):
+            return job_class, badge.format(hours=escape(str(hours_ago)))
+
+
+def render_report_job(job):
+    return report_job_html(
+        escape(job['link']),
+        _escape_repeated(job['title']),
+        report_time_badge(job.get('hours_since_posted', 'Unknown')),
+        EASY_APPLY_BADGE if job.get('easy_apply', False) else '',
+        _escape_repeated(job['company']),
+        _escape_repeated(job['location']),
+        _escape_repeated(job['date_posted'])
+    )
+
+
+def render_email_job(rank, job):
+    job_class, time_badge = email_time_badge(job.get('hours_since_posted', 'Unknown'))
+    return email_job_html(
+        job_class,
+        rank,
+        escape(job['link']),
+        _escape_repeated(job['title']),
+        _escape_repeated(job['company']),
+        _escape_repeated(job['location']),
+        time_badge,
+        EASY_APPLY_BADGE if job.get('easy_apply', False) else ''
+    )
+
+
+def _report_link(html_report_path):
+    # Convert file path to proper format for email link
+    if html_report_path:
+        # Convert Windows path to file URL
+        file_path = html_report_path.replace('\\', '/').replace(' ', '%20')
+        return f"file:///{file_path}", os.path.basename(html_report_path)
+    return "#", "report.html"
+
+
+def write_report(write, title, category_fragments, total_jobs, generated_at=None):
+    """Write a report from cards already rendered per category"""
+    generated_at = generated_at or datetime.now()
+    counts = {name: len(fragments) for name, fragments in category_fragments.items()}
+
+    write(report_head_html(
+        title=escape(title),
+        generated_on=generated_at.strftime('%B %d, %Y at %I:%M %p'),
+        total_jobs=total_jobs,
+        senior=counts.get('senior', 0),
+        mid_level=counts.get('mid_level', 0),
+        entry_level=counts.get('entry_level', 0),
+        remote=counts.get('remote', 0)
+    ))
+
+    # Add jobs by category
+    for category_name, fragments in category_fragments.items():
+        if fragments:
+            write(report_category_html(
+                category_title=category_name.replace('_', ' ').title(),
+                count=len(fragments)
+            ))
+            for fragment in fragments:
+                write(fragment)
+            write("</div>")
+
+    write(REPORT_END)
+
+
+def render_email(top_jobs, total_jobs, html_report_path=None, sent_at=None):
+    """HTML body of the daily email for jobs already selected and ordered"""
+    sent_at = sent_at or datetime.now()
+    remaining_count = max(0, total_jobs - len(top_jobs))
+    file_url, report_filename = _report_link(html_report_path)
+
+    fragments = [email_head_html(
+        top_count=len(top_jobs),
+        sent_on=sent_at.strftime('%B %d, %Y'),
+        remaining_note=f'<p style="font-size: 14px;">({remaining_count} more jobs in full report)</p>' if remaining_count > 0 else '',
+        file_url=escape(file_url),
+        total_jobs=total_jobs,
+        report_filename=escape(report_filename)
+    )]
+
+    # Add jobs sorted by time
+    for rank, job in enumerate(top_jobs, 1):
+        fragments.append(render_email_job(rank, job))
+
+    fragments.append(EMAIL_END)
+    return ''.join(fragments)
+
+
+def select_email_jobs(jobs, n=EMAIL_TOP_JOBS):
+    """Jobs for the email: earliest posted first, ties kept in ranking order"""
+    earliest = TopK(n, freshness_key)
+    for job in jobs:
+        earliest.push(job)
+    return earliest.items()
+
+
+def render_report(jobs, categorize, write, title="LinkedIn Jobs Report"):
+    """Write the full HTML report; categorize(job) names a job's section"""
+    category_fragments = {name: [] for name in REPORT_CATEGORIES}
+    for job in jobs:
+        category_fragments[categorize(job)].append(render_report_job(job))
+
+    write_report(write, title, category_fragments, len(jobs))
+
+
+def render_report_and_email(jobs, categorize, write, title="LinkedIn Jobs Report", html_report_path=None):
+    """
+    Write the full report and return the email body from one pass over jobs.
+
+    Each job is categorized, rendered into its report section and offered to
+    the bounded heap that picks the email's earliest-posted jobs.
+    """
+    category_fragments = {name: [] for name in REPORT_CATEGORIES}
+    earliest = TopK(EMAIL_TOP_JOBS, freshness_key)
+
+    for job in jobs:
+        category_fragments[categorize(job)].append(render_report_job(job))
+        earliest.push(job)
+
+    write_report(write, title, category_fragments, len(jobs))
+    return render_email(earliest.items(), len(jobs), html_report_path)
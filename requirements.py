@@ -1,3 +1,4 @@
 requests>=2.25.1
 beautifulsoup4>=4.9.3
 lxml>=4.6.3
+numpy>=1.20.0
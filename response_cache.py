@@ -0,0 +1,122 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+
+class ResponseCache:
+    """On-disk TTL cache for search result pages
+
+    Bodies are zlib-compressed in a single SQLite file, keyed on the
+    normalized request parameters. Entries expire after ttl_seconds and the
+    least recently used ones are evicted once the file holds more than
+    max_bytes of compressed bodies.
+    """
+
+    def __init__(self, path, ttl_seconds=3600, max_bytes=50 * 1024 * 1024, compress_level=6):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self.lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)")
+        self.purge_expired()
+
+    @classmethod
+    def from_config(cls, scraper_config):
+        """Build a cache from SCRAPER_CONFIG"""
+        return cls(
+            scraper_config.get("cache_path", "output/cache/responses.sqlite3"),
+            ttl_seconds=scraper_config.get("cache_ttl_seconds", 3600),
+            max_bytes=int(scraper_config.get("cache_max_mb", 50) * 1024 * 1024)
+        )
+
+    @staticmethod
+    def make_key(url, params=None):
+        """Stable key for a request: URL plus normalized, sorted parameters"""
+        normalized = []
+        for name, value in sorted((params or {}).items()):
+            if isinstance(value, str):
+                # Case and whitespace don't change LinkedIn's results
+                value = " ".join(value.split()).lower()
+            normalized.append([name, value])
+
+        raw = json.dumps([url, normalized], separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Return the cached body, or None if missing or expired"""
+        now = time.time()
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT body, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            body, stored_at = row
+            if now - stored_at > self.ttl_seconds:
+                self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.conn.commit()
+                return None
+
+            self.conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+
+        return zlib.decompress(body)
+
+    def put(self, key, body):
+        """Store a body and evict least recently used entries over the size cap"""
+        compressed = zlib.compress(body, self.compress_level)
+        now = time.time()
+
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, size, stored_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, compressed, len(compressed), now, now)
+            )
+            self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        victims = []
+        for key, size in self.conn.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC"):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+
+        self.conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+
+    def purge_expired(self):
+        """Drop every entry older than the TTL"""
+        with self.lock:
+            self.conn.execute("DELETE FROM responses WHERE stored_at < ?", (time.time() - self.ttl_seconds,))
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,57 @@
+import csv
+import os
+
+from job_record import Job
+
+
+class StreamingCSVWriter:
+    """Append-only CSV writer for a run that's still in progress
+
+    Rows are written and flushed one by one with a fixed header (every Job
+    field), so whatever made it through the pipeline before a crash is on
+    disk and readable. A file left behind by an earlier run is appended to
+    without repeating the header.
+    """
+
+    def __init__(self, filename, fieldnames=Job.FIELDS):
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.filename = filename
+        self.rows_written = 0
+        self.file = open(filename, 'a', newline='', encoding='utf-8')
+        self.writer = csv.DictWriter(self.file, fieldnames=fieldnames, extrasaction='ignore')
+        if self.file.tell() == 0:
+            self.writer.writeheader()
+            self.file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, job):
+        self.writer.writerow(job)
+        self.file.flush()
+        self.rows_written += 1
+
+    def close(self):
+        self.file.close()
+
+
+def write_csv_atomically(jobs, filename, fieldnames=Job.FIELDS):
+    """Write a complete CSV next to filename, then move it into place"""
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    temp_filename = f"{filename}.tmp"
+    with open(temp_filename, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(jobs)
+    os.replace(temp_filename, filename)
+
+    print(f"Saved {len(jobs)} jobs to {filename}")
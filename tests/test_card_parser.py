@@ -0,0 +1,60 @@
+import glob
+import os
+import sys
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from card_parser import lxml, parse_cards_bs4, parse_cards_lxml
+
+FIXTURES = sorted(glob.glob(os.path.join(REPO_DIR, "benchmarks", "fixtures", "*.html")))
+
+pytestmark = pytest.mark.skipif(lxml is None, reason="lxml not installed")
+
+
+def without_scraped_at(jobs):
+    return [{field: value for field, value in job.items() if field != "scraped_at"} for job in jobs]
+
+
+def assert_same_jobs(content, max_jobs=None):
+    expected = parse_cards_bs4(content, "Product Manager", "India", max_jobs)
+    assert expected
+    assert without_scraped_at(parse_cards_lxml(content, "Product Manager", "India", max_jobs)) == \
+        without_scraped_at(expected)
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=os.path.basename)
+def test_lxml_matches_bs4_on_fixtures(path):
+    with open(path, "rb") as f:
+        content = f.read()
+    assert_same_jobs(content)
+    assert_same_jobs(content.decode("utf-8"))
+    assert_same_jobs(content, max_jobs=5)
+
+
+@pytest.mark.filterwarnings("ignore::bs4.XMLParsedAsHTMLWarning")
+@pytest.mark.parametrize("declaration", ['<?xml version="1.0" encoding="utf-8"?>\n', '<?xml version="1.0"?>\n'])
+def test_lxml_matches_bs4_on_xml_declared_pages(declaration):
+    with open(FIXTURES[0], encoding="utf-8") as f:
+        page = declaration + f.read()
+
+    assert_same_jobs(page)
+    assert_same_jobs(page.encode("utf-8"))
+
+
+@pytest.mark.parametrize("content", ["", "  \n", b"", "<!-- no results -->"])
+def test_empty_pages_have_no_cards(content):
+    assert parse_cards_lxml(content, "Product Manager", "India") == []
+    assert parse_cards_bs4(content, "Product Manager", "India") == []
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "latin-1"])
+def test_lxml_matches_bs4_on_non_ascii_pages(encoding):
+    with open(FIXTURES[0], encoding="utf-8") as f:
+        page = f.read()
+    content = page.replace("Zoho", "Café Zoho").encode(encoding)
+
+    assert_same_jobs(content)
+    assert "Café Zoho" in [job["company"] for job in parse_cards_lxml(content, "Product Manager", "India")]
@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from jd_enrichment import extract_description
+
+DESCRIPTION = '<div class="show-more-less-html__markup"><p>Own the Café roadmap</p><ul><li>Payments</li></ul></div>'
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "iso-8859-1"])
+def test_description_text_survives_page_encoding(encoding):
+    page = (f'<html><head><meta charset="{encoding}"></head>'
+            f'<body><section>{DESCRIPTION}</section></body></html>')
+
+    assert extract_description(page) == "Own the Café roadmap Payments"
+    assert extract_description(page.encode(encoding)) == "Own the Café roadmap Payments"
+
+
+def test_xml_declared_page_keeps_its_description():
+    page = f'<?xml version="1.0" encoding="utf-8"?><html><body>{DESCRIPTION}</body></html>'
+
+    assert extract_description(page) == "Own the Café roadmap Payments"
+    assert extract_description(page.encode("utf-8")) == "Own the Café roadmap Payments"
+
+
+@pytest.mark.parametrize("content", ["", b"  ", "<html><body><p>Job closed</p></body></html>"])
+def test_missing_description_is_empty(content):
+    assert extract_description(content) == ""
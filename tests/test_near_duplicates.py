@@ -0,0 +1,49 @@
+import os
+import sys
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, os.path.join(REPO_DIR, "benchmarks"))
+
+from mainV2 import calculate_job_similarity, remove_similar_jobs
+from near_duplicates import NearDuplicateIndex
+from synthetic_jobs import make_jobs
+
+
+def exhaustive_remove_similar_jobs(jobs, similarity_threshold):
+    """The quadratic loop remove_similar_jobs used before NearDuplicateIndex"""
+    unique_jobs = []
+    for job in jobs:
+        if not any(calculate_job_similarity(job, existing_job) > similarity_threshold
+                   for existing_job in unique_jobs):
+            unique_jobs.append(job)
+    return unique_jobs
+
+
+@pytest.mark.parametrize("count, seed, threshold", [(400, 1, 0.85), (400, 2, 0.85), (200, 0, 0.9), (200, 0, 0.6)])
+def test_index_keeps_the_same_jobs_as_the_exhaustive_scan(count, seed, threshold):
+    jobs = make_jobs(count, seed=seed)
+    kept = remove_similar_jobs(jobs, threshold)
+    expected = exhaustive_remove_similar_jobs(jobs, threshold)
+    assert [id(job) for job in kept] == [id(job) for job in expected]
+
+
+@pytest.mark.parametrize("company, other_company", [
+    ("Astraquant Analytics", "Vistaquant Solutions"),
+    ("Lumenpixel Software", "Lumenapex Labs"),
+    ("Google India Pvt Ltd", "Orbitkite Pvt Ltd"),
+])
+def test_index_finds_pairs_across_company_spellings(company, other_company):
+    job = {"title": "Senior Product Manager", "company": company, "location": "Bengaluru, Karnataka, India"}
+    other_job = dict(job, company=other_company)
+
+    index = NearDuplicateIndex(0.85)
+    index.add(other_job)
+    match = index.find_similar(job)
+
+    if calculate_job_similarity(job, other_job) > 0.85:
+        assert match == (other_job, calculate_job_similarity(job, other_job))
+    else:
+        assert match is None
@@ -0,0 +1,77 @@
+import copy
+import os
+import sys
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, os.path.join(REPO_DIR, "benchmarks"))
+
+import config
+import mainV2
+from e2e_daily_run import isolate_outputs
+from mock_linkedin_server import MockLinkedInServer
+from query_planner import QueryPlanner
+
+# Two people searching overlapping locations: every Mumbai job also shows up for India
+PROFILES = {
+    "india": {"search": {"job_types": ["Director of Product"], "locations": ["India"], "max_jobs_per_search": 50}},
+    "mumbai": {"search": {"job_types": ["Director of Product"], "locations": ["Mumbai, India"],
+                          "max_jobs_per_search": 50}},
+}
+
+
+@pytest.fixture
+def profile_runs(tmp_path, monkeypatch):
+    """Runs profiles against the mock server, returns {profile: links of the jobs it collected}"""
+    configs = (config.SEARCH_CONFIG, config.OUTPUT_CONFIG, config.SAFETY_CONFIG, config.SCRAPER_CONFIG)
+    saved = [copy.deepcopy(settings) for settings in configs]
+    config.SAFETY_CONFIG.update(max_requests_per_minute=0, min_delay_between_searches=0)
+    config.SCRAPER_CONFIG.update(query_planning=False, parse_processes=0)
+    isolate_outputs(str(tmp_path))
+
+    collected = {}
+
+    def finish_daily_run(all_jobs, *args, profile=None, **kwargs):
+        collected[profile] = [job['link'] for job in all_jobs]
+
+    monkeypatch.setattr(mainV2, "finish_daily_run", finish_daily_run)
+    monkeypatch.setattr(mainV2.time, "sleep", lambda seconds: None)
+
+    with MockLinkedInServer(results_per_search=75, shared_share=1.0) as server:
+        def run(profiles, mode):
+            collected.clear()
+            mainV2.run_profiles_pipeline(profiles, concurrent=mode == "concurrent", scheduled=mode == "scheduled",
+                                         base_url=server.base_url)
+            return dict(collected)
+        yield run
+
+    # isolate_outputs and the settings above change the shared dicts in place
+    for settings, original in zip(configs, saved):
+        settings.clear()
+        settings.update(original)
+
+
+@pytest.mark.parametrize("mode", ["serial", "concurrent", "scheduled"])
+def test_each_profile_gets_what_its_own_run_would(profile_runs, mode):
+    shared = profile_runs(PROFILES, mode)
+
+    for name, profile in PROFILES.items():
+        alone = profile_runs({name: profile}, mode)
+        assert shared[name] == alone[name]
+    assert len(shared["mumbai"]) > 25
+
+
+def test_planner_overlap_is_recorded_per_profile(profile_runs):
+    config.SCRAPER_CONFIG.update(query_planning=True, query_min_runs=1, query_probe_every=0)
+    first = profile_runs(PROFILES, "concurrent")
+    second = profile_runs(PROFILES, "concurrent")
+
+    # Mumbai's jobs all come up for India too, but only the India profile searches India
+    for name, _, scraper_config, _ in mainV2.profile_configs(PROFILES, config.SEARCH_CONFIG, config.SCRAPER_CONFIG,
+                                                             mainV2.EMAIL_CONFIG):
+        planner = QueryPlanner.from_config(scraper_config)
+        location = PROFILES[name]["search"]["locations"][0]
+        assert planner.overlap("Director of Product", location) < 0.5
+    assert second == first
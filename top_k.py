@@ -0,0 +1,80 @@
+import heapq
+
+from job_dates import age_sort_hours
+
+
+def score_key(job):
+    """rank_jobs' order: total score, then newest posted"""
+    return job.get('total_score', 0), -age_sort_hours(job)
+
+
+def freshness_key(job):
+    """The email's order: newest posted (hours_since_posted) first"""
+    return -age_sort_hours(job)
+
+
+class TopK:
+    """The k items with the highest key(item) seen so far
+
+    A min-heap of at most k entries keyed on (key, -arrival), so each push
+    is O(log k) and ties go to the item offered first - the same selection
+    as sorted(items, key=key, reverse=True)[:k] with a stable sort.
+    """
+
+    def __init__(self, k, key):
+        self.k = k
+        self.key = key
+        self.heap = []   # (key, -arrival, item), worst entry on top
+        self.count = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    @property
+    def full(self):
+        return len(self.heap) >= self.k
+
+    def push(self, item):
+        """Offer an item, returns whether it is among the top k now"""
+        entry = (self.key(item), -self.count, item)
+        self.count += 1
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, entry)
+            return True
+        if self.k and entry[:2] > self.heap[0][:2]:
+            heapq.heapreplace(self.heap, entry)
+            return True
+        return False
+
+    def lowest_key(self):
+        """Key of the k-th best item (the bar to get in), None until k items were seen"""
+        return self.heap[0][0] if self.full and self.heap else None
+
+    def items(self):
+        """The top k items, best first"""
+        return [entry[2] for entry in sorted(self.heap, key=lambda entry: entry[:2], reverse=True)]
+
+
+class TopJobs:
+    """Best jobs by score and freshest jobs, kept up to date as jobs clear the filters"""
+
+    def __init__(self, k):
+        self.by_score = TopK(k, score_key)
+        self.by_freshness = TopK(k, freshness_key)
+        self.count = 0
+
+    def add(self, job):
+        self.count += 1
+        self.by_score.push(job)
+        self.by_freshness.push(job)
+
+    def lowest_score(self):
+        """total_score every one of the k best jobs reaches, None until k jobs were added"""
+        key = self.by_score.lowest_key()
+        return key[0] if key is not None else None
+
+    def best(self):
+        return self.by_score.items()
+
+    def freshest(self):
+        return self.by_freshness.items()
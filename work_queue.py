@@ -0,0 +1,325 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+
+from job_record import Job
+
+# A claimed search page: what to fetch, and which run it belongs to
+Task = namedtuple("Task", "run_id position keywords location page attempts")
+
+
+class WorkQueue:
+    """Search pages of a daily run as leased tasks in a SQLite file
+
+    A coordinator creates a run (page 0 of every search); workers claim one
+    task at a time under a lease, fetch and parse it, and store the parsed
+    job records with the task, queuing the next page when the search needs
+    it. A worker that dies mid-task loses nothing but its lease: the task
+    goes back to the pool once the lease expires, and is given up after
+    max_attempts. Workers on other hosts need the file on storage with
+    working SQLite locking.
+    """
+
+    def __init__(self, path, lease_seconds=300, max_attempts=3):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Autocommit mode, claims open their own write transaction
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id TEXT PRIMARY KEY,
+                created_at TEXT NOT NULL,
+                max_jobs INTEGER NOT NULL,
+                max_hours_old REAL
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                run_id TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                keywords TEXT NOT NULL,
+                location TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                state TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_owner TEXT,
+                lease_expires REAL,
+                jobs TEXT,
+                error TEXT,
+                PRIMARY KEY (run_id, position, page)
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_state ON tasks (state, lease_expires)")
+
+    @classmethod
+    def from_config(cls, scraper_config):
+        """Open the queue configured in SCRAPER_CONFIG"""
+        return cls(
+            scraper_config.get("queue_db", "output/work_queue.sqlite3"),
+            lease_seconds=scraper_config.get("queue_lease_seconds", 300),
+            max_attempts=scraper_config.get("queue_max_attempts", 3)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def create_run(self, queries, max_jobs, max_hours_old=None, run_id=None):
+        """
+        Queue page 0 of every (keywords, location) search, returns the run ID.
+
+        Creating a run_id that already exists resumes it: finished pages
+        keep their results and only the rest is fetched again.
+        """
+        run_id = run_id or datetime.now().strftime('%Y%m%d_%H%M%S')
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO runs (run_id, created_at, max_jobs, max_hours_old) VALUES (?, ?, ?, ?)",
+                (run_id, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), max_jobs, max_hours_old)
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO tasks (run_id, position, keywords, location, page) VALUES (?, ?, ?, ?, 0)",
+                [(run_id, position, keywords, location) for position, (keywords, location) in enumerate(queries)]
+            )
+            # Tasks given up on last time get another round
+            self.conn.execute(
+                "UPDATE tasks SET state = 'pending', attempts = 0 WHERE run_id = ? AND state = 'failed'", (run_id,)
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+        return run_id
+
+    def run_settings(self, run_id):
+        """(max_jobs, max_hours_old) the run was created with"""
+        return self.conn.execute(
+            "SELECT max_jobs, max_hours_old FROM runs WHERE run_id = ?", (run_id,)
+        ).fetchone()
+
+    def _expire_leases(self, now):
+        # Lapsed leases on a last attempt won't be claimed again, give them up
+        self.conn.execute("""
+            UPDATE tasks SET state = 'failed', error = 'lease expired', lease_owner = NULL, lease_expires = NULL
+            WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?
+        """, (now, self.max_attempts))
+
+    def claim(self, worker_id, lease_seconds=None):
+        """Lease the oldest claimable task to worker_id, returns a Task or None"""
+        now = time.time()
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._expire_leases(now)
+            row = self.conn.execute("""
+                SELECT tasks.run_id, position, keywords, location, page, attempts FROM tasks
+                JOIN runs ON runs.run_id = tasks.run_id
+                WHERE (state = 'pending' OR (state = 'leased' AND lease_expires < ?)) AND attempts < ?
+                ORDER BY runs.created_at, page, position
+                LIMIT 1
+            """, (now, self.max_attempts)).fetchone()
+
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+
+            run_id, position, keywords, location, page, attempts = row
+            self.conn.execute("""
+                UPDATE tasks SET state = 'leased', lease_owner = ?, lease_expires = ?, attempts = attempts + 1
+                WHERE run_id = ? AND position = ? AND page = ?
+            """, (worker_id, now + (lease_seconds or self.lease_seconds), run_id, position, page))
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+        return Task(run_id, position, keywords, location, page, attempts + 1)
+
+    def _task_filter(self, task, worker_id):
+        # Only the current lease holder may settle a task; an expired lease may have moved on
+        return ("WHERE run_id = ? AND position = ? AND page = ? AND state = 'leased' AND lease_owner = ?",
+                (task.run_id, task.position, task.page, worker_id))
+
+    def complete(self, task, worker_id, jobs, next_page=False):
+        """
+        Store a task's job records, queuing the search's next page if asked.
+        Returns False if the lease was lost, and the result dropped.
+        """
+        where, params = self._task_filter(task, worker_id)
+        payload = json.dumps([dict(job) for job in jobs])
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            updated = self.conn.execute(
+                f"UPDATE tasks SET state = 'done', jobs = ?, error = NULL, lease_expires = NULL {where}",
+                (payload,) + params
+            ).rowcount
+            if updated and next_page:
+                self.conn.execute("""
+                    INSERT OR IGNORE INTO tasks (run_id, position, keywords, location, page)
+                    SELECT run_id, position, keywords, location, page + 1 FROM tasks
+                    WHERE run_id = ? AND position = ? AND page = ?
+                """, (task.run_id, task.position, task.page))
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+        return bool(updated)
+
+    def fail(self, task, worker_id, error):
+        """Hand a task back for another attempt, or give up on it after max_attempts"""
+        where, params = self._task_filter(task, worker_id)
+        state = "failed" if task.attempts >= self.max_attempts else "pending"
+        self.conn.execute(
+            f"UPDATE tasks SET state = ?, error = ?, lease_owner = NULL, lease_expires = NULL {where}",
+            (state, str(error)) + params
+        )
+
+    def status(self, run_id):
+        """Task count per state ("pending", "leased", "done", "failed") for a run"""
+        self._expire_leases(time.time())
+        counts = dict.fromkeys(("pending", "leased", "done", "failed"), 0)
+        rows = self.conn.execute("SELECT state, COUNT(*) FROM tasks WHERE run_id = ? GROUP BY state", (run_id,))
+        counts.update(rows)
+        return counts
+
+    def is_finished(self, run_id):
+        """Whether every task of the run is done or given up on"""
+        status = self.status(run_id)
+        return not status["pending"] and not status["leased"]
+
+    def has_work(self):
+        """Whether any run still has unfinished tasks (workers use this to decide to exit)"""
+        row = self.conn.execute(
+            "SELECT 1 FROM tasks WHERE state = 'pending' OR (state = 'leased' AND attempts < ?) LIMIT 1",
+            (self.max_attempts,)
+        ).fetchone()
+        return row is not None
+
+    def results(self, run_id):
+        """Returns [((keywords, location), jobs), ...] in the run's query order, pages in order"""
+        results = {}
+        rows = self.conn.execute(
+            "SELECT keywords, location, state, jobs FROM tasks WHERE run_id = ? ORDER BY position, page", (run_id,)
+        )
+        for keywords, location, state, payload in rows:
+            jobs = results.setdefault((keywords, location), [])
+            if state == "done" and payload:
+                jobs.extend(Job(job) for job in json.loads(payload))
+        return list(results.items())
+
+    def failures(self, run_id):
+        """[(keywords, location, page, error)] of the tasks given up on"""
+        return self.conn.execute(
+            "SELECT keywords, location, page, error FROM tasks WHERE run_id = ? AND state = 'failed' "
+            "ORDER BY position, page", (run_id,)
+        ).fetchall()
+
+
+class QueueRateLimiter:
+    """Token bucket kept in the queue file, shared by every worker of one egress
+
+    Same bucket as RateLimiter (max_requests_per_minute, burst 1, and
+    min_delay_between_searches between first pages), but its state is a
+    row of the rate_limits table keyed by egress, read and updated under a
+    write transaction. Worker processes behind the same egress (by default
+    those on the same host) so share one budget, however many there are.
+    Times are wall-clock seconds, as they are compared across processes.
+    """
+
+    def __init__(self, path, egress, max_requests_per_minute, min_delay_between_searches=0, burst=1):
+        self.egress = egress
+        # A rate of 0/None disables the bucket (useful for local testing)
+        self.rate = (max_requests_per_minute or 0) / 60.0
+        self.capacity = max(1, burst)
+        self.min_delay_between_searches = min_delay_between_searches or 0
+        self.lock = threading.Lock()
+
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                egress TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                last_refill REAL NOT NULL,
+                last_search_started REAL
+            )
+        """)
+        self.conn.execute(
+            "INSERT OR IGNORE INTO rate_limits (egress, tokens, last_refill) VALUES (?, ?, ?)",
+            (egress, float(self.capacity), time.time())
+        )
+
+    @classmethod
+    def from_config(cls, path, safety_config, egress):
+        """Build a shared limiter from SAFETY_CONFIG"""
+        return cls(
+            path,
+            egress,
+            safety_config.get("max_requests_per_minute", 0),
+            safety_config.get("min_delay_between_searches", 0)
+        )
+
+    def close(self):
+        self.conn.close()
+
+    def _try_acquire(self, new_search):
+        # Returns the seconds to wait, or 0 once a request was granted
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            tokens, last_refill, last_search_started = self.conn.execute(
+                "SELECT tokens, last_refill, last_search_started FROM rate_limits WHERE egress = ?", (self.egress,)
+            ).fetchone()
+            now = time.time()
+            if self.rate > 0:
+                tokens = min(self.capacity, tokens + max(0.0, now - last_refill) * self.rate)
+
+            wait = 0.0
+            if self.rate > 0 and tokens < 1:
+                wait = (1 - tokens) / self.rate
+            if new_search and last_search_started is not None:
+                wait = max(wait, last_search_started + self.min_delay_between_searches - now)
+
+            if wait <= 0:
+                if self.rate > 0:
+                    tokens -= 1
+                if new_search:
+                    last_search_started = now
+            self.conn.execute(
+                "UPDATE rate_limits SET tokens = ?, last_refill = ?, last_search_started = ? WHERE egress = ?",
+                (tokens, now, last_search_started, self.egress)
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return max(wait, 0.0)
+
+    def acquire(self, new_search=False):
+        """Block until a request may be sent (see RateLimiter.acquire)"""
+        while True:
+            with self.lock:
+                wait = self._try_acquire(new_search)
+            if wait <= 0:
+                return
+            time.sleep(wait)